@@ -5,11 +5,18 @@ import sys
 import os
 import logging
 
-from routers.analyze import router as analyze_router
+from routers.analyze import analysis_jobs, router as analyze_router
 from app.core.config import settings, setup_logging
 from app.cache.redis_cache import redis_cache
+from app.utils.pdf_pool import pdf_extraction_pool
+from app.resilience.circuit_breaker import openai_breaker
+from app.core.metrics import metrics
+from app.services.http_client import http_pool_stats
+from app.services.llm_service import warm_up_llm_service, close_llm_service
+from app.utils.token_budget import load_tokenizer
 from app.middleware.rate_limit import limiter, rate_limit_exceeded_handler
 from app.middleware.timeout_middleware import TimeoutMiddleware
+from app.middleware.upload_limit import UploadSizeLimitMiddleware
 from slowapi.errors import RateLimitExceeded
 
 logger = logging.getLogger(__name__)
@@ -38,8 +45,26 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
 
-# Add timeout middleware
-app.add_middleware(TimeoutMiddleware)
+# Add timeout middleware (cancels the handler on timeout or client disconnect)
+app.add_middleware(
+    TimeoutMiddleware,
+    timeouts={
+        "/api/analyze/batch": settings.batch_request_timeout,
+        "/api/screen": settings.screening_request_timeout
+    }
+)
+
+# Reject oversized uploads before the multipart parser reads them
+# (allow 1MB on top of the PDF for the jobData field and multipart framing)
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    limits={
+        "/api/analyze": (settings.max_pdf_size_mb + 1) * 1024 * 1024,
+        "/api/analyze/batch": (settings.max_pdf_size_mb + 1) * 1024 * 1024,
+        "/api/jobs/analyze": (settings.max_pdf_size_mb + 1) * 1024 * 1024,
+        "/api/screen": (settings.screening_max_upload_mb + 1) * 1024 * 1024
+    }
+)
 
 # Add CORS middleware last in the middleware chain
 app.add_middleware(
@@ -58,13 +83,26 @@ async def startup_event():
     """Initialize services on startup."""
     logger.info("Starting up application...")
     await redis_cache.connect()
+    pdf_extraction_pool.start()
+    analysis_jobs.start()
+    # Loading (possibly downloading) the encoding blocks; do it once, here
+    await load_tokenizer()
+    try:
+        # Pay the TLS handshakes now rather than on the first user request
+        await warm_up_llm_service()
+    except Exception as e:
+        logger.warning(f"LLM connection warm-up skipped: {e}")
     logger.info("Application startup complete")
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup services on shutdown."""
     logger.info("Shutting down application...")
+    # Before the cache goes away: cancelled jobs still record their final status
+    await analysis_jobs.stop()
     await redis_cache.disconnect()
+    pdf_extraction_pool.shutdown()
+    await close_llm_service()
     logger.info("Application shutdown complete")
 
 
@@ -74,6 +112,15 @@ async def ping():
     return {"status": "ok", "message": "pong"}
 
 
+@app.get("/metrics")
+async def get_metrics():
+    """Per-worker counters (cancelled requests and LLM calls, etc.) and LLM HTTP pool gauges."""
+    return {
+        "counters": metrics.snapshot(),
+        "http_pools": http_pool_stats()
+    }
+
+
 @app.get("/health")
 async def health_check():
     """
@@ -85,8 +132,18 @@ async def health_check():
         "checks": {}
     }
 
-    # Local in-memory cache mode
-    health["checks"]["cache"] = "in_memory"
+    # Shared Redis, or local in-memory fallback
+    health["checks"]["cache"] = redis_cache.mode
+    health["cache"] = redis_cache.stats()
+    health["pdf_pool"] = pdf_extraction_pool.stats()
+    health["job_queue"] = analysis_jobs.stats()
+
+    # LLM provider circuit breaker
+    breaker = openai_breaker.stats()
+    health["checks"]["llm_circuit"] = breaker["state"]
+    health["circuit_breaker"] = breaker
+    if breaker["state"] != "closed":
+        health["status"] = "degraded"
     
     # Add version info
     health["version"] = "1.0.0"
@@ -0,0 +1,140 @@
+"""Bounded in-process cache store with LRU eviction and TTL expiry."""
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Estimate the memory footprint of a cached value in bytes.
+
+    Uses the length of the compact JSON encoding, which tracks the size of the
+    analysis payloads we cache closely enough for budgeting purposes.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Approximate size in bytes
+    """
+    try:
+        encoded = json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+        return len(encoded.encode("utf-8"))
+    except (TypeError, ValueError):
+        return len(repr(value).encode("utf-8"))
+
+
+class LocalCacheStore:
+    """
+    Size- and byte-budgeted LRU store with per-entry TTL.
+
+    Entries are kept in recency order; every read moves the entry to the end and
+    every write evicts from the front until both the entry budget and the byte
+    budget are satisfied. Expired entries are dropped lazily on read and eagerly
+    by ``sweep_expired``, which the owning cache runs periodically.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(1, max_bytes)
+        self._entries: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()
+        self._bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    @property
+    def current_bytes(self) -> int:
+        return self._bytes
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value for ``key`` or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, _, value = entry
+        if time.time() >= expires_at:
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds, evicting as needed."""
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            logger.warning(f"Skipping cache write for {key[:24]}...: {size} bytes exceeds budget")
+            self._remove(key)
+            return
+
+        self._remove(key)
+        self._entries[key] = (time.time() + max(ttl, 1), size, value)
+        self._bytes += size
+        self._evict()
+
+    def delete(self, key: str) -> None:
+        """Remove ``key`` if present."""
+        self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the byte counter."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def sweep_expired(self) -> int:
+        """
+        Remove all expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        expired = [key for key, (expires_at, _, _) in self._entries.items() if now >= expires_at]
+        for key in expired:
+            self._remove(key)
+        self.expirations += len(expired)
+        return len(expired)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters and occupancy for monitoring."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, (_, size, _) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
@@ -0,0 +1,116 @@
+"""Shared Redis backend with a pooled async client."""
+import logging
+import uuid
+from typing import Any, Optional
+
+from app.cache import serialization
+
+logger = logging.getLogger(__name__)
+
+
+class RedisBackend:
+    """
+    Thin async wrapper around a ``redis.asyncio`` client.
+
+    The client is injected so the backend can run against a real server, a
+    ``fakeredis.aioredis.FakeRedis`` instance, or anything else exposing the
+    ``get``/``set``/``delete``/``ping`` coroutine API. Values are stored using
+    the compact format from ``app.cache.serialization``.
+    """
+
+    def __init__(self, client: Any, owns_client: bool = True):
+        self._client = client
+        self._owns_client = owns_client
+
+    @classmethod
+    def from_url(
+        cls,
+        url: str,
+        max_connections: int,
+        socket_timeout: float = 2.0,
+        pool_timeout: float = 2.0
+    ) -> "RedisBackend":
+        """
+        Build a backend with a bounded, blocking connection pool.
+
+        A blocking pool makes callers wait up to ``pool_timeout`` for a free
+        connection during bursts instead of failing with "Too many connections".
+
+        Args:
+            url: Redis connection URL (redis:// or rediss://)
+            max_connections: Maximum pooled connections per worker
+            socket_timeout: Per-command socket timeout in seconds
+            pool_timeout: Seconds to wait for a free pooled connection
+
+        Returns:
+            A configured RedisBackend
+        """
+        from redis.asyncio import BlockingConnectionPool, Redis
+
+        pool = BlockingConnectionPool.from_url(
+            url,
+            max_connections=max_connections,
+            timeout=pool_timeout,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_timeout,
+            health_check_interval=30
+        )
+        return cls(Redis(connection_pool=pool))
+
+    @property
+    def client(self) -> Any:
+        return self._client
+
+    async def ping(self) -> bool:
+        """Check connectivity; raises on connection errors."""
+        return bool(await self._client.ping())
+
+    async def get(self, key: str) -> Optional[Any]:
+        payload = await self._client.get(key)
+        if payload is None:
+            return None
+        return serialization.loads(payload)
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        await self._client.set(key, serialization.dumps(value), ex=max(int(ttl), 1))
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(key)
+
+    async def acquire_lock(self, name: str, ttl_ms: int) -> Optional[str]:
+        """
+        Try to take a cross-worker lock.
+
+        Args:
+            name: Lock key
+            ttl_ms: Lock lifetime in milliseconds (released automatically after)
+
+        Returns:
+            An ownership token, or None if another holder has the lock
+        """
+        token = uuid.uuid4().hex
+        acquired = await self._client.set(name, token, nx=True, px=max(int(ttl_ms), 1))
+        return token if acquired else None
+
+    async def release_lock(self, name: str, token: str) -> None:
+        """
+        Release a lock taken with ``acquire_lock`` if we still own it.
+
+        The check-then-delete is not atomic; the worst case is deleting a lock
+        another worker took in the instant after ours expired, which only costs
+        one duplicate computation.
+        """
+        current = await self._client.get(name)
+        if current is not None and current.decode() == token:
+            await self._client.delete(name)
+
+    async def lock_exists(self, name: str) -> bool:
+        return bool(await self._client.exists(name))
+
+    async def close(self) -> None:
+        if not self._owns_client:
+            return
+        try:
+            await self._client.aclose()
+        except AttributeError:
+            await self._client.close()
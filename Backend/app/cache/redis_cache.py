@@ -1,62 +1,404 @@
-"""In-memory cache used as a local fallback when Redis is disabled."""
+"""Two-tier async cache: in-process L1 over shared Redis L2, with stale-while-revalidate."""
 import asyncio
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, Any, Awaitable, Callable
 import hashlib
 import logging
 import time
 from app.core.config import settings
+from app.cache.local_store import LocalCacheStore
+from app.cache.redis_backend import RedisBackend
+from app.cache.singleflight import SingleFlight
+from app.resilience.deadline import clear_deadline, current_deadline
 
 logger = logging.getLogger(__name__)
 
 
 class RedisCache:
-    """Async cache wrapper backed by local process memory."""
-    
-    def __init__(self):
+    """
+    Two-tier async cache: a small in-process L1 in front of a shared L2.
+
+    Reads check the bounded LRU/TTL store in process memory first, then the
+    shared Redis backend, promoting L2 hits into L1. Writes go to both tiers.
+    If Redis is disabled or a call fails, the L1 store serves alone and Redis
+    is retried after ``settings.redis_retry_interval_seconds``.
+    """
+
+    def __init__(self, backend: Optional[RedisBackend] = None):
         self.redis_client = None
-        self._store: Dict[str, Tuple[float, dict]] = {}
-    
-    async def connect(self):
-        """Initialize local cache store."""
-        await asyncio.sleep(0)
-        self._store = {}
+        self._store = self._create_store()
+        self._backend = backend
+        self._backend_down_until = 0.0
+        self._sweep_task: Optional[asyncio.Task] = None
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._flights = SingleFlight()
+
+        self.l2_hits = 0
+        self.stale_hits = 0
+        self.background_refreshes = 0
+        self.peer_waits = 0
+
+    @staticmethod
+    def _create_store() -> LocalCacheStore:
+        return LocalCacheStore(
+            max_entries=settings.cache_size,
+            max_bytes=settings.cache_max_bytes_mb * 1024 * 1024
+        )
+
+    async def connect(self, backend: Optional[RedisBackend] = None):
+        """
+        Initialize the local store, the shared backend and the expiry sweeper.
+
+        Args:
+            backend: Optional pre-built backend (e.g. one wrapping fakeredis);
+                otherwise one is built from ``settings.redis_url`` unless
+                ``settings.cache_backend`` is ``memory``.
+        """
+        self._store = self._create_store()
         self.redis_client = self._store
-        logger.info("Using in-memory local cache (Redis disabled)")
-    
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(self._sweep_loop())
+
+        if backend is not None:
+            self._backend = backend
+        elif self._backend is None and settings.cache_backend != "memory":
+            self._backend = RedisBackend.from_url(
+                settings.redis_url,
+                max_connections=settings.redis_max_connections,
+                socket_timeout=settings.redis_socket_timeout
+            )
+
+        if self._backend is None:
+            logger.info(
+                f"Using in-memory local cache (Redis disabled, "
+                f"max {settings.cache_size} entries / {settings.cache_max_bytes_mb}MB)"
+            )
+            return
+
+        try:
+            await self._backend.ping()
+            self._backend_down_until = 0.0
+            self.redis_client = self._backend.client
+            logger.info("Connected to shared Redis cache")
+        except Exception as e:
+            self._mark_backend_down(e)
+
     async def disconnect(self):
-        """Clear local cache on shutdown."""
-        await asyncio.sleep(0)
+        """Stop background tasks, close the shared backend and clear local cache."""
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        self._refreshing.clear()
+        if self._sweep_task is not None:
+            self._sweep_task.cancel()
+            try:
+                await self._sweep_task
+            except asyncio.CancelledError:
+                pass
+            self._sweep_task = None
+        if self._backend is not None:
+            try:
+                await self._backend.close()
+            except Exception as e:
+                logger.warning(f"Error closing Redis backend: {e}")
+            self._backend = None
         self._store.clear()
         self.redis_client = None
-        logger.info("Local cache cleared")
+        logger.info("Cache disconnected")
 
-    def _is_expired(self, expires_at: float) -> bool:
-        return time.time() >= expires_at
-    
-    async def get(self, key: str) -> Optional[dict]:
-        """Get cached value by key."""
-        await asyncio.sleep(0)
-        if key not in self._store:
+    async def _sweep_loop(self):
+        """Periodically drop expired entries so idle keys don't pin memory."""
+        interval = max(settings.cache_sweep_interval_seconds, 1)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                removed = self._store.sweep_expired()
+                if removed:
+                    logger.debug(f"Cache sweep removed {removed} expired entries")
+            except Exception as e:
+                logger.error(f"Cache sweep failed: {e}")
+
+    def _backend_available(self) -> bool:
+        return self._backend is not None and time.monotonic() >= self._backend_down_until
+
+    def _mark_backend_down(self, error: Exception):
+        self._backend_down_until = time.monotonic() + settings.redis_retry_interval_seconds
+        self.redis_client = self._store
+        logger.warning(
+            f"Redis unavailable ({error}); using local cache for the next "
+            f"{settings.redis_retry_interval_seconds}s"
+        )
+
+    def _mark_backend_up(self):
+        if self.redis_client is not self._backend.client:
+            logger.info("Redis connection restored")
+        self.redis_client = self._backend.client
+
+    async def _lookup(self, key: str, bypass_l1: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Find the cache envelope for ``key``: L1 first, then L2 with promotion.
+
+        Envelopes are ``{"v": value, "f": fresh_until, "e": expires_at}``; an
+        entry is stale (but still servable) between ``f`` and ``e``.
+
+        With ``bypass_l1`` only the shared tier is read and nothing is promoted.
+        """
+        if not bypass_l1:
+            envelope = self._store.get(key)
+            if envelope is not None:
+                return envelope
+
+        if not self._backend_available():
+            return None
+        try:
+            envelope = await self._backend.get(key)
+            self._mark_backend_up()
+        except Exception as e:
+            self._mark_backend_down(e)
             return None
 
-        expires_at, data = self._store[key]
-        if self._is_expired(expires_at):
-            self._store.pop(key, None)
+        if envelope is None:
             return None
+        self.l2_hits += 1
+        if not bypass_l1:
+            self._store.set(key, envelope, self._l1_ttl(envelope["e"]))
+        return envelope
+
+    def _l1_ttl(self, expires_at: float) -> int:
+        """
+        L1 copies of shared entries live briefly so refreshes by other workers
+        show up soon; without a shared tier, L1 keeps entries until they expire.
+        """
+        remaining = expires_at - time.time()
+        if self._backend_available():
+            remaining = min(settings.cache_l1_ttl_seconds, remaining)
+        return max(1, int(remaining))
+
+    async def get(self, key: str, bypass_l1: bool = False) -> Optional[dict]:
+        """
+        Get a fresh cached value by key (stale entries are treated as misses).
 
-        return data
-    
-    async def set(self, key: str, value: dict, ttl: int = 3600):
-        """Set cached value with TTL."""
+        Pass ``bypass_l1`` to read only the shared tier, for values another
+        worker keeps updating (e.g. job status) that a local copy would
+        otherwise hide for up to ``settings.cache_l1_ttl_seconds``. Without a
+        shared tier that is always a miss.
+        """
         await asyncio.sleep(0)
-        expires_at = time.time() + max(ttl, 1)
-        self._store[key] = (expires_at, value)
-    
+        envelope = await self._lookup(key, bypass_l1)
+        if envelope is None or time.time() >= envelope["f"]:
+            return None
+        return envelope["v"]
+
+    async def set(self, key: str, value: dict, ttl: Optional[int] = None, bypass_l1: bool = False):
+        """
+        Set cached value with TTL (defaults to ``settings.cache_ttl_seconds``).
+
+        The value stays servable as stale for ``settings.cache_stale_ttl_seconds``
+        after the TTL so ``get_or_compute`` can revalidate it in the background.
+        ``bypass_l1`` writes only the shared tier (a no-op without one), for
+        values the caller keeps itself and reads back with ``get(bypass_l1=True)``.
+        """
+        ttl = max(ttl if ttl is not None else settings.cache_ttl_seconds, 1)
+        now = time.time()
+        hard_ttl = ttl + settings.cache_stale_ttl_seconds
+        envelope = {"v": value, "f": now + ttl, "e": now + hard_ttl}
+
+        if not bypass_l1:
+            self._store.set(key, envelope, self._l1_ttl(envelope["e"]))
+        if self._backend_available():
+            try:
+                await self._backend.set(key, envelope, hard_ttl)
+                self._mark_backend_up()
+            except Exception as e:
+                self._mark_backend_down(e)
+
     async def delete(self, key: str):
-        """Delete cached value by key."""
+        """Delete cached value by key from both tiers."""
         await asyncio.sleep(0)
-        self._store.pop(key, None)
-    
+        self._store.delete(key)
+        if self._backend_available():
+            try:
+                await self._backend.delete(key)
+                self._mark_backend_up()
+            except Exception as e:
+                self._mark_backend_down(e)
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: Optional[int] = None,
+        cache_if: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        Return the cached value for ``key``, computing and storing it on a miss.
+
+        Stale-while-revalidate: an entry past its TTL but inside the stale
+        window is returned immediately while ``compute`` refreshes it in a
+        background task. Results of ``None``, and results rejected by
+        ``cache_if``, are returned but never cached.
+
+        Misses are coalesced: concurrent callers in this worker share one
+        in-flight ``compute``, and a lock in the shared backend makes other
+        workers wait for that result instead of computing it again.
+
+        Args:
+            key: Cache key (see ``generate_key``)
+            compute: Zero-argument coroutine factory producing the value
+            ttl: Freshness TTL in seconds
+            cache_if: Optional predicate deciding whether a computed value is stored
+
+        Returns:
+            The cached or freshly computed value
+        """
+        envelope = await self._lookup(key)
+        if envelope is not None:
+            if time.time() < envelope["f"]:
+                logger.info(f"Cache HIT - {key[:24]}...")
+                return envelope["v"]
+            self.stale_hits += 1
+            logger.info(f"Cache STALE - serving {key[:24]}... and refreshing in background")
+            self._schedule_refresh(key, compute, ttl, cache_if)
+            return envelope["v"]
+
+        logger.info(f"Cache MISS - {key[:24]}...")
+        return await self._flights.do(key, lambda: self._compute_once(key, compute, ttl, cache_if))
+
+    async def _compute_once(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: Optional[int],
+        cache_if: Optional[Callable[[Any], bool]]
+    ) -> Any:
+        """Compute under the cross-worker lock, or adopt a peer worker's result."""
+        token = await self.acquire_lock(key)
+        if token is None:
+            self.peer_waits += 1
+            value = await self._wait_for_peer(key)
+            if value is not None:
+                return value
+            token = await self.acquire_lock(key)
+
+        try:
+            value = await compute()
+            if value is not None and (cache_if is None or cache_if(value)):
+                await self.set(key, value, ttl)
+            return value
+        finally:
+            if token is not None:
+                await self.release_lock(key, token)
+
+    async def _wait_for_peer(self, key: str) -> Optional[Any]:
+        """
+        Poll for a value another worker is computing under the lock for ``key``.
+
+        Returns:
+            The peer's value, or None if the lock went away (or timed out)
+            without a value being stored
+        """
+        lock_name = f"lock:{key}"
+        wait_seconds = settings.cache_lock_ttl_seconds
+        request_deadline = current_deadline()
+        if request_deadline is not None:
+            wait_seconds = min(wait_seconds, request_deadline.remaining())
+        deadline = time.monotonic() + wait_seconds
+        while time.monotonic() < deadline:
+            await asyncio.sleep(settings.cache_lock_poll_interval_seconds)
+            value = await self.get(key)
+            if value is not None:
+                logger.info(f"Adopted result computed by another worker for {key[:24]}...")
+                return value
+            if not self._backend_available():
+                return None
+            try:
+                if not await self._backend.lock_exists(lock_name):
+                    return await self.get(key)
+            except Exception as e:
+                self._mark_backend_down(e)
+                return None
+        return None
+
+    async def acquire_lock(self, key: str) -> Optional[str]:
+        """
+        Take the shared compute lock for ``key``.
+
+        Returns:
+            A token, ``""`` when no shared backend is available (nothing to
+            coordinate with), or None if another worker holds the lock
+        """
+        if not self._backend_available():
+            return ""
+        try:
+            return await self._backend.acquire_lock(
+                f"lock:{key}", settings.cache_lock_ttl_seconds * 1000
+            )
+        except Exception as e:
+            self._mark_backend_down(e)
+            return ""
+
+    async def release_lock(self, key: str, token: str):
+        """Release a lock taken with ``acquire_lock``."""
+        if not token or not self._backend_available():
+            return
+        try:
+            await self._backend.release_lock(f"lock:{key}", token)
+        except Exception as e:
+            self._mark_backend_down(e)
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: Optional[int],
+        cache_if: Optional[Callable[[Any], bool]]
+    ):
+        if key in self._refreshing:
+            return
+        self._refreshing[key] = asyncio.create_task(self._refresh(key, compute, ttl, cache_if))
+
+    async def _refresh(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: Optional[int],
+        cache_if: Optional[Callable[[Any], bool]]
+    ):
+        # The refresh outlives the request that triggered it; don't inherit its deadline
+        clear_deadline()
+        token = await self.acquire_lock(key)
+        if token is None:
+            # Another worker is already refreshing this entry
+            self._refreshing.pop(key, None)
+            return
+        try:
+            value = await compute()
+            if value is not None and (cache_if is None or cache_if(value)):
+                await self.set(key, value, ttl)
+                self.background_refreshes += 1
+        except Exception as e:
+            logger.warning(f"Background refresh failed for {key[:24]}...: {e}")
+        finally:
+            await self.release_lock(key, token)
+            self._refreshing.pop(key, None)
+
+    @property
+    def mode(self) -> str:
+        """Name of the store currently serving requests."""
+        return "redis" if self._backend_available() else "in_memory"
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache counters for health reporting."""
+        return {
+            "backend": self.mode,
+            "redis_configured": self._backend is not None,
+            "l1": self._store.stats(),
+            "l2_hits": self.l2_hits,
+            "stale_hits": self.stale_hits,
+            "background_refreshes": self.background_refreshes,
+            "coalesced_requests": self._flights.coalesced,
+            "in_flight": len(self._flights),
+            "peer_waits": self.peer_waits
+        }
+
     def generate_key(self, prefix: str, *args) -> str:
         """Generate consistent cache key from arguments."""
         combined = "|".join(str(arg) for arg in args)
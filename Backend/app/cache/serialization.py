@@ -0,0 +1,52 @@
+"""Compact wire format for values stored in the shared cache."""
+import json
+import zlib
+from typing import Any
+
+# One-byte tags so readers know how the payload was encoded
+_RAW_JSON = b"j"
+_ZLIB_JSON = b"z"
+
+# Payloads below this size are not worth the CPU cost of compressing
+COMPRESSION_THRESHOLD_BYTES = 1024
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serialize a cache value to bytes.
+
+    Values are encoded as compact JSON (no whitespace, UTF-8) and zlib-compressed
+    when large enough for it to pay off. Analysis payloads are highly repetitive
+    JSON, so they typically shrink 4-6x.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        Tagged byte payload
+    """
+    encoded = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    if len(encoded) >= COMPRESSION_THRESHOLD_BYTES:
+        return _ZLIB_JSON + zlib.compress(encoded, 6)
+    return _RAW_JSON + encoded
+
+
+def loads(payload: bytes) -> Any:
+    """
+    Deserialize a payload produced by ``dumps``.
+
+    Args:
+        payload: Tagged byte payload
+
+    Returns:
+        Decoded value
+
+    Raises:
+        ValueError: If the payload tag is unknown
+    """
+    tag, body = payload[:1], payload[1:]
+    if tag == _ZLIB_JSON:
+        return json.loads(zlib.decompress(body).decode("utf-8"))
+    if tag == _RAW_JSON:
+        return json.loads(body.decode("utf-8"))
+    raise ValueError(f"Unknown cache payload tag: {tag!r}")
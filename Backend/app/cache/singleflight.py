@@ -0,0 +1,69 @@
+"""Request coalescing: concurrent callers with the same key share one computation."""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class _Flight:
+    """A single in-flight computation and the number of callers awaiting it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key within one worker.
+
+    The first caller for a key starts the computation as its own task; later
+    callers await the same task. Each caller awaits through ``asyncio.shield``
+    so one cancelled caller (e.g. a closed browser tab) does not cancel the work
+    for the others. The computation is only cancelled once every caller has
+    gone away.
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``fn`` for ``key`` unless an identical call is already in flight.
+
+        Args:
+            key: Coalescing key (normally the cache key)
+            fn: Zero-argument coroutine factory
+
+        Returns:
+            The shared result of ``fn``; exceptions propagate to every caller
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(fn()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _task: self._forget(key, flight))
+            self.started += 1
+        else:
+            self.coalesced += 1
+            logger.info(f"Coalescing request onto in-flight computation for {key[:24]}...")
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+
+    def _forget(self, key: str, flight: _Flight):
+        if self._flights.get(key) is flight:
+            del self._flights[key]
@@ -33,9 +33,24 @@ class Settings(BaseSettings):
     max_pdf_pages: int = Field(default=100, env="MAX_PDF_PAGES")
     max_text_length: int = Field(default=100000, env="MAX_TEXT_LENGTH")
     
+    # PDF Extraction Pool Settings
+    pdf_pool_workers: int = Field(default=2, env="PDF_POOL_WORKERS")
+    pdf_extraction_timeout_seconds: float = Field(default=20.0, env="PDF_EXTRACTION_TIMEOUT_SECONDS")
+    pdf_worker_max_memory_mb: int = Field(default=512, env="PDF_WORKER_MAX_MEMORY_MB")
+    pdf_max_queue_depth: int = Field(default=16, env="PDF_MAX_QUEUE_DEPTH")  # Running + waiting jobs
+    pdf_pages_per_chunk: int = Field(default=8, env="PDF_PAGES_PER_CHUNK")  # Pages per parallel extraction task
+    pdf_text_cache_ttl_seconds: int = Field(default=86400, env="PDF_TEXT_CACHE_TTL_SECONDS")  # Keyed by file SHA-256
+    
     # Caching Settings
     cache_size: int = Field(default=100, env="CACHE_SIZE")
     cache_ttl_seconds: int = Field(default=3600, env="CACHE_TTL_SECONDS")  # 1 hour default
+    job_profile_cache_ttl_seconds: int = Field(default=86400, env="JOB_PROFILE_CACHE_TTL_SECONDS")  # Keyed by URL + content hash
+    cache_max_bytes_mb: int = Field(default=64, env="CACHE_MAX_BYTES_MB")  # Per-worker memory budget
+    cache_sweep_interval_seconds: int = Field(default=60, env="CACHE_SWEEP_INTERVAL_SECONDS")
+    cache_l1_ttl_seconds: int = Field(default=300, env="CACHE_L1_TTL_SECONDS")  # In-process copy of Redis entries
+    cache_stale_ttl_seconds: int = Field(default=900, env="CACHE_STALE_TTL_SECONDS")  # Serve-stale window past TTL
+    cache_lock_ttl_seconds: int = Field(default=120, env="CACHE_LOCK_TTL_SECONDS")  # Cross-worker compute lock
+    cache_lock_poll_interval_seconds: float = Field(default=0.5, env="CACHE_LOCK_POLL_INTERVAL_SECONDS")
     
     # LLM Settings
     llm_provider: str = Field(default="openai", env="LLM_PROVIDER")  # openai, gemini, groq
@@ -44,9 +59,43 @@ class Settings(BaseSettings):
     llm_max_tokens: int = Field(default=8000, env="LLM_MAX_TOKENS")
     llm_timeout: float = Field(default=30.0, env="LLM_TIMEOUT")
     
+    # LLM HTTP Connection Pool Settings
+    llm_expected_concurrent_analyses: int = Field(default=4, env="LLM_EXPECTED_CONCURRENT_ANALYSES")  # Sizes the pool
+    llm_http_max_connections: int = Field(default=0, env="LLM_HTTP_MAX_CONNECTIONS")  # 0 = 8 x expected analyses
+    llm_http_max_keepalive: int = Field(default=20, env="LLM_HTTP_MAX_KEEPALIVE")
+    llm_http_keepalive_expiry: float = Field(default=60.0, env="LLM_HTTP_KEEPALIVE_EXPIRY")
+    llm_http_pool_timeout: float = Field(default=10.0, env="LLM_HTTP_POOL_TIMEOUT")  # Wait for a free connection
+    llm_http2: bool = Field(default=True, env="LLM_HTTP2")  # Used only if the h2 package is installed
+    llm_http_warmup_connections: int = Field(default=4, env="LLM_HTTP_WARMUP_CONNECTIONS")  # Opened at startup
+    llm_http_warmup_timeout_seconds: float = Field(default=5.0, env="LLM_HTTP_WARMUP_TIMEOUT_SECONDS")
+    
+    # Prompt Budget Settings (resume + job description tokens interpolated into one prompt)
+    prompt_input_token_budget: int = Field(default=6000, env="PROMPT_INPUT_TOKEN_BUDGET")
+    prompt_job_description_share: float = Field(default=0.4, env="PROMPT_JOB_DESCRIPTION_SHARE")  # Guaranteed JD share when trimming
+    tiktoken_cache_dir: str = Field(default="", env="TIKTOKEN_CACHE_DIR")  # Pre-fetched encodings (no download at startup)
+    
+    # V4 Analysis Settings
+    v4_analysis_mode: str = Field(default="fanout", env="V4_ANALYSIS_MODE")  # fanout, fused
+    v4_fused_groups: str = Field(default="", env="V4_FUSED_GROUPS")  # "a,b;c,d" - empty = all in one call
+    keyword_match_mode: str = Field(default="llm", env="KEYWORD_MATCH_MODE")  # llm, local, hybrid
+    quality_scoring_mode: str = Field(default="llm", env="QUALITY_SCORING_MODE")  # llm, rules, hybrid
+    component_record_path: str = Field(default="", env="COMPONENT_RECORD_PATH")  # JSONL of LLM component outputs
+    resume_parser_mode: str = Field(default="llm", env="RESUME_PARSER_MODE")  # llm, local, auto
+    resume_parser_min_confidence: float = Field(default=0.7, env="RESUME_PARSER_MIN_CONFIDENCE")  # auto: below this, use the LLM
+    
+    # Circuit Breaker Settings (LLM provider)
+    circuit_breaker_failure_rate: float = Field(default=0.5, env="CIRCUIT_BREAKER_FAILURE_RATE")  # Open at this failure ratio
+    circuit_breaker_minimum_calls: int = Field(default=5, env="CIRCUIT_BREAKER_MINIMUM_CALLS")  # Calls in window before judging
+    circuit_breaker_window_seconds: int = Field(default=60, env="CIRCUIT_BREAKER_WINDOW_SECONDS")
+    circuit_breaker_reset_timeout: int = Field(default=60, env="CIRCUIT_BREAKER_RESET_TIMEOUT")  # Open -> half-open
+    circuit_breaker_half_open_max_calls: int = Field(default=1, env="CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS")  # Concurrent probes
+    
     # Redis Settings
     redis_url: str = Field(default="redis://localhost:6379/0", env="REDIS_URL")
     redis_max_connections: int = Field(default=50, env="REDIS_MAX_CONNECTIONS")
+    redis_socket_timeout: float = Field(default=2.0, env="REDIS_SOCKET_TIMEOUT")
+    redis_retry_interval_seconds: int = Field(default=30, env="REDIS_RETRY_INTERVAL_SECONDS")
+    cache_backend: str = Field(default="redis", env="CACHE_BACKEND")  # redis, memory
     
     # Upstash REST Settings (Preferred for serverless)
     upstash_redis_rest_url: str = Field(default="", env="UPSTASH_REDIS_REST_URL")
@@ -54,6 +103,29 @@ class Settings(BaseSettings):
     
     # Request Timeout Settings
     request_timeout: int = Field(default=120, env="REQUEST_TIMEOUT")  # 120 seconds for LLM processing
+    deadline_safety_margin_seconds: float = Field(default=10.0, env="DEADLINE_SAFETY_MARGIN_SECONDS")  # Reserved to build the response
+    llm_min_attempt_seconds: float = Field(default=5.0, env="LLM_MIN_ATTEMPT_SECONDS")  # Don't retry with less budget left
+    
+    # Batch Analysis Settings (one resume against many jobs)
+    batch_max_jobs: int = Field(default=50, env="BATCH_MAX_JOBS")
+    batch_job_concurrency: int = Field(default=8, env="BATCH_JOB_CONCURRENCY")  # Per-job analyses running at once, process-wide
+    batch_request_timeout: int = Field(default=600, env="BATCH_REQUEST_TIMEOUT")
+    batch_rate_limit_per_hour: int = Field(default=10, env="BATCH_RATE_LIMIT_PER_HOUR")
+    
+    # Bulk Screening Settings (many resumes against one job)
+    screening_max_resumes: int = Field(default=200, env="SCREENING_MAX_RESUMES")
+    screening_max_upload_mb: int = Field(default=200, env="SCREENING_MAX_UPLOAD_MB")  # Whole request, ZIP contents included
+    screening_resume_concurrency: int = Field(default=16, env="SCREENING_RESUME_CONCURRENCY")  # Resumes in flight per request
+    screening_llm_concurrency: int = Field(default=16, env="SCREENING_LLM_CONCURRENCY")  # LLM calls in flight, all screenings
+    screening_llm_calls_per_minute: int = Field(default=600, env="SCREENING_LLM_CALLS_PER_MINUTE")  # All screenings; 0 = no limit
+    screening_request_timeout: int = Field(default=1800, env="SCREENING_REQUEST_TIMEOUT")
+    screening_rate_limit_per_hour: int = Field(default=5, env="SCREENING_RATE_LIMIT_PER_HOUR")
+    
+    # Analysis Job Queue Settings (submit, poll, fetch)
+    job_queue_workers: int = Field(default=4, env="JOB_QUEUE_WORKERS")  # Analyses running at once per process
+    job_queue_max_depth: int = Field(default=100, env="JOB_QUEUE_MAX_DEPTH")  # Waiting jobs; more get 429
+    job_timeout_seconds: int = Field(default=300, env="JOB_TIMEOUT_SECONDS")
+    job_result_ttl_seconds: int = Field(default=3600, env="JOB_RESULT_TTL_SECONDS")  # Status and result of finished jobs
     
     # Authentication Settings
     require_auth: bool = Field(default=False, env="REQUIRE_AUTH")
@@ -91,6 +163,46 @@ class Settings(BaseSettings):
         if v.lower() not in valid_providers:
             raise ValueError(f"Invalid LLM_PROVIDER. Must be one of: {', '.join(valid_providers)}")
         return v.lower()
+
+    @validator("v4_analysis_mode")
+    def validate_v4_analysis_mode(cls, v):
+        """Validate V4 analysis mode selection."""
+        valid_modes = ["fanout", "fused"]
+        if v.lower() not in valid_modes:
+            raise ValueError(f"Invalid V4_ANALYSIS_MODE. Must be one of: {', '.join(valid_modes)}")
+        return v.lower()
+
+    @validator("keyword_match_mode")
+    def validate_keyword_match_mode(cls, v):
+        """Validate keyword match mode selection."""
+        valid_modes = ["llm", "local", "hybrid"]
+        if v.lower() not in valid_modes:
+            raise ValueError(f"Invalid KEYWORD_MATCH_MODE. Must be one of: {', '.join(valid_modes)}")
+        return v.lower()
+
+    @validator("quality_scoring_mode")
+    def validate_quality_scoring_mode(cls, v):
+        """Validate resume quality scoring mode selection."""
+        valid_modes = ["llm", "rules", "hybrid"]
+        if v.lower() not in valid_modes:
+            raise ValueError(f"Invalid QUALITY_SCORING_MODE. Must be one of: {', '.join(valid_modes)}")
+        return v.lower()
+
+    @validator("resume_parser_mode")
+    def validate_resume_parser_mode(cls, v):
+        """Validate resume section parser mode selection."""
+        valid_modes = ["llm", "local", "auto"]
+        if v.lower() not in valid_modes:
+            raise ValueError(f"Invalid RESUME_PARSER_MODE. Must be one of: {', '.join(valid_modes)}")
+        return v.lower()
+
+    @validator("cache_backend")
+    def validate_cache_backend(cls, v):
+        """Validate cache backend selection."""
+        valid_backends = ["redis", "memory"]
+        if v.lower() not in valid_backends:
+            raise ValueError(f"Invalid CACHE_BACKEND. Must be one of: {', '.join(valid_backends)}")
+        return v.lower()
     
     class Config:
         env_file = ".env"
@@ -16,6 +16,30 @@ class PDFValidationError(ResumeAnalysisError):
     pass
 
 
+class UploadTooLargeError(ResumeAnalysisError):
+    """Raised when an uploaded file exceeds the configured size limit."""
+    pass
+
+
+class PDFProcessingBusyError(ResumeAnalysisError):
+    """Raised when the PDF extraction queue is full."""
+    pass
+
+
+class JobQueueFullError(ResumeAnalysisError):
+    """Raised when the analysis job queue is at its maximum depth."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        # Seconds until a slot is likely to free up
+        self.retry_after = retry_after
+
+
+class DeadlineExceededError(ResumeAnalysisError):
+    """Raised when the request's time budget runs out before work can finish."""
+    pass
+
+
 class OpenAIError(ResumeAnalysisError):
     """Raised when OpenAI API calls fail."""
     pass
@@ -0,0 +1,35 @@
+"""In-process counters exposed at /metrics."""
+from collections import defaultdict
+import threading
+from typing import Dict
+
+
+class Metrics:
+    """
+    Thread-safe registry of named monotonic counters.
+
+    Counters are per worker process and reset on restart; they are meant for
+    quick operational visibility, not as a replacement for a metrics backend.
+    """
+
+    def __init__(self):
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1):
+        """Add ``value`` to counter ``name``."""
+        with self._lock:
+            self._counters[name] += value
+
+    def get(self, name: str) -> float:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Return a copy of all counters, sorted by name."""
+        with self._lock:
+            return dict(sorted(self._counters.items()))
+
+
+# Global registry shared by the whole worker
+metrics = Metrics()
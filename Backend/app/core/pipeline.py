@@ -0,0 +1,194 @@
+"""
+Dependency-graph scheduler for the analysis pipeline.
+
+A request used to run its steps strictly in sequence (PDF parse, extraction,
+analysis, context), so work that only needs the job description waited for
+the slowest resume step. ``StageGraph`` starts every stage as soon as the
+stages it depends on have finished and records when each one started and
+ended, so the critical path of a request can be read off its timings.
+"""
+import asyncio
+from contextvars import ContextVar
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StageTiming:
+    """When a stage ran, in milliseconds from the start of its graph."""
+    name: str
+    start_ms: float
+    end_ms: float
+    # Dependency that finished last, i.e. the one this stage actually waited for
+    blocked_by: Optional[str] = None
+    failed: bool = False
+
+    @property
+    def duration_ms(self) -> float:
+        return self.end_ms - self.start_ms
+
+
+# Timings of every graph run while handling the current request
+_request_timings: ContextVar[Optional[List[StageTiming]]] = ContextVar("request_stage_timings", default=None)
+
+
+def start_stage_timings() -> List[StageTiming]:
+    """
+    Collect the stage timings of every graph run for the current request.
+
+    Call before any graph runs; child tasks share the returned list.
+    """
+    timings: List[StageTiming] = []
+    _request_timings.set(timings)
+    return timings
+
+
+def current_stage_timings() -> List[StageTiming]:
+    """Stage timings recorded so far for the current request."""
+    return list(_request_timings.get() or [])
+
+
+def server_timing_header(timings: Sequence[StageTiming]) -> str:
+    """Render timings as a ``Server-Timing`` header value (visible in browser dev tools)."""
+    return ", ".join(f"{timing.name};dur={timing.duration_ms:.1f}" for timing in timings)
+
+
+class StageGraph:
+    """
+    Async stages with dependencies, each started as soon as its inputs are ready.
+
+    A stage is an async callable that receives the results of the stages it
+    depends on as keyword arguments named after them::
+
+        graph = StageGraph("analyze")
+        graph.add("pdf_text", read_pdf)
+        graph.add("job_profile", build_profile)
+        graph.add("analysis", analyze, after=("pdf_text", "job_profile"))
+        results = await graph.run()
+    """
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: Prefix for timing names, log lines and metrics
+        """
+        self.name = name
+        self._stages: Dict[str, Callable[..., Awaitable[Any]]] = {}
+        self._deps: Dict[str, Sequence[str]] = {}
+        self.timings: Dict[str, StageTiming] = {}
+
+    def add(self, name: str, fn: Callable[..., Awaitable[Any]], after: Sequence[str] = ()) -> "StageGraph":
+        """
+        Register a stage.
+
+        Args:
+            name: Stage name (also the keyword its result is passed under)
+            fn: Async callable taking the results of ``after`` as keyword arguments
+            after: Names of stages that must finish first; they must already be added
+
+        Raises:
+            ValueError: If the name is taken or a dependency is unknown
+        """
+        if name in self._stages:
+            raise ValueError(f"Stage '{name}' is already defined")
+        unknown = [dep for dep in after if dep not in self._stages]
+        if unknown:
+            raise ValueError(f"Stage '{name}' depends on undefined stages: {', '.join(unknown)}")
+        self._stages[name] = fn
+        self._deps[name] = tuple(after)
+        return self
+
+    async def run(self, return_exceptions: bool = False) -> Dict[str, Any]:
+        """
+        Run every stage, each starting when its dependencies have finished.
+
+        Args:
+            return_exceptions: Like ``asyncio.gather``: store a failed stage's
+                exception as its result and still run its dependents.
+                Otherwise the first failure cancels the remaining stages and
+                is raised.
+
+        Returns:
+            Dict of stage name -> result
+        """
+        started = time.perf_counter()
+        tasks: Dict[str, asyncio.Task] = {}
+        ended_at: Dict[str, float] = {}
+
+        def elapsed_ms() -> float:
+            return (time.perf_counter() - started) * 1000
+
+        async def run_stage(name: str) -> Any:
+            deps = self._deps[name]
+            inputs = {}
+            for dep in deps:
+                inputs[dep] = await tasks[dep]
+            blocked_by = max(deps, key=lambda dep: ended_at[dep]) if deps else None
+            start_ms = elapsed_ms()
+            try:
+                result = await self._stages[name](**inputs)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                ended_at[name] = elapsed_ms()
+                self.timings[name] = StageTiming(name, start_ms, ended_at[name], blocked_by, failed=True)
+                if return_exceptions:
+                    return e
+                raise
+            ended_at[name] = elapsed_ms()
+            self.timings[name] = StageTiming(name, start_ms, ended_at[name], blocked_by)
+            return result
+
+        # Stages are registered after their dependencies, so tasks always exist when awaited
+        for name in self._stages:
+            tasks[name] = asyncio.create_task(run_stage(name))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        finally:
+            self._report(elapsed_ms())
+
+        return {name: task.result() for name, task in tasks.items()}
+
+    def critical_path(self) -> List[str]:
+        """Stages on the chain that ended last, following each stage's latest dependency."""
+        if not self.timings:
+            return []
+        path = []
+        name: Optional[str] = max(self.timings.values(), key=lambda timing: timing.end_ms).name
+        while name is not None:
+            path.append(name)
+            name = self.timings[name].blocked_by
+        return list(reversed(path))
+
+    def _report(self, total_ms: float):
+        """Log the run, add it to the request's timings and to the per-stage metrics."""
+        ordered = sorted(self.timings.values(), key=lambda timing: timing.start_ms)
+        for timing in ordered:
+            metrics.increment(f"stage_ms_{self.name}.{timing.name}", timing.duration_ms)
+            metrics.increment(f"stage_runs_{self.name}.{timing.name}")
+
+        collected = _request_timings.get()
+        if collected is not None:
+            collected.extend(
+                StageTiming(f"{self.name}.{t.name}", t.start_ms, t.end_ms, t.blocked_by, t.failed) for t in ordered
+            )
+
+        stages = ", ".join(
+            f"{t.name} {t.start_ms:.0f}-{t.end_ms:.0f}ms{' (failed)' if t.failed else ''}" for t in ordered
+        )
+        logger.info(
+            f"{self.name} stages in {total_ms:.0f} ms: {stages}; "
+            f"critical path: {' -> '.join(self.critical_path())}"
+        )
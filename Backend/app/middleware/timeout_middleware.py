@@ -1,46 +1,143 @@
 """Timeout middleware to prevent hanging requests."""
 import asyncio
 import logging
-from fastapi import Request
+from typing import Dict, Optional
+
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
 from app.core.config import settings
+from app.core.metrics import metrics
 
 logger = logging.getLogger(__name__)
 
+# Request body bytes read ahead of the handler before the relay waits for it
+MAX_BUFFERED_BODY_BYTES = 1024 * 1024
+
+
+class TimeoutMiddleware:
+    """
+    Pure-ASGI middleware that enforces the request timeout and stops work for
+    clients that have gone away.
+
+    The handler runs as its own task. When the timeout passes or the client
+    disconnects, that task is cancelled. The cancellation propagates through
+    ``asyncio.gather`` into the V4 analyzer tasks and the in-flight provider
+    HTTP calls. ``BaseHTTPMiddleware`` only stopped waiting; the work itself
+    kept running and spending tokens.
 
-class TimeoutMiddleware(BaseHTTPMiddleware):
-    """Middleware to enforce request timeout limits."""
-    
-    async def dispatch(self, request: Request, call_next):
+    Request messages are relayed through a queue, so the middleware can watch
+    for ``http.disconnect`` while the handler is still running. At most
+    ``MAX_BUFFERED_BODY_BYTES`` of body are read ahead of the handler.
+
+    ``timeouts`` maps request paths to their own timeout (e.g. batch
+    endpoints that stream results for minutes); other paths use ``timeout``.
+    """
+
+    def __init__(self, app: ASGIApp, timeout: Optional[float] = None, timeouts: Optional[Dict[str, float]] = None):
+        self.app = app
+        self.timeout = timeout
+        self.timeouts = timeouts or {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         """
         Process request with timeout enforcement.
-        
+
         Args:
-            request: The incoming request
-            call_next: The next middleware/handler
-            
-        Returns:
-            Response or timeout error
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timeout = self.timeouts.get(scope.get("path", ""))
+        if timeout is None:
+            timeout = self.timeout if self.timeout is not None else settings.request_timeout
+        inbox: asyncio.Queue = asyncio.Queue()
+        consumed = asyncio.Event()
+        disconnected = asyncio.Event()
+        buffered = 0
+        response_started = False
+        response_complete = False
+
+        async def relay_receive():
+            nonlocal buffered
+            while True:
+                message = await receive()
+                buffered += len(message.get("body", b""))
+                inbox.put_nowait(message)
+                if message["type"] == "http.disconnect":
+                    disconnected.set()
+                    return
+                while buffered > MAX_BUFFERED_BODY_BYTES:
+                    # Backpressure: let the handler catch up before reading more
+                    consumed.clear()
+                    await consumed.wait()
+
+        async def queued_receive() -> Message:
+            nonlocal buffered
+            message = await inbox.get()
+            buffered -= len(message.get("body", b""))
+            consumed.set()
+            return message
+
+        async def tracked_send(message: Message):
+            nonlocal response_started, response_complete
+            if message["type"] == "http.response.start":
+                response_started = True
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                response_complete = True
+            await send(message)
+
+        relay = asyncio.ensure_future(relay_receive())
+        handler = asyncio.ensure_future(self.app(scope, queued_receive, tracked_send))
+        disconnect_wait = asyncio.ensure_future(disconnected.wait())
         try:
-            # Apply timeout to request processing
-            response = await asyncio.wait_for(
-                call_next(request),
-                timeout=settings.request_timeout
-            )
-            return response
-            
-        except asyncio.TimeoutError:
-            logger.error(
-                f"Request timeout after {settings.request_timeout}s: "
-                f"{request.method} {request.url.path}"
-            )
-            return JSONResponse(
-                status_code=504,
-                content={
-                    "error": "Request timeout",
-                    "message": f"Request took longer than {settings.request_timeout} seconds to process",
-                    "suggestion": "The analysis is taking longer than expected. Please try again or contact support."
-                }
+            await asyncio.wait(
+                {handler, disconnect_wait},
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED
             )
+            if handler.done() or (disconnected.is_set() and response_complete):
+                # Finished (the server reports a disconnect once the response is sent);
+                # re-raise handler errors to the server as before
+                await handler
+                return
+
+            path = f"{scope.get('method', '')} {scope.get('path', '')}"
+            if disconnected.is_set():
+                metrics.increment("requests_cancelled_client_disconnect")
+                logger.warning(f"Client disconnected; cancelling {path}")
+                await self._cancel(handler)
+                return
+
+            metrics.increment("requests_cancelled_timeout")
+            logger.error(f"Request timeout after {timeout}s: {path}")
+            await self._cancel(handler)
+            if not response_started:
+                response = JSONResponse(
+                    status_code=504,
+                    content={
+                        "error": "Request timeout",
+                        "message": f"Request took longer than {timeout} seconds to process",
+                        "suggestion": "The analysis is taking longer than expected. Please try again or contact support."
+                    }
+                )
+                await response(scope, queued_receive, send)
+        finally:
+            for task in (relay, disconnect_wait, handler):
+                if not task.done():
+                    task.cancel()
+
+    @staticmethod
+    async def _cancel(handler: asyncio.Task):
+        """Cancel the handler task and wait for its cleanup to finish."""
+        handler.cancel()
+        try:
+            await handler
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.debug(f"Handler raised during cancellation: {e}")
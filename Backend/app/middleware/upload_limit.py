@@ -0,0 +1,81 @@
+"""ASGI middleware that caps request body size before the multipart parser runs."""
+import logging
+from typing import Dict
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject oversized request bodies on upload endpoints.
+
+    FastAPI parses (and spools) the whole multipart body before the handler
+    runs, so the handler's own size check comes too late to protect the
+    worker. This middleware rejects requests whose ``Content-Length`` is over
+    the limit without reading them, and stops chunked uploads as soon as the
+    running byte count crosses the limit.
+    """
+
+    def __init__(self, app: ASGIApp, limits: Dict[str, int]):
+        """
+        Args:
+            app: The wrapped ASGI application
+            limits: Maximum body size in bytes, keyed by request path
+        """
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] not in self.limits:
+            await self.app(scope, receive, send)
+            return
+
+        limit = self.limits[scope["path"]]
+        headers = dict(scope.get("headers") or [])
+        content_length = headers.get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > limit:
+            logger.warning(f"Rejected {scope['path']} upload of {int(content_length)} bytes")
+            await self._reject(scope, receive, send, limit)
+            return
+
+        received = 0
+        rejected = False
+
+        async def limited_receive() -> Message:
+            nonlocal received, rejected
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # Stop the body parser; the app sees a client disconnect
+                    rejected = True
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message: Message):
+            if not rejected:
+                await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not rejected:
+                raise
+
+        if rejected:
+            logger.warning(f"Aborted streaming {scope['path']} upload after {received} bytes")
+            await self._reject(scope, receive, send, limit)
+
+    @staticmethod
+    async def _reject(scope: Scope, receive: Receive, send: Send, limit: int):
+        response = JSONResponse(
+            status_code=413,
+            content={
+                "error": "Payload too large",
+                "message": f"Request body exceeds {limit // (1024 * 1024)}MB"
+            }
+        )
+        await response(scope, receive, send)
@@ -593,4 +593,93 @@ def skills_tools_relevance_prompt(skills, job_description):
     - Below 4 points: "Poor" (❌)
     '''
 
-    return prompt
\ No newline at end of file
+    return prompt
+
+# Fused V4 analysis: several components scored in a single call. Each
+# component's rubric is its regular prompt rendered against references to the
+# shared inputs, so the job description and resume are sent once and the
+# rubrics stay defined in one place.
+FUSED_JOB_DESCRIPTION_REF = "[the JOB DESCRIPTION above]"
+FUSED_RESUME_REF = "[the RESUME above]"
+
+FUSED_COMPONENT_RUBRICS = {
+    "education": lambda: education_requirement_prompt(
+        "[the Education section of the RESUME above]", FUSED_JOB_DESCRIPTION_REF
+    ),
+    "keyword_match": lambda: keyword_match_prompt(FUSED_RESUME_REF, FUSED_JOB_DESCRIPTION_REF),
+    "experience": lambda: job_experience_prompt(
+        "[the Work Experience section of the RESUME above]", FUSED_JOB_DESCRIPTION_REF
+    ),
+    "skills": lambda: skills_tools_relevance_prompt(
+        "[the Skills and Interests section of the RESUME above]", FUSED_JOB_DESCRIPTION_REF
+    ),
+    "action_words": lambda: action_words_prompt(FUSED_RESUME_REF, FUSED_JOB_DESCRIPTION_REF),
+    "measurable_results": lambda: measurable_results_prompt(FUSED_RESUME_REF, FUSED_JOB_DESCRIPTION_REF),
+    "bullet_effectiveness": lambda: bullet_point_effectiveness_prompt(FUSED_RESUME_REF),
+}
+
+# Components whose rubric reads the job description
+FUSED_JD_COMPONENTS = {"education", "keyword_match", "experience", "skills"}
+
+
+def fused_analysis_prompt(components, resume_text, job_description):
+    """V4: Several components in one call; returns one JSON object keyed by component."""
+    sections = "\n\n".join(
+        f"=== SECTION \"{name}\" ===\n{FUSED_COMPONENT_RUBRICS[name]().strip()}"
+        for name in components
+    )
+    keys = ", ".join(f'"{name}"' for name in components)
+    job_block = ""
+    if FUSED_JD_COMPONENTS.intersection(components):
+        job_block = f"JOB DESCRIPTION:\n{job_description}\n\n"
+
+    return f'''{job_block}RESUME:
+{resume_text}
+
+Score the resume on each of the {len(components)} sections below. Each section has
+its own criteria and JSON STRUCTURE; evaluate them independently.
+
+{sections}
+
+OUTPUT FORMAT:
+Return ONE JSON object with exactly these keys: {keys}.
+The value for each key must follow that section's JSON STRUCTURE.
+Important: Return ONLY valid JSON without any additional text, explanations, or formatting.
+'''
+
+
+def keyword_explanation_prompt(matches, job_description):
+    """V4 hybrid keyword mode: explain locally computed matches (scores are final)."""
+    return f'''Given the job description: {job_description}
+
+And these keyword match results, already computed and scored for the resume: {matches}
+
+Write improvement advice for the candidate based ONLY on these results. Do not
+re-score or add keywords: explain which missing or partially matched keywords
+matter most for this job, how to phrase them naturally in the resume, and how
+to fix any keyword stuffing.
+
+JSON STRUCTURE:
+{{
+    "suggestedImprovements": "detailed improvement suggestions"
+}}
+
+Important: Return ONLY valid JSON without any additional text, explanations, or formatting.
+'''
+
+
+def rules_explanation_prompt(component_title, findings):
+    """V4 hybrid quality mode: explain rule-based findings (scores are final)."""
+    return f'''These {component_title} findings were computed and scored by rules for a resume: {findings}
+
+Write improvement advice for the candidate based ONLY on these findings. Do not
+re-score them. Prioritise the changes with the biggest effect, quote the
+bullet points they apply to, and show a short rewritten example where useful.
+
+JSON STRUCTURE:
+{{
+    "suggestedImprovements": "detailed improvement suggestions"
+}}
+
+Important: Return ONLY valid JSON without any additional text, explanations, or formatting.
+'''
@@ -0,0 +1 @@
+"""Background job queue for long-running analyses."""
@@ -0,0 +1,209 @@
+"""
+Submit/poll/fetch jobs run by a background worker pool.
+
+``/api/analyze`` holds its connection open for the whole analysis, tying up
+proxies and clients and making a retry repeat all of it. A ``JobManager``
+accepts the work, returns a job id at once and runs it on a pool of worker
+tasks. Job records (status, timestamps, then the result or error) are kept
+for ``JOB_RESULT_TTL_SECONDS`` in a store owned by the manager, so ordinary
+cache traffic can't evict a result before the client fetches it. When Redis
+is configured they are also written there (skipping the L1 cache), so a
+client can poll any process.
+"""
+import asyncio
+from datetime import datetime, timezone
+import logging
+import math
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import uuid
+
+from fastapi import HTTPException
+
+from app.cache.redis_cache import redis_cache
+from app.core.config import settings
+from app.core.exceptions import JobQueueFullError
+from app.core.metrics import metrics
+from app.core.pipeline import start_stage_timings
+from app.queue.local_queue import LocalJobQueue
+from app.resilience.deadline import start_deadline
+
+logger = logging.getLogger(__name__)
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+# Weight of the newest job in the running average of job durations
+DURATION_SMOOTHING = 0.2
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class JobManager:
+    """
+    Bounded queue plus worker pool for one kind of job.
+
+    The handler receives the submitted payload and returns a JSON-serializable
+    result. An ``HTTPException`` it raises is stored with its status code and
+    detail, so fetching the result fails the way the synchronous endpoint
+    would have; anything else is stored as a 500.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[Any], Awaitable[Dict[str, Any]]],
+        workers: int,
+        max_depth: int,
+        timeout: float,
+        result_ttl: int
+    ):
+        """
+        Args:
+            name: Prefix for cache keys, log lines and metrics
+            handler: Coroutine function running one job
+            workers: Jobs running at once
+            max_depth: Jobs allowed to wait; submissions beyond it are rejected
+            timeout: Seconds a job may run (its deadline leaves a margin for a
+                partial result, as for a request)
+            result_ttl: Seconds records of finished jobs are kept
+        """
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.result_ttl = result_ttl
+        self._queue = LocalJobQueue(max_depth)
+        self._tasks: List[asyncio.Task] = []
+        # Records of jobs submitted to this process: job id -> (expires_at, record)
+        self._records: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._running = 0
+        self._avg_duration = 10.0
+
+    def _key(self, job_id: str) -> str:
+        return redis_cache.generate_key(f"job_{self.name}", job_id)
+
+    def start(self):
+        """Start the worker tasks (idempotent)."""
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._worker(index)) for index in range(self.workers)]
+        logger.info(f"{self.name} job queue started with {self.workers} workers")
+
+    async def stop(self):
+        """Cancel the workers; queued jobs are dropped and running ones cancelled."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        dropped = self._queue.clear()
+        if dropped:
+            logger.warning(f"{self.name} job queue stopped with {dropped} jobs still queued")
+
+    def retry_after(self) -> int:
+        """Seconds until a worker is likely to take the next job."""
+        return max(1, math.ceil(self._avg_duration / self.workers))
+
+    async def submit(self, payload: Any) -> Dict[str, Any]:
+        """
+        Queue a job.
+
+        Returns:
+            The job's record (``job_id``, ``status`` and timestamps)
+
+        Raises:
+            JobQueueFullError: If ``max_depth`` jobs are already waiting
+        """
+        job_id = uuid.uuid4().hex
+        record = {"job_id": job_id, "status": STATUS_QUEUED, "submitted_at": _now()}
+        # Take the queue slot before the first await, so concurrent
+        # submissions can't all pass the depth check and overfill the queue
+        self._sweep()
+        self._records[job_id] = (math.inf, record)
+        if not self._queue.put_nowait((job_id, payload)):
+            del self._records[job_id]
+            metrics.increment(f"jobs_rejected_{self.name}")
+            raise JobQueueFullError(
+                f"{self.name} job queue is full ({len(self._queue)} waiting)",
+                retry_after=self.retry_after()
+            )
+        await self._save(record)
+        metrics.increment(f"jobs_submitted_{self.name}")
+        return dict(record)
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """The job's record, or None if unknown or expired."""
+        entry = self._records.get(job_id)
+        if entry is not None and time.time() < entry[0]:
+            return dict(entry[1])
+        # Submitted to another process: only the shared tier has it
+        return await redis_cache.get(self._key(job_id), bypass_l1=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "running": self._running,
+            "queued": len(self._queue),
+            "max_depth": self._queue.max_depth,
+            "avg_job_seconds": round(self._avg_duration, 2),
+            "records": len(self._records),
+        }
+
+    def _sweep(self):
+        """Drop expired records (unfinished jobs never expire)."""
+        now = time.time()
+        for job_id in [job_id for job_id, (expires_at, _) in self._records.items() if now >= expires_at]:
+            del self._records[job_id]
+
+    async def _save(self, record: Dict[str, Any]):
+        finished = record["status"] in (STATUS_DONE, STATUS_FAILED)
+        self._records[record["job_id"]] = (time.time() + self.result_ttl if finished else math.inf, record)
+        await redis_cache.set(self._key(record["job_id"]), record, ttl=self.result_ttl, bypass_l1=True)
+
+    async def _worker(self, index: int):
+        while True:
+            job_id, payload = await self._queue.get()
+            record = self._records[job_id][1]
+            record.update(status=STATUS_RUNNING, started_at=_now())
+            await self._save(record)
+            self._running += 1
+            started = time.perf_counter()
+            try:
+                record.update(await self._run(payload))
+            except asyncio.CancelledError:
+                record.update(
+                    status=STATUS_FAILED,
+                    error={"status_code": 503, "detail": "Server shut down before the job finished. Please resubmit."}
+                )
+                raise
+            finally:
+                self._running -= 1
+                elapsed = time.perf_counter() - started
+                self._avg_duration += DURATION_SMOOTHING * (elapsed - self._avg_duration)
+                record["finished_at"] = _now()
+                await self._save(record)
+            metrics.increment(f"jobs_{record['status']}_{self.name}")
+            logger.info(f"{self.name} job {job_id[:8]} {record['status']} in {elapsed:.1f}s (worker {index})")
+
+    async def _run(self, payload: Any) -> Dict[str, Any]:
+        """Run the handler under the job's deadline; returns the record fields to update."""
+        # Same budget rules as a request: the margin leaves time for a partial result
+        start_deadline(self.timeout - settings.deadline_safety_margin_seconds)
+        start_stage_timings()
+        try:
+            result = await asyncio.wait_for(self.handler(payload), timeout=self.timeout)
+            return {"status": STATUS_DONE, "result": result}
+        except HTTPException as e:
+            return {"status": STATUS_FAILED, "error": {"status_code": e.status_code, "detail": e.detail}}
+        except asyncio.TimeoutError:
+            return {
+                "status": STATUS_FAILED,
+                "error": {"status_code": 504, "detail": f"Analysis took longer than {self.timeout:g} seconds"}
+            }
+        except Exception as e:
+            logger.error(f"{self.name} job failed: {e}", exc_info=True)
+            return {"status": STATUS_FAILED, "error": {"status_code": 500, "detail": "Internal server error"}}
@@ -0,0 +1,52 @@
+"""Bounded in-process job queue."""
+import asyncio
+from typing import Any, Optional
+
+
+class LocalJobQueue:
+    """
+    FIFO of pending jobs held in process memory, with a depth limit.
+
+    Stand-in for a shared broker so the job API runs without external
+    services. Each worker process has its own queue and workers; job status
+    and results go to the shared cache, so any process can answer polls.
+    Jobs still queued when the process stops are lost (their status
+    expires from the cache).
+    """
+
+    def __init__(self, max_depth: int):
+        """
+        Args:
+            max_depth: Jobs allowed to wait (running jobs are not counted)
+        """
+        self.max_depth = max(1, max_depth)
+        self._queue: Optional[asyncio.Queue] = None
+
+    def _items(self) -> asyncio.Queue:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        return self._queue
+
+    def __len__(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @property
+    def full(self) -> bool:
+        return len(self) >= self.max_depth
+
+    def put_nowait(self, item: Any) -> bool:
+        """Enqueue ``item``; returns False (and drops it) when the queue is full."""
+        if self.full:
+            return False
+        self._items().put_nowait(item)
+        return True
+
+    async def get(self) -> Any:
+        """Wait for and remove the oldest job."""
+        return await self._items().get()
+
+    def clear(self) -> int:
+        """Drop every waiting job; returns how many were dropped."""
+        dropped = len(self)
+        self._queue = None
+        return dropped
@@ -0,0 +1,79 @@
+"""Rate-limited scheduling of LLM calls for bulk work."""
+import asyncio
+from contextvars import ContextVar
+import inspect
+import logging
+import time
+from typing import Any, Awaitable, Optional
+
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class CallScheduler:
+    """
+    Caps how many LLM calls run at once and how many start per minute.
+
+    Bulk work (screening hundreds of resumes) would otherwise fire every
+    analyzer call at once and run into the provider's rate limit, where the
+    429s turn into retries and trip the circuit breaker for interactive
+    requests too. Calls wait here instead: at most ``max_concurrent`` are in
+    flight and starts are spaced ``60 / calls_per_minute`` seconds apart.
+
+    Like the request deadline, the scheduler is attached to the current
+    context (``use_call_scheduler``) so ``gen_model_async`` picks it up in
+    every analyzer task without it being threaded through their signatures.
+    """
+
+    def __init__(self, max_concurrent: int, calls_per_minute: float):
+        """
+        Args:
+            max_concurrent: LLM calls allowed in flight at once
+            calls_per_minute: Call starts allowed per minute (0 for no limit)
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.interval = 60.0 / calls_per_minute if calls_per_minute > 0 else 0.0
+        self._slots = asyncio.Semaphore(self.max_concurrent)
+        self._next_start = 0.0
+        self.calls = 0
+        self.waited_seconds = 0.0
+
+    async def run(self, call: Awaitable[Any]) -> Any:
+        """
+        Await ``call`` once a slot and a start time are free.
+
+        Cancelling the caller while it waits closes ``call`` without starting it.
+        """
+        queued = time.monotonic()
+        try:
+            async with self._slots:
+                if self.interval:
+                    # Reserve the next start time; waiters are spaced evenly
+                    now = time.monotonic()
+                    start = max(now, self._next_start)
+                    self._next_start = start + self.interval
+                    if start > now:
+                        await asyncio.sleep(start - now)
+                waited = time.monotonic() - queued
+                self.calls += 1
+                self.waited_seconds += waited
+                metrics.increment("llm_scheduler_wait_ms", waited * 1000)
+                return await call
+        finally:
+            if inspect.iscoroutine(call) and inspect.getcoroutinestate(call) == inspect.CORO_CREATED:
+                # Never started (cancelled while queued); avoid "never awaited" warnings
+                call.close()
+
+
+_current_scheduler: ContextVar[Optional[CallScheduler]] = ContextVar("llm_call_scheduler", default=None)
+
+
+def current_call_scheduler() -> Optional[CallScheduler]:
+    """Return the scheduler LLM calls in this context go through, if any."""
+    return _current_scheduler.get()
+
+
+def use_call_scheduler(scheduler: Optional[CallScheduler]):
+    """Route LLM calls made from this context (and tasks it creates) through ``scheduler``."""
+    _current_scheduler.set(scheduler)
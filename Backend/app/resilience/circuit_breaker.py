@@ -1,43 +1,242 @@
-"""Circuit breaker for OpenAI API calls to prevent cascading failures."""
-from pybreaker import CircuitBreaker, CircuitBreakerListener
+"""Circuit breaker for LLM API calls to prevent cascading failures."""
+import asyncio
+from collections import deque
+import functools
 import logging
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, Tuple, Type
+
+from pybreaker import CircuitBreakerError
+
+from app.core.config import settings
+from app.core.exceptions import DeadlineExceededError
 
 logger = logging.getLogger(__name__)
 
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half-open"
 
-# Circuit breaker for OpenAI API
-openai_breaker = CircuitBreaker(
-    fail_max=5,           # Open circuit after 5 consecutive failures
-    reset_timeout=60,     # Keep circuit open for 60 seconds
-    name="openai_api"
-)
 
+class CircuitOpenError(CircuitBreakerError):
+    """Raised when a call is rejected because the circuit is open."""
+    pass
+
+
+class AsyncCircuitBreaker:
+    """
+    Circuit breaker that judges the awaited outcome of coroutine calls.
+
+    ``pybreaker`` wraps the synchronous call that *creates* a coroutine, so it
+    never sees async failures. This breaker awaits the call itself and tracks
+    outcomes in a rolling time window:
+
+    - closed: calls pass; once ``minimum_calls`` calls in the last
+      ``window_seconds`` fail at ``failure_rate`` or more, the circuit opens
+    - open: calls fail immediately with ``CircuitOpenError`` until
+      ``reset_timeout`` seconds have passed
+    - half-open: up to ``half_open_max_calls`` concurrent probe calls pass;
+      a successful probe closes the circuit, a failed one reopens it
+
+    Decorating a plain function works too, so sync and async callers can share
+    one breaker. Exceptions in ``ignored_exceptions`` propagate without being
+    recorded. ``CircuitOpenError`` subclasses pybreaker's
+    ``CircuitBreakerError`` so existing handlers keep working.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float,
+        minimum_calls: int,
+        window_seconds: float,
+        reset_timeout: float,
+        half_open_max_calls: int = 1,
+        ignored_exceptions: Tuple[Type[BaseException], ...] = ()
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.minimum_calls = max(1, minimum_calls)
+        self.window_seconds = window_seconds
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        # Errors that say nothing about the service's health (e.g. our own deadline)
+        self.ignored_exceptions = ignored_exceptions
+
+        self._state = STATE_CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._window: Deque[Tuple[float, bool]] = deque()
+        # Sync callers may run in threadpool threads
+        self._lock = threading.Lock()
+
+        self.total_calls = 0
+        self.total_failures = 0
+        self.rejected_calls = 0
+        self.times_opened = 0
+
+    def __call__(self, func: Callable) -> Callable:
+        """Decorate ``func`` (coroutine function or plain function)."""
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                return await self.call_async(func, *args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            return self.call(func, *args, **kwargs)
+        return sync_wrapper
+
+    @property
+    def state(self) -> str:
+        """Current state, moving open -> half-open once the reset timeout has passed."""
+        with self._lock:
+            return self._current_state()
 
-class LoggingListener(CircuitBreakerListener):
-    """Listener to log circuit breaker state changes."""
-    
-    def state_change(self, cb, old_state, new_state):
-        """Log circuit breaker state changes."""
-        logger.warning(
-            f"Circuit breaker '{cb.name}' state changed: {old_state} -> {new_state}"
-        )
-        
-        if new_state == "open":
+    def _current_state(self) -> str:
+        if self._state == STATE_OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._transition(STATE_HALF_OPEN)
+        return self._state
+
+    def _transition(self, new_state: str):
+        old_state, self._state = self._state, new_state
+        logger.warning(f"Circuit breaker '{self.name}' state changed: {old_state} -> {new_state}")
+
+        if new_state == STATE_OPEN:
+            self._opened_at = time.monotonic()
+            self.times_opened += 1
             logger.error(
-                f"Circuit breaker '{cb.name}' is now OPEN. "
-                f"OpenAI API calls will be blocked for {cb.reset_timeout} seconds."
+                f"Circuit breaker '{self.name}' is now OPEN. "
+                f"Calls will be blocked for {self.reset_timeout} seconds."
             )
-        elif new_state == "half-open":
+        elif new_state == STATE_HALF_OPEN:
+            self._probes = 0
             logger.info(
-                f"Circuit breaker '{cb.name}' is now HALF-OPEN. "
+                f"Circuit breaker '{self.name}' is now HALF-OPEN. "
                 f"Testing if service has recovered..."
             )
-        elif new_state == "closed":
+        elif new_state == STATE_CLOSED:
+            self._window.clear()
             logger.info(
-                f"Circuit breaker '{cb.name}' is now CLOSED. "
+                f"Circuit breaker '{self.name}' is now CLOSED. "
                 f"Service has recovered and is operating normally."
             )
 
+    def _before_call(self) -> bool:
+        """
+        Admit or reject a call.
+
+        Returns:
+            True if the call is a half-open probe
+
+        Raises:
+            CircuitOpenError: If the circuit is open or the probe slots are taken
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == STATE_CLOSED:
+                self.total_calls += 1
+                return False
+            if state == STATE_HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                self.total_calls += 1
+                return True
+            self.rejected_calls += 1
+        raise CircuitOpenError(f"Circuit breaker '{self.name}' is open")
+
+    def _after_call(self, probe: bool, success: bool):
+        with self._lock:
+            if not success:
+                self.total_failures += 1
+            if probe:
+                self._probes -= 1
+                if self._state == STATE_HALF_OPEN:
+                    self._transition(STATE_CLOSED if success else STATE_OPEN)
+                return
+            if self._state != STATE_CLOSED:
+                # A call admitted before the circuit opened; its outcome is moot
+                return
+
+            now = time.monotonic()
+            self._window.append((now, success))
+            while self._window and now - self._window[0][0] > self.window_seconds:
+                self._window.popleft()
+
+            failures = sum(1 for _, ok in self._window if not ok)
+            if (
+                not success
+                and len(self._window) >= self.minimum_calls
+                and failures / len(self._window) >= self.failure_rate
+            ):
+                self._transition(STATE_OPEN)
 
-# Add listener for state changes
-openai_breaker.add_listener(LoggingListener())
+    def _release_probe(self, probe: bool):
+        if probe:
+            with self._lock:
+                self._probes -= 1
+
+    async def call_async(self, func: Callable, *args, **kwargs) -> Any:
+        """Await ``func(*args, **kwargs)`` under the breaker."""
+        probe = self._before_call()
+        try:
+            result = await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            # A cancelled caller says nothing about the service; free the probe slot
+            self._release_probe(probe)
+            raise
+        except self.ignored_exceptions:
+            self._release_probe(probe)
+            raise
+        except Exception:
+            self._after_call(probe, success=False)
+            raise
+        self._after_call(probe, success=True)
+        return result
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """Call ``func(*args, **kwargs)`` under the breaker."""
+        probe = self._before_call()
+        try:
+            result = func(*args, **kwargs)
+        except self.ignored_exceptions:
+            self._release_probe(probe)
+            raise
+        except Exception:
+            self._after_call(probe, success=False)
+            raise
+        self._after_call(probe, success=True)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Return state and counters for health reporting."""
+        with self._lock:
+            state = self._current_state()
+            failures = sum(1 for _, ok in self._window if not ok)
+            retry_after = 0.0
+            if state == STATE_OPEN:
+                retry_after = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+            return {
+                "name": self.name,
+                "state": state,
+                "window_calls": len(self._window),
+                "window_failures": failures,
+                "total_calls": self.total_calls,
+                "total_failures": self.total_failures,
+                "rejected_calls": self.rejected_calls,
+                "times_opened": self.times_opened,
+                "retry_after_seconds": round(retry_after, 1)
+            }
+
+
+# Circuit breaker for the LLM provider API
+openai_breaker = AsyncCircuitBreaker(
+    name="openai_api",
+    failure_rate=settings.circuit_breaker_failure_rate,
+    minimum_calls=settings.circuit_breaker_minimum_calls,
+    window_seconds=settings.circuit_breaker_window_seconds,
+    reset_timeout=settings.circuit_breaker_reset_timeout,
+    half_open_max_calls=settings.circuit_breaker_half_open_max_calls,
+    ignored_exceptions=(DeadlineExceededError,)
+)
@@ -0,0 +1,156 @@
+"""Per-request deadline shared by every stage of the analysis pipeline."""
+import asyncio
+from contextvars import ContextVar
+import logging
+import time
+from typing import Any, Awaitable, Callable, List, Optional
+
+from app.core.exceptions import DeadlineExceededError
+
+logger = logging.getLogger(__name__)
+
+
+class Deadline:
+    """
+    Absolute point in time by which a request's work must finish.
+
+    The router creates one per request and stores it in a context variable,
+    so the extraction call, the V4 analyzers (which run as child tasks and
+    inherit the context) and the retry layer all see the same budget without
+    it being threaded through every signature.
+    """
+
+    def __init__(self, timeout: float, parent: Optional["Deadline"] = None):
+        """
+        Args:
+            timeout: Seconds from now until the deadline
+            parent: Deadline this one shares its budget with (see ``child``)
+        """
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout
+        self.parent = parent
+        # Components that were skipped or cut short because the budget ran out
+        self.skipped: List[str] = []
+
+    def child(self) -> "Deadline":
+        """
+        A deadline with the same expiry but its own ``skipped`` list.
+
+        For requests producing several independent results (each job of a
+        batch): one result's timed-out components must not mark the others
+        partial. Components skipped by work done under the parent (shared by
+        every child) still count for each child.
+        """
+        child = Deadline(self.timeout, parent=self)
+        child.expires_at = self.expires_at
+        return child
+
+    def incomplete_components(self) -> List[str]:
+        """Components skipped under this deadline or its parents, sorted and deduplicated."""
+        skipped = set()
+        deadline: Optional[Deadline] = self
+        while deadline is not None:
+            skipped.update(deadline.skipped)
+            deadline = deadline.parent
+        return sorted(skipped)
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (never negative)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def can_fit(self, seconds: float) -> bool:
+        """Whether ``seconds`` of work can still finish before the deadline."""
+        return self.remaining() >= seconds
+
+    def check(self, operation: str):
+        """
+        Raise if the deadline has already passed.
+
+        Raises:
+            DeadlineExceededError: If no time is left for ``operation``
+        """
+        if self.expired:
+            raise DeadlineExceededError(f"No time left for {operation}")
+
+    async def wait_for(self, awaitable: Awaitable[Any], operation: str) -> Any:
+        """
+        Await ``awaitable``, giving up when the deadline passes.
+
+        Raises:
+            DeadlineExceededError: If the deadline passes first
+        """
+        if self.expired:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise DeadlineExceededError(f"No time left for {operation}")
+        try:
+            return await asyncio.wait_for(awaitable, timeout=self.remaining())
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError(f"Deadline reached during {operation}")
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("request_deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Return the deadline of the request being handled, if any."""
+    return _current_deadline.get()
+
+
+def start_deadline(timeout: float) -> Deadline:
+    """
+    Create a deadline ``timeout`` seconds from now and make it current.
+
+    Args:
+        timeout: Seconds of budget for the rest of the request
+
+    Returns:
+        The new deadline
+    """
+    deadline = Deadline(timeout)
+    _current_deadline.set(deadline)
+    return deadline
+
+
+def use_deadline(deadline: Optional[Deadline]):
+    """Make ``deadline`` current for this context (and tasks it creates)."""
+    _current_deadline.set(deadline)
+
+
+def clear_deadline():
+    """Detach the current context from any deadline (e.g. for background work)."""
+    _current_deadline.set(None)
+
+
+def stop_if_deadline_cannot_fit(
+    wait_strategy: Callable[[Any], float],
+    min_attempt_seconds: float
+) -> Callable[[Any], bool]:
+    """
+    Tenacity stop condition: give up when the backoff plus another attempt
+    would not finish before the current request's deadline.
+
+    Args:
+        wait_strategy: The retry's wait strategy (used to predict the next sleep)
+        min_attempt_seconds: Shortest useful time for one more attempt
+
+    Returns:
+        A callable usable as (part of) tenacity's ``stop`` argument
+    """
+    def stop(retry_state) -> bool:
+        deadline = current_deadline()
+        if deadline is None:
+            return False
+        needed = wait_strategy(retry_state) + min_attempt_seconds
+        if deadline.can_fit(needed):
+            return False
+        logger.warning(
+            f"Skipping retry: {deadline.remaining():.1f}s left, "
+            f"next attempt needs about {needed:.1f}s"
+        )
+        return True
+    return stop
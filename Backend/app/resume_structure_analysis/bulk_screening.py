@@ -0,0 +1,264 @@
+"""
+Many resumes against one job (recruiter screening).
+
+A recruiter uploads a few hundred PDFs for one posting. Run one by one
+through ``/api/analyze`` that would re-preprocess the job description per
+resume, parse PDFs one at a time and fire every analyzer call at once. Here:
+
+* identical files (same SHA-256) are parsed and analyzed once and reported
+  under all of their file names;
+* the job description is preprocessed once (the caller passes its profile);
+* PDFs are parsed in the process pool, a few at a time so interactive
+  requests still find room in its queue;
+* once every resume is extracted, the deterministic components (context,
+  structure) run for the whole set in one pass and are reported right away;
+  the V4 analysis reuses them instead of recomputing;
+* every LLM call goes through a process-wide ``CallScheduler`` (concurrency
+  and calls per minute), so a large screening stays under the provider's
+  rate limit instead of tripping the circuit breaker for everyone else.
+
+Progress is yielded as events; the router streams them as NDJSON.
+"""
+import asyncio
+from dataclasses import dataclass, field
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from pybreaker import CircuitBreakerError
+
+from app.core.config import settings
+from app.core.exceptions import (
+    DeadlineExceededError,
+    InvalidResumeContentError,
+    OpenAIError,
+    PDFProcessingBusyError,
+    PDFValidationError,
+    ResumeExtractionError
+)
+from app.core.metrics import metrics
+from app.resilience.call_scheduler import CallScheduler, use_call_scheduler
+from app.resilience.deadline import current_deadline, use_deadline
+from app.resume_structure_analysis.resume_analysis_v4 import analyze_deterministic_v4, analyze_resume_v4
+from app.utils.job_profile import JobProfile
+from app.utils.openai_extraction import extract_components_openai
+from app.utils.pdf_pool import extract_pdf_text
+
+logger = logging.getLogger(__name__)
+
+# Times a PDF is resubmitted while the pool's queue is full, and the pause between tries
+PDF_BUSY_RETRIES = 10
+PDF_BUSY_RETRY_SECONDS = 1.0
+
+# Failures that skip one resume instead of ending the screening
+_RESUME_ERRORS = (
+    PDFValidationError,
+    PDFProcessingBusyError,
+    InvalidResumeContentError,
+    ResumeExtractionError,
+    OpenAIError,
+    DeadlineExceededError,
+    CircuitBreakerError
+)
+
+# Shared by every screening request; recreated if the event loop changes
+_scheduler: Optional[CallScheduler] = None
+_scheduler_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+@dataclass
+class ScreeningFile:
+    """An uploaded resume PDF."""
+    filename: str
+    content: bytes
+    sha256: str
+
+
+@dataclass
+class ScreenedResume:
+    """A distinct resume (by content hash) and its progress through the pipeline."""
+    id: int
+    sha256: str
+    content: bytes
+    filenames: List[str] = field(default_factory=list)
+    resume_data: Optional[Dict[str, Any]] = None
+    precomputed: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    def describe(self) -> Dict[str, Any]:
+        return {"id": self.id, "filenames": self.filenames, "sha256": self.sha256}
+
+
+def screening_scheduler() -> CallScheduler:
+    """The process-wide scheduler for LLM calls made by screenings."""
+    global _scheduler, _scheduler_loop
+    loop = asyncio.get_running_loop()
+    if _scheduler is None or _scheduler_loop is not loop:
+        _scheduler = CallScheduler(settings.screening_llm_concurrency, settings.screening_llm_calls_per_minute)
+        _scheduler_loop = loop
+    return _scheduler
+
+
+def dedupe_files(files: Sequence[ScreeningFile]) -> List[ScreenedResume]:
+    """Group uploads by content hash, keeping first-upload order."""
+    by_hash: Dict[str, ScreenedResume] = {}
+    for upload in files:
+        resume = by_hash.get(upload.sha256)
+        if resume is None:
+            resume = by_hash[upload.sha256] = ScreenedResume(len(by_hash), upload.sha256, upload.content)
+        resume.filenames.append(upload.filename)
+    return list(by_hash.values())
+
+
+async def _extract_pdf(resume: ScreenedResume, pdf_slots: asyncio.Semaphore) -> str:
+    """Parse one PDF in the process pool, waiting out a full queue."""
+    async with pdf_slots:
+        for attempt in range(PDF_BUSY_RETRIES + 1):
+            try:
+                extracted = await extract_pdf_text(resume.content, resume.sha256)
+                return extracted["text"]
+            except PDFProcessingBusyError:
+                if attempt == PDF_BUSY_RETRIES:
+                    raise
+                await asyncio.sleep(PDF_BUSY_RETRY_SECONDS)
+
+
+async def _run_stage(
+    resumes: Sequence[ScreenedResume],
+    work: Callable[[ScreenedResume], Awaitable[Any]],
+    concurrency: int
+) -> AsyncIterator[Tuple[ScreenedResume, Any]]:
+    """
+    Run ``work`` for every resume, at most ``concurrency`` at a time, yielding
+    (resume, result) as each finishes. A failure from ``_RESUME_ERRORS`` is
+    recorded on the resume and yielded as the result.
+    """
+    slots = asyncio.Semaphore(concurrency)
+
+    async def run(resume: ScreenedResume) -> Tuple[ScreenedResume, Any]:
+        async with slots:
+            try:
+                return resume, await work(resume)
+            except _RESUME_ERRORS as e:
+                resume.error = str(e) or type(e).__name__
+                return resume, e
+
+    tasks = [asyncio.ensure_future(run(resume)) for resume in resumes]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            yield await finished
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _progress(event: str, resume: ScreenedResume, completed: int, total: int, **extra) -> Dict[str, Any]:
+    return {"event": event, **resume.describe(), **extra, "completed": completed, "total": total}
+
+
+def _ranking_entry(resume: ScreenedResume, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    job_fit = analysis.get("jobFitScore") or {}
+    quality = analysis.get("resumeQualityScore") or {}
+    return {
+        **resume.describe(),
+        "jobFitScore": job_fit.get("score", 0.0),
+        "label": job_fit.get("label"),
+        "resumeQualityScore": quality.get("score"),
+    }
+
+
+async def screen_resumes_v4(
+    files: Sequence[ScreeningFile],
+    job_profile: JobProfile
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Screen uploaded resumes against one job, yielding progress events.
+
+    Events, in order:
+        ``start`` (file counts after deduplication); ``extracted`` or
+        ``error`` per resume as parsing and extraction finish; one
+        ``prescreen`` with the deterministic components of every extracted
+        resume; ``result`` or ``error`` per resume as its analysis finishes;
+        ``done`` with the ranking (best Job Fit first) and throughput.
+        Every per-resume event carries ``completed``/``total`` progress for
+        its phase.
+
+    Args:
+        files: Uploaded PDFs (duplicates allowed)
+        job_profile: The job's preprocessed description
+    """
+    started = time.perf_counter()
+    resumes = dedupe_files(files)
+    total = len(resumes)
+    yield {"event": "start", "files": len(files), "unique": total, "duplicates": len(files) - total}
+
+    # LLM calls from the tasks created below (and their analyzer tasks) are scheduled
+    use_call_scheduler(screening_scheduler())
+    pdf_slots = asyncio.Semaphore(max(1, settings.pdf_pool_workers))
+    concurrency = max(1, settings.screening_resume_concurrency)
+
+    async def extract(resume: ScreenedResume) -> Dict[str, Any]:
+        resume.resume_data = await extract_components_openai(await _extract_pdf(resume, pdf_slots))
+        return resume.resume_data
+
+    completed = 0
+    async for resume, _ in _run_stage(resumes, extract, concurrency):
+        completed += 1
+        if resume.error:
+            yield _progress("error", resume, completed, total, phase="extraction", error=resume.error)
+        else:
+            yield _progress("extracted", resume, completed, total)
+
+    # Deterministic components for the whole set in one pass (no LLM, no waiting)
+    extracted = [resume for resume in resumes if resume.error is None]
+    for resume in extracted:
+        resume.precomputed = await analyze_deterministic_v4(resume.resume_data, job_profile)
+    yield {
+        "event": "prescreen",
+        "resumes": [
+            {
+                **resume.describe(),
+                "context": resume.precomputed["context"],
+                "structureScore": resume.precomputed["structure"]["score"]["pointsAwarded"],
+            }
+            for resume in extracted
+        ],
+    }
+
+    screening_deadline = current_deadline()
+
+    async def analyze(resume: ScreenedResume) -> Dict[str, Any]:
+        # Each resume records its own timed-out components, so one slow
+        # analysis doesn't mark the others partial (and keep them out of the cache)
+        if screening_deadline is not None:
+            use_deadline(screening_deadline.child())
+        return await analyze_resume_v4(
+            resume_data=resume.resume_data,
+            job_description=job_profile.description,
+            job_profile=job_profile,
+            precomputed=resume.precomputed
+        )
+
+    ranking: List[Dict[str, Any]] = []
+    completed = 0
+    async for resume, analysis in _run_stage(extracted, analyze, concurrency):
+        completed += 1
+        if resume.error:
+            yield _progress("error", resume, completed, len(extracted), phase="analysis", error=resume.error)
+            continue
+        metrics.increment("screening_resumes_analyzed")
+        ranking.append(_ranking_entry(resume, analysis))
+        yield _progress("result", resume, completed, len(extracted), analysis=analysis)
+
+    elapsed = time.perf_counter() - started
+    ranking.sort(key=lambda entry: (-entry["jobFitScore"], entry["id"]))
+    logger.info(f"Screened {total} resumes ({len(files)} files) in {elapsed:.1f}s")
+    yield {
+        "event": "done",
+        "ranking": ranking,
+        "failed": [{**resume.describe(), "error": resume.error} for resume in resumes if resume.error],
+        "elapsed_seconds": round(elapsed, 2),
+        "resumes_per_minute": round(total / elapsed * 60, 1) if elapsed > 0 else None,
+    }
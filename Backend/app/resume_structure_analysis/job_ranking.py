@@ -0,0 +1,134 @@
+"""
+One resume against many jobs.
+
+Checking a resume against a list of saved postings used to mean one
+``/api/analyze`` upload per posting, each re-parsing the PDF and re-running
+extraction. The batch endpoint extracts the resume once and hands it here:
+
+* the resume-quality analyzers never read the job description, so they run
+  once and every job's analysis awaits the same result;
+* the per-job analyses run under a process-wide concurrency limit
+  (``BATCH_JOB_CONCURRENCY``), so one batch cannot take every provider slot
+  from single-analysis requests;
+* results are yielded as each job finishes, with its rank among the jobs
+  finished so far, followed by the final ranking.
+"""
+import asyncio
+from dataclasses import dataclass
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.resilience.deadline import current_deadline, use_deadline
+from app.resume_structure_analysis.resume_analysis_v4 import analyze_resume_quality_v4, analyze_resume_v4
+from app.utils.job_profile import JobProfile
+
+logger = logging.getLogger(__name__)
+
+# Shared by every batch request; recreated if the event loop changes
+_job_slots: Optional[asyncio.Semaphore] = None
+_job_slots_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+@dataclass
+class BatchJob:
+    """A posting in a batch request."""
+    # Title, company and description length, echoed back with the result
+    job_context: Dict[str, Any]
+    profile: JobProfile
+
+
+def _slots() -> asyncio.Semaphore:
+    """The process-wide limit on per-job analyses running at once."""
+    global _job_slots, _job_slots_loop
+    loop = asyncio.get_running_loop()
+    if _job_slots is None or _job_slots_loop is not loop:
+        _job_slots = asyncio.Semaphore(settings.batch_job_concurrency)
+        _job_slots_loop = loop
+    return _job_slots
+
+
+def _job_fit_score(analysis: Dict[str, Any]) -> float:
+    job_fit = analysis.get("jobFitScore")
+    return float(job_fit.get("score", 0.0)) if isinstance(job_fit, dict) else 0.0
+
+
+def _ranking_entry(index: int, job: BatchJob, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    job_fit = analysis.get("jobFitScore") or {}
+    return {
+        "index": index,
+        "title": job.job_context.get("title"),
+        "company": job.job_context.get("company"),
+        "score": _job_fit_score(analysis),
+        "label": job_fit.get("label"),
+    }
+
+
+def _ranked(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Highest Job Fit first; ties keep submission order."""
+    return sorted(entries, key=lambda entry: (-entry["score"], entry["index"]))
+
+
+async def rank_jobs_v4(resume_data: Dict[str, Any], jobs: Sequence[BatchJob]) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Analyze one extracted resume against every job, yielding events as jobs finish.
+
+    Events:
+        ``{"event": "job", "index", "job_context", "jobFitScore", "rank",
+        "completed", "total", "analysis"}`` for each job (``rank`` is among
+        the jobs finished so far), then ``{"event": "ranking", "ranking": [...]}``
+        with every job ordered by Job Fit score.
+
+    Closing the generator early (client disconnect, timeout) cancels the
+    analyses still running.
+
+    Args:
+        resume_data: Extracted resume (``extract_components_openai``)
+        jobs: Postings with their preprocessed descriptions
+    """
+    slots = _slots()
+    # Resume-only analyzers run once for the whole batch
+    resume_quality = asyncio.ensure_future(analyze_resume_quality_v4(resume_data))
+
+    batch_deadline = current_deadline()
+
+    async def analyze_job(index: int, job: BatchJob):
+        # Each job records its own timed-out components, so one slow job
+        # doesn't mark the others partial (and keep them out of the cache)
+        if batch_deadline is not None:
+            use_deadline(batch_deadline.child())
+        async with slots:
+            analysis = await analyze_resume_v4(
+                resume_data=resume_data,
+                job_description=job.profile.description,
+                job_profile=job.profile,
+                resume_quality=resume_quality
+            )
+        return index, analysis
+
+    tasks = [asyncio.ensure_future(analyze_job(index, job)) for index, job in enumerate(jobs)]
+    entries: List[Dict[str, Any]] = []
+    try:
+        for finished in asyncio.as_completed(tasks):
+            index, analysis = await finished
+            entry = _ranking_entry(index, jobs[index], analysis)
+            entries.append(entry)
+            metrics.increment("batch_jobs_analyzed")
+            yield {
+                "event": "job",
+                "index": index,
+                "job_context": jobs[index].job_context,
+                "jobFitScore": analysis.get("jobFitScore"),
+                "rank": _ranked(entries).index(entry) + 1,
+                "completed": len(entries),
+                "total": len(jobs),
+                "analysis": analysis,
+            }
+        yield {"event": "ranking", "ranking": _ranked(entries)}
+        logger.info(f"Ranked {len(jobs)} jobs for one resume")
+    finally:
+        pending = [task for task in tasks + [resume_quality] if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
@@ -8,9 +8,14 @@ This module implements the V4 scoring system with two independent dimensions:
 All scoring follows the V4 specification exactly.
 """
 
+import asyncio
+from contextvars import ContextVar
+import copy
+import functools
 import logging
 import json
-from typing import Dict, Any, Optional
+import os
+from typing import Any, Awaitable, Callable, Collection, Dict, List, Optional
 from datetime import datetime, timezone
 from app.services.openai_model import gen_model_async
 from app.prompts.templates import (
@@ -20,7 +25,10 @@ from app.prompts.templates import (
     skills_tools_relevance_prompt,
     action_words_prompt,
     measurable_results_prompt,
-    bullet_point_effectiveness_prompt
+    bullet_point_effectiveness_prompt,
+    fused_analysis_prompt,
+    keyword_explanation_prompt,
+    rules_explanation_prompt
 )
 from app.utils.score_validator import (
     validate_numeric,
@@ -28,14 +36,182 @@ from app.utils.score_validator import (
     safe_divide,
     round_to_precision,
     validate_and_sanitize_response,
+    validate_score_component,
     get_job_fit_label,
     get_resume_quality_tier
 )
 from app.utils.context_analyzer import analyze_context
 from app.cache.redis_cache import redis_cache
+from app.core.config import settings
+from app.core.exceptions import DeadlineExceededError
+from app.core.pipeline import StageGraph
+from app.resilience.deadline import current_deadline
+from app.utils.token_budget import COMPONENT_SECTIONS, budget_component_inputs, record_prompt_tokens
+from app.utils.keyword_engine import JobTerm, analyze_keyword_match_local
+from app.utils.quality_rules import RULE_SCORERS
+from app.utils.job_profile import JobProfile, build_job_profile
 
 logger = logging.getLogger(__name__)
 
+# Bump when analyzer post-processing changes in a way that invalidates cached LLM output
+COMPONENT_CACHE_VERSION = "v4.0"
+
+# LLM-scored components and their maximum points, in fused-prompt order
+V4_COMPONENT_MAX_POINTS = {
+    "education": 20,
+    "keyword_match": 35,
+    "experience": 30,
+    "skills": 15,
+    "action_words": 25,
+    "measurable_results": 25,
+    "bullet_effectiveness": 20,
+}
+
+# Display names used when asking the LLM to explain rule-based findings
+QUALITY_COMPONENT_TITLES = {
+    "action_words": "action words",
+    "measurable_results": "measurable results",
+    "bullet_effectiveness": "bullet point effectiveness",
+}
+
+# Resume sections the keyword component reads (the engine ignores contact details)
+KEYWORD_SECTIONS = set(COMPONENT_SECTIONS["keyword_match"])
+
+# Raw component results already produced by fused calls for this analysis
+_prefetched_components: ContextVar[Optional[Dict[str, Dict[str, Any]]]] = ContextVar(
+    "prefetched_v4_components", default=None
+)
+
+
+async def generate_component_v4(component: str, prompt: str) -> Dict[str, Any]:
+    """
+    Run one analyzer's LLM call, cached per component.
+    
+    The key is the rendered prompt, which contains exactly the inputs that
+    analyzer uses (e.g. only Education + JD for the education gate, only the
+    resume for action words). The same resume against a new job therefore
+    reuses resume-only components, and a lightly edited resume reuses every
+    component whose inputs did not change.
+    
+    In fused mode, a component already returned (and validated) by a fused
+    call is served from that result; components missing from it fall back to
+    their own call here.
+    
+    Args:
+        component: Analyzer name used as the cache namespace
+        prompt: Fully rendered prompt
+    
+    Returns:
+        A private copy of the raw LLM result (callers mutate it in place)
+    
+    Raises:
+        DeadlineExceededError: If the request's deadline passes first; the
+            component is recorded on the deadline so the response can be
+            flagged as partial
+    """
+    prefetched = _prefetched_components.get()
+    if prefetched and component in prefetched:
+        return copy.deepcopy(prefetched[component])
+    
+    async def call_llm() -> Dict[str, Any]:
+        record_prompt_tokens(component, prompt)
+        return await gen_model_async(prompt)
+    
+    cache_key = redis_cache.generate_key(f"component_v4:{component}", prompt, COMPONENT_CACHE_VERSION)
+    try:
+        result = await redis_cache.get_or_compute(
+            cache_key,
+            call_llm,
+            ttl=settings.cache_ttl_seconds
+        )
+    except DeadlineExceededError:
+        deadline = current_deadline()
+        if deadline is not None:
+            deadline.skipped.append(component)
+        raise
+    return copy.deepcopy(result)
+
+
+def _fused_groups(exclude: Collection[str] = ()) -> List[List[str]]:
+    """
+    Parse ``settings.v4_fused_groups`` ("a,b;c,d") into component groups.
+    
+    Unknown names are ignored; components left out of every group run as
+    individual calls. An empty setting puts all components in one call.
+    
+    Args:
+        exclude: Components that are not needed (e.g. already computed)
+    """
+    # Components scored locally never go to the LLM
+    local = set(exclude)
+    if settings.keyword_match_mode != "llm":
+        local.add("keyword_match")
+    if settings.quality_scoring_mode != "llm":
+        local.update(QUALITY_COMPONENT_TITLES)
+    if not settings.v4_fused_groups.strip():
+        return [[name for name in V4_COMPONENT_MAX_POINTS if name not in local]]
+    
+    groups = []
+    seen = set(local)
+    for raw_group in settings.v4_fused_groups.split(";"):
+        group = []
+        for name in (part.strip() for part in raw_group.split(",")):
+            if not name:
+                continue
+            if name not in V4_COMPONENT_MAX_POINTS or name in seen:
+                logger.warning(f"Ignoring unknown or repeated fused component: {name}")
+                continue
+            seen.add(name)
+            group.append(name)
+        if group:
+            groups.append(group)
+    return groups
+
+
+async def _run_fused_group_v4(components: List[str], resume_data: Dict[str, Any], job_description: str) -> Dict[str, Any]:
+    """
+    Score several components in one LLM call and keep the sections that validate.
+    
+    Each section is checked with ``validate_score_component`` against its
+    component's maximum points. Invalid or missing sections are left out so
+    the analyzer falls back to its own call.
+    
+    Args:
+        components: Component names to fuse
+        resume_data: Complete resume data dictionary
+        job_description: Job description text
+        
+    Returns:
+        Dict of component name -> raw result, for the sections that passed
+    """
+    resume_input, job_input = budget_component_inputs("fused", resume_data, job_description)
+    prompt = fused_analysis_prompt(components, resume_input, job_input)
+    
+    async def call_llm() -> Dict[str, Any]:
+        record_prompt_tokens("fused", prompt)
+        return await gen_model_async(prompt)
+    
+    cache_key = redis_cache.generate_key("fused_v4", prompt, COMPONENT_CACHE_VERSION)
+    try:
+        result = await redis_cache.get_or_compute(
+            cache_key,
+            call_llm,
+            ttl=settings.cache_ttl_seconds
+        )
+    except Exception as e:
+        logger.warning(f"Fused call for {components} failed; falling back to individual calls: {e}")
+        return {}
+    
+    valid = {}
+    for name in components:
+        section = copy.deepcopy(result.get(name))
+        try:
+            valid[name] = validate_score_component(section, V4_COMPONENT_MAX_POINTS[name], name)
+        except Exception as e:
+            logger.warning(f"Fused section '{name}' is invalid ({e}); falling back to an individual call")
+    logger.info(f"Fused V4 call for {components} returned {len(valid)}/{len(components)} valid components")
+    return valid
+
 
 async def analyze_education_requirement_v4(education: Any, job_description: str) -> Dict[str, Any]:
     """
@@ -49,8 +225,9 @@ async def analyze_education_requirement_v4(education: Any, job_description: str)
         Dict with score and analysis
     """
     try:
-        prompt = education_requirement_prompt(education, job_description)
-        result = await gen_model_async(prompt)
+        education_input, job_input = budget_component_inputs("education", education, job_description)
+        prompt = education_requirement_prompt(education_input, job_input)
+        result = await generate_component_v4("education", prompt)
         
         # Validate and ensure binary scoring
         points = validate_numeric(result['score']['pointsAwarded'], 'education.pointsAwarded')
@@ -87,7 +264,11 @@ async def analyze_education_requirement_v4(education: Any, job_description: str)
         }
 
 
-async def analyze_keyword_match_v4(resume_text: Any, job_description: str) -> Dict[str, Any]:
+async def analyze_keyword_match_v4(
+    resume_text: Any,
+    job_description: str,
+    job_terms: Optional[List[JobTerm]] = None
+) -> Dict[str, Any]:
     """
     V4: Keyword & Contextual Match (0-35 points)
     
@@ -101,13 +282,24 @@ async def analyze_keyword_match_v4(resume_text: Any, job_description: str) -> Di
     Args:
         resume_text: Resume text or dict
         job_description: Job description text
+        job_terms: Key terms already extracted from the job description
+            (used by the local engine)
         
+    ``KEYWORD_MATCH_MODE`` selects how: ``llm`` asks the model, ``local``
+    scores with the deterministic keyword engine (no LLM call) and ``hybrid``
+    scores locally and asks the model only to explain the result.
+    
     Returns:
         Dict with score and analysis
     """
+    if settings.keyword_match_mode != "llm":
+        return await _keyword_match_local_v4(resume_text, job_description, job_terms)
+    
     try:
-        prompt = keyword_match_prompt(resume_text, job_description)
-        result = await gen_model_async(prompt)
+        resume_input, job_input = budget_component_inputs("keyword_match", resume_text, job_description)
+        prompt = keyword_match_prompt(resume_input, job_input)
+        result = await generate_component_v4("keyword_match", prompt)
+        _record_llm_component("keyword_match", resume_text, result, job_description)
         
         # Validate score
         points = validate_numeric(result['score']['pointsAwarded'], 'keyword.pointsAwarded')
@@ -138,6 +330,84 @@ async def analyze_keyword_match_v4(resume_text: Any, job_description: str) -> Di
         }
 
 
+async def _keyword_match_local_v4(
+    resume_data: Any,
+    job_description: str,
+    job_terms: Optional[List[JobTerm]] = None
+) -> Dict[str, Any]:
+    """
+    Keyword match scored by the local engine; in hybrid mode the LLM writes the advice.
+    
+    The score is never taken from the LLM. If the explanation call fails,
+    the engine's own suggestions are kept.
+    """
+    resume_input = resume_data
+    if isinstance(resume_data, dict):
+        resume_input = {k: v for k, v in resume_data.items() if k in KEYWORD_SECTIONS}
+    result = analyze_keyword_match_local(resume_input, job_description, job_terms)
+    
+    if settings.keyword_match_mode == "hybrid":
+        matches = {key: result["analysis"][key] for key in ("strongMatches", "partialMatches", "missingKeywords", "keywordStuffing")}
+        matches_input, job_input = budget_component_inputs("keyword_explanation", matches, job_description)
+        await _add_llm_suggestions(result, "keyword_explanation", keyword_explanation_prompt(matches_input, job_input))
+    return result
+
+
+async def _quality_rules_v4(component: str, resume_data: Any) -> Dict[str, Any]:
+    """
+    Quality component scored by rules; in hybrid mode the LLM writes the advice.
+    
+    Args:
+        component: action_words, measurable_results or bullet_effectiveness
+        resume_data: Resume data the component reads
+        
+    Returns:
+        Dict with score and analysis, same structure as the LLM component
+    """
+    result = RULE_SCORERS[component](resume_data)
+    
+    if settings.quality_scoring_mode == "hybrid":
+        findings = {key: value for key, value in result["analysis"].items() if key != "suggestedImprovements"}
+        findings_input, _ = budget_component_inputs(f"{component}_explanation", findings)
+        prompt = rules_explanation_prompt(QUALITY_COMPONENT_TITLES[component], findings_input)
+        await _add_llm_suggestions(result, f"{component}_explanation", prompt)
+    return result
+
+
+async def _add_llm_suggestions(result: Dict[str, Any], component: str, prompt: str):
+    """
+    Replace a locally scored result's suggestions with LLM-written advice.
+    
+    The score is never taken from the LLM; if the call fails the local
+    suggestions are kept.
+    """
+    try:
+        explanation = await generate_component_v4(component, prompt)
+        if isinstance(explanation.get("suggestedImprovements"), str):
+            result["analysis"]["suggestedImprovements"] = explanation["suggestedImprovements"]
+    except Exception as e:
+        logger.warning(f"{component} call failed; keeping local suggestions: {e}")
+
+
+def _record_llm_component(component: str, resume_input: Any, result: Dict[str, Any], job_description: Optional[str] = None):
+    """
+    Append an LLM component result and its inputs to ``COMPONENT_RECORD_PATH``.
+    
+    The recordings feed ``benchmarks/rules_agreement.py``, which compares
+    the local scorers with the LLM. Off unless the path is set.
+    """
+    if not settings.component_record_path:
+        return
+    record = {"component": component, "resume": resume_input, "response": result}
+    if job_description is not None:
+        record["job_description"] = job_description
+    try:
+        with open(os.path.expanduser(settings.component_record_path), "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+    except Exception as e:
+        logger.warning(f"Could not record {component} output: {e}")
+
+
 async def analyze_experience_alignment_v4(resume_text: Any, job_description: str) -> Dict[str, Any]:
     """
     V4: Experience Alignment (0-30 points with normalization)
@@ -159,8 +429,9 @@ async def analyze_experience_alignment_v4(resume_text: Any, job_description: str
         Dict with score and analysis
     """
     try:
-        prompt = job_experience_prompt(resume_text, job_description)
-        result = await gen_model_async(prompt)
+        experience_input, job_input = budget_component_inputs("experience", resume_text, job_description)
+        prompt = job_experience_prompt(experience_input, job_input)
+        result = await generate_component_v4("experience", prompt)
         
         # Extract raw score and calculate normalization
         raw_score = result['score'].get('rawScore', result['score']['pointsAwarded'])
@@ -221,8 +492,9 @@ async def analyze_skills_tools_v4(skills: Any, job_description: str) -> Dict[str
         Dict with score and analysis
     """
     try:
-        prompt = skills_tools_relevance_prompt(skills, job_description)
-        result = await gen_model_async(prompt)
+        skills_input, job_input = budget_component_inputs("skills", skills, job_description)
+        prompt = skills_tools_relevance_prompt(skills_input, job_input)
+        result = await generate_component_v4("skills", prompt)
         
         # Validate score
         points = validate_numeric(result['score']['pointsAwarded'], 'skills.pointsAwarded')
@@ -411,9 +683,15 @@ async def analyze_action_words_v4(resume_text: Any, job_description: str) -> Dic
     Returns:
         Dict with score and analysis
     """
+    if settings.quality_scoring_mode != "llm":
+        return await _quality_rules_v4("action_words", resume_text)
+    
     try:
-        prompt = action_words_prompt(resume_text, job_description)
-        result = await gen_model_async(prompt)
+        # The rubric does not read the job description; the whole budget goes to the resume
+        resume_input, _ = budget_component_inputs("action_words", resume_text)
+        prompt = action_words_prompt(resume_input, job_description)
+        result = await generate_component_v4("action_words", prompt)
+        _record_llm_component("action_words", resume_text, result)
         
         # Validate score
         points = validate_numeric(result['score']['pointsAwarded'], 'actionWords.pointsAwarded')
@@ -459,9 +737,14 @@ async def analyze_measurable_results_v4(resume_text: Any, job_description: str)
     Returns:
         Dict with score and analysis
     """
+    if settings.quality_scoring_mode != "llm":
+        return await _quality_rules_v4("measurable_results", resume_text)
+    
     try:
-        prompt = measurable_results_prompt(resume_text, job_description)
-        result = await gen_model_async(prompt)
+        resume_input, _ = budget_component_inputs("measurable_results", resume_text)
+        prompt = measurable_results_prompt(resume_input, job_description)
+        result = await generate_component_v4("measurable_results", prompt)
+        _record_llm_component("measurable_results", resume_text, result)
         
         # Validate score
         points = validate_numeric(result['score']['pointsAwarded'], 'measurableResults.pointsAwarded')
@@ -505,9 +788,14 @@ async def analyze_bullet_effectiveness_v4(resume_text: Any) -> Dict[str, Any]:
     Returns:
         Dict with score and analysis
     """
+    if settings.quality_scoring_mode != "llm":
+        return await _quality_rules_v4("bullet_effectiveness", resume_text)
+    
     try:
-        prompt = bullet_point_effectiveness_prompt(resume_text)
-        result = await gen_model_async(prompt)
+        resume_input, _ = budget_component_inputs("bullet_effectiveness", resume_text)
+        prompt = bullet_point_effectiveness_prompt(resume_input)
+        result = await generate_component_v4("bullet_effectiveness", prompt)
+        _record_llm_component("bullet_effectiveness", resume_text, result)
         
         # Validate score
         points = validate_numeric(result['score']['pointsAwarded'], 'bulletEffectiveness.pointsAwarded')
@@ -638,7 +926,252 @@ async def calculate_resume_quality_score_v4(components: Dict[str, Any]) -> Dict[
         }
 
 
-async def analyze_resume_v4(resume_data: Dict[str, Any], job_description: str, use_cache: bool = True) -> Dict[str, Any]:
+# Stages that read only the resume; one result serves every job it is compared with
+RESUME_QUALITY_STAGES = ("structure", "action_words", "measurable_results", "bullet_effectiveness", "resume_quality")
+
+# Stages computed without the LLM; bulk screening runs them for every resume up front
+DETERMINISTIC_STAGES = ("context", "structure")
+
+
+async def analyze_deterministic_v4(resume_data: Dict[str, Any], job_profile: JobProfile) -> Dict[str, Any]:
+    """
+    Run the stages that need no LLM call (``DETERMINISTIC_STAGES``).
+    
+    The result can be passed back to ``analyze_resume_v4`` as ``precomputed``.
+    """
+    return {
+        "context": analyze_context(resume_data, job_profile.description, industry=job_profile.industry),
+        "structure": await analyze_resume_structure_v4(resume_data),
+    }
+
+
+def _analyzer_adder(graph: StageGraph, component_group: Dict[str, str]) -> Callable[..., None]:
+    """
+    Return ``add_analyzer(component, analyze, *args)`` for ``graph``.
+    
+    An analyzer whose component is in a fused group depends on that group's
+    stage and is served from its result (``_prefetched_components`` is set in
+    the analyzer's own task, so groups never see each other's results).
+    """
+    def add_analyzer(component: str, analyze: Callable[..., Awaitable[Dict[str, Any]]], *args):
+        group = component_group.get(component)
+        
+        async def analyzer_stage(**inputs):
+            if group:
+                _prefetched_components.set(inputs[group])
+            return await analyze(*args)
+        
+        graph.add(component, analyzer_stage, after=(group,) if group else ())
+    
+    return add_analyzer
+
+
+def _precomputed_stage(result: Any) -> Callable[[], Awaitable[Any]]:
+    """A stage that returns an already computed result."""
+    async def stage():
+        return result
+    return stage
+
+
+def _add_resume_quality_stages(
+    graph: StageGraph,
+    resume_data: Dict[str, Any],
+    add_analyzer: Callable[..., None],
+    job_text: str = "",
+    precomputed: Optional[Dict[str, Any]] = None
+):
+    """Add the four resume-quality analyzers and their total to ``graph``."""
+    if precomputed and "structure" in precomputed:
+        add_analyzer("structure", _precomputed_stage(precomputed["structure"]))
+    else:
+        add_analyzer("structure", analyze_resume_structure_v4, resume_data)
+    add_analyzer("action_words", analyze_action_words_v4, resume_data, job_text)
+    add_analyzer("measurable_results", analyze_measurable_results_v4, resume_data, job_text)
+    add_analyzer("bullet_effectiveness", analyze_bullet_effectiveness_v4, resume_data)
+    
+    async def resume_quality_stage(structure, action_words, measurable_results, bullet_effectiveness):
+        return await calculate_resume_quality_score_v4({
+            'structure': structure,
+            'actionWords': action_words,
+            'measurableResults': measurable_results,
+            'bulletEffectiveness': bullet_effectiveness
+        })
+    
+    graph.add(
+        "resume_quality", resume_quality_stage,
+        after=("structure", "action_words", "measurable_results", "bullet_effectiveness")
+    )
+
+
+async def analyze_resume_quality_v4(resume_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run only the resume-quality side of the V4 analysis.
+    
+    None of these analyzers read the job description, so when one resume is
+    compared with many jobs this runs once and its result is shared by every
+    job's ``analyze_resume_v4`` call (``resume_quality`` argument).
+    
+    Args:
+        resume_data: Complete resume data dictionary
+        
+    Returns:
+        Dict of stage name -> result for ``RESUME_QUALITY_STAGES``
+    """
+    graph = StageGraph("v4_quality")
+    _add_resume_quality_stages(graph, resume_data, _analyzer_adder(graph, {}))
+    results = await graph.run(return_exceptions=True)
+    return {name: results[name] for name in RESUME_QUALITY_STAGES}
+
+
+async def _perform_analysis_v4(
+    resume_data: Dict[str, Any],
+    job_description: str,
+    job_profile: Optional[JobProfile] = None,
+    resume_quality: Optional[Awaitable[Dict[str, Any]]] = None,
+    precomputed: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Run the full V4 analysis without consulting the cache.
+    
+    The steps run as a ``StageGraph``: context and the local structure check
+    start immediately, every analyzer starts as soon as its own inputs are
+    ready (in fused mode, as soon as its own fused group returns), and each
+    score total starts once its four components are in. Analyzers receive
+    the job profile's compact description instead of the raw text.
+    
+    Args:
+        resume_data: Complete resume data dictionary
+        job_description: Job description text
+        job_profile: Preprocessed job description (built here if omitted)
+        resume_quality: Task or future resolving to ``analyze_resume_quality_v4``
+            for this resume, shared across jobs; computed here if omitted
+        precomputed: ``analyze_deterministic_v4`` results for this resume and job
+        
+    Returns:
+        Dict with complete V4 analysis results
+    """
+    logger.info("Starting V4 resume analysis...")
+    
+    # Extract data
+    work_experience = resume_data.get('Work Experience', {})
+    education = resume_data.get('Education', [])
+    skills = resume_data.get('Skills and Interests', [])
+    
+    # Prompts get the compact job description (requirements summary, no boilerplate)
+    if job_profile is None:
+        job_profile = await asyncio.to_thread(build_job_profile, job_description)
+    job_text = job_profile.compact or job_description
+    
+    graph = StageGraph("v4")
+    precomputed = precomputed or {}
+    
+    async def context_stage():
+        return analyze_context(resume_data, job_description, industry=job_profile.industry)
+    
+    graph.add("context", _precomputed_stage(precomputed["context"]) if "context" in precomputed else context_stage)
+    
+    # Fused mode: each group's shared call is a stage of its own, and the
+    # analyzers of that group wait only for it; components that failed
+    # validation (or are in no group) make their own call
+    component_group: Dict[str, str] = {}
+    if settings.v4_analysis_mode == "fused":
+        shared = RESUME_QUALITY_STAGES if resume_quality is not None else ()
+        for index, group in enumerate(_fused_groups(exclude=shared), 1):
+            stage = f"fused_{index}"
+            graph.add(stage, functools.partial(_run_fused_group_v4, group, resume_data, job_text))
+            component_group.update({name: stage for name in group})
+    
+    add_analyzer = _analyzer_adder(graph, component_group)
+    
+    async def keyword_stage():
+        return await analyze_keyword_match_v4(resume_data, job_text, job_terms=job_profile.job_terms)
+    
+    add_analyzer("keyword_match", keyword_stage)
+    add_analyzer("experience", analyze_experience_alignment_v4, work_experience, job_text)
+    add_analyzer("education", analyze_education_requirement_v4, education, job_text)
+    add_analyzer("skills", analyze_skills_tools_v4, skills, job_text)
+    
+    if resume_quality is None:
+        _add_resume_quality_stages(graph, resume_data, add_analyzer, job_text, precomputed)
+    else:
+        async def shared_quality_stage():
+            # Shielded: one job being cancelled must not cancel the others' shared result
+            return await asyncio.shield(resume_quality)
+        
+        graph.add("shared_quality", shared_quality_stage)
+    
+    async def job_fit_stage(keyword_match, experience, education, skills):
+        return await calculate_job_fit_score_v4({
+            'keywordMatch': keyword_match,
+            'experienceAlignment': experience,
+            'educationRequirement': education,
+            'skillsToolsMatch': skills
+        })
+    
+    graph.add("job_fit", job_fit_stage, after=("keyword_match", "experience", "education", "skills"))
+    
+    # Analyzer failures become their results, as with asyncio.gather(return_exceptions=True)
+    results = await graph.run(return_exceptions=True)
+    if resume_quality is not None:
+        if isinstance(results["shared_quality"], Exception):
+            raise results["shared_quality"]
+        results.update(results["shared_quality"])
+    
+    context = results["context"]
+    keyword_result = results["keyword_match"]
+    experience_result = results["experience"]
+    education_result = results["education"]
+    skills_result = results["skills"]
+    structure_result = results["structure"]
+    action_words_result = results["action_words"]
+    measurable_result = results["measurable_results"]
+    bullet_result = results["bullet_effectiveness"]
+    job_fit = results["job_fit"]
+    resume_quality = results["resume_quality"]
+    
+    # Build final response
+    response = {
+        "version": "v4.0",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "jobFitScore": job_fit,
+        "resumeQualityScore": resume_quality,
+        "context": context,
+        
+        # Backward compatibility with V3
+        "overall_score": job_fit['score'],  # Use job fit score for backward compatibility
+        "keyword_match": keyword_result,
+        "job_experience": experience_result,
+        "skills_certifications": skills_result,  # Map to skills for V3 compatibility
+        "resume_structure": structure_result,
+        "action_words": action_words_result,
+        "measurable_results": measurable_result,
+        "bullet_point_effectiveness": bullet_result
+    }
+    
+    # Validate and sanitize
+    response = validate_and_sanitize_response(response)
+    
+    # Components that ran out of time fell back to their default scores
+    deadline = current_deadline()
+    incomplete = deadline.incomplete_components() if deadline is not None else []
+    if incomplete:
+        response["partial"] = True
+        response["incompleteComponents"] = incomplete
+        logger.warning(f"V4 analysis is partial; timed out: {response['incompleteComponents']}")
+    
+    logger.info(f"V4 analysis complete. Job Fit: {job_fit['score']}, Quality: {resume_quality['score']}")
+    
+    return response
+
+
+async def analyze_resume_v4(
+    resume_data: Dict[str, Any],
+    job_description: str,
+    use_cache: bool = True,
+    job_profile: Optional[JobProfile] = None,
+    resume_quality: Optional[Awaitable[Dict[str, Any]]] = None,
+    precomputed: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     """
     Main entry point for V4 resume analysis.
     
@@ -646,125 +1179,55 @@ async def analyze_resume_v4(resume_data: Dict[str, Any], job_description: str, u
     1. Job Fit Score (0-100) - exposed to user
     2. Resume Quality Score (0-100) - converted to tier label
     
+    Cached results past their TTL are served immediately while a fresh
+    analysis runs in the background (stale-while-revalidate).
+    
+    If the request's deadline passes while analyzers are still waiting on the
+    LLM, those analyzers fall back to their default scores and the result is
+    marked ``partial`` (and not cached) instead of the request timing out.
+    
     Args:
         resume_data: Complete resume data dictionary
         job_description: Job description text
         use_cache: Whether to use Redis caching (default: True)
+        job_profile: Preprocessed job description (built here if omitted)
+        resume_quality: Shared ``analyze_resume_quality_v4`` task for this
+            resume when it is analyzed against several jobs
+        precomputed: ``analyze_deterministic_v4`` results, when already computed
         
     Returns:
         Dict with complete V4 analysis results
     """
     try:
-        # Check Redis cache if enabled
-        if use_cache:
-            # Create a deterministic hash of the inputs
-            resume_str = json.dumps(resume_data, sort_keys=True)
-            
-            # Normalize the job description to ensure consistent caching
-            job_desc_normalized = job_description.strip().lower()
-            
-            # Generate Redis cache key
-            cache_key = redis_cache.generate_key("analysis_v4", resume_str, job_desc_normalized, "v4.0")
-            
-            # Add logging to debug cache key generation
-            logger.info(f"Generated V4 cache key: {cache_key[:16]}... for job desc length: {len(job_description)}")
-            
-            # Check Redis cache
-            cached_result = await redis_cache.get(cache_key)
-            if cached_result:
-                logger.info("Cache HIT - Using cached V4 analysis result from Redis")
-                return cached_result
-        
-        # Cache miss - perform the analysis
-        logger.info("Cache MISS - Starting V4 resume analysis...")
-        
-        # Analyze context
-        context = analyze_context(resume_data, job_description)
-        
-        # Extract data
-        work_experience = resume_data.get('Work Experience', {})
-        education = resume_data.get('Education', [])
-        skills = resume_data.get('Skills and Interests', [])
-        
-        # Run all analyses in parallel
-        import asyncio
-        
-        keyword_task = analyze_keyword_match_v4(resume_data, job_description)
-        experience_task = analyze_experience_alignment_v4(work_experience, job_description)
-        education_task = analyze_education_requirement_v4(education, job_description)
-        skills_task = analyze_skills_tools_v4(skills, job_description)
-        structure_task = analyze_resume_structure_v4(resume_data)
-        action_words_task = analyze_action_words_v4(resume_data, job_description)
-        measurable_task = analyze_measurable_results_v4(resume_data, job_description)
-        bullet_task = analyze_bullet_effectiveness_v4(resume_data)
-        
-        # Await all results
-        results = await asyncio.gather(
-            keyword_task,
-            experience_task,
-            education_task,
-            skills_task,
-            structure_task,
-            action_words_task,
-            measurable_task,
-            bullet_task,
-            return_exceptions=True
-        )
-        
-        # Unpack results
-        keyword_result, experience_result, education_result, skills_result, \
-        structure_result, action_words_result, measurable_result, bullet_result = results
-        
-        # Build Job Fit components
-        job_fit_components = {
-            'keywordMatch': keyword_result,
-            'experienceAlignment': experience_result,
-            'educationRequirement': education_result,
-            'skillsToolsMatch': skills_result
-        }
-        
-        # Build Resume Quality components
-        resume_quality_components = {
-            'structure': structure_result,
-            'actionWords': action_words_result,
-            'measurableResults': measurable_result,
-            'bulletEffectiveness': bullet_result
-        }
+        if job_profile is None:
+            job_profile = await asyncio.to_thread(build_job_profile, job_description)
         
-        # Calculate overall scores
-        job_fit = await calculate_job_fit_score_v4(job_fit_components)
-        resume_quality = await calculate_resume_quality_score_v4(resume_quality_components)
-        
-        # Build final response
-        response = {
-            "version": "v4.0",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "jobFitScore": job_fit,
-            "resumeQualityScore": resume_quality,
-            "context": context,
-            
-            # Backward compatibility with V3
-            "overall_score": job_fit['score'],  # Use job fit score for backward compatibility
-            "keyword_match": keyword_result,
-            "job_experience": experience_result,
-            "skills_certifications": skills_result,  # Map to skills for V3 compatibility
-            "resume_structure": structure_result,
-            "action_words": action_words_result,
-            "measurable_results": measurable_result,
-            "bullet_point_effectiveness": bullet_result
-        }
-        
-        # Validate and sanitize
-        response = validate_and_sanitize_response(response)
-        
-        logger.info(f"V4 analysis complete. Job Fit: {job_fit['score']}, Quality: {resume_quality['score']}")
-        
-        # Cache the result if caching is enabled
-        if use_cache:
-            await redis_cache.set(cache_key, response, ttl=3600)  # Cache for 1 hour
-            logger.info(f"Cached V4 analysis result with key: {cache_key[:16]}...")
-        
-        return response
+        if not use_cache:
+            return await _perform_analysis_v4(resume_data, job_description, job_profile, resume_quality, precomputed)
+
+        # Create a deterministic hash of the inputs
+        resume_str = json.dumps(resume_data, sort_keys=True)
+        
+        # Generate Redis cache key (fused results are kept apart from fan-out results);
+        # the normalized job description keeps trivially different copies together
+        key_parts = [resume_str, job_profile.normalized, "v4.0"]
+        if settings.v4_analysis_mode == "fused":
+            key_parts += ["fused", settings.v4_fused_groups]
+        if settings.keyword_match_mode != "llm":
+            key_parts += [f"keywords:{settings.keyword_match_mode}"]
+        if settings.quality_scoring_mode != "llm":
+            key_parts += [f"quality:{settings.quality_scoring_mode}"]
+        cache_key = redis_cache.generate_key("analysis_v4", *key_parts)
+        
+        # Add logging to debug cache key generation
+        logger.info(f"Generated V4 cache key: {cache_key[:16]}... for job desc length: {len(job_description)}")
+        
+        return await redis_cache.get_or_compute(
+            cache_key,
+            lambda: _perform_analysis_v4(resume_data, job_description, job_profile, resume_quality, precomputed),
+            ttl=3600,  # Cache for 1 hour
+            cache_if=lambda analysis: not analysis.get("partial")  # Retry timed-out parts next time
+        )
         
     except Exception as e:
         logger.error(f"Critical error in V4 analysis: {e}")
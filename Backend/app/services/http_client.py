@@ -0,0 +1,218 @@
+"""Shared, tuned HTTP clients for LLM providers with connection-pool metrics."""
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# LLM calls one analysis request can have in flight at once (the V4 analyzers, rounded up)
+LLM_CALLS_PER_ANALYSIS = 8
+
+_pools: Dict[str, "InstrumentedTransport"] = {}
+
+
+def http2_available() -> bool:
+    """HTTP/2 needs the optional ``h2`` package."""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def pool_limits() -> httpx.Limits:
+    """
+    Connection limits sized for the expected LLM fan-out.
+
+    ``LLM_HTTP_MAX_CONNECTIONS`` wins when set; otherwise the pool holds one
+    connection per concurrent call of ``LLM_EXPECTED_CONCURRENT_ANALYSES``
+    analyses.
+    """
+    max_connections = settings.llm_http_max_connections or (
+        LLM_CALLS_PER_ANALYSIS * settings.llm_expected_concurrent_analyses
+    )
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=min(settings.llm_http_max_keepalive, max_connections),
+        keepalive_expiry=settings.llm_http_keepalive_expiry
+    )
+
+
+def client_timeout(timeout: float) -> httpx.Timeout:
+    """Request timeout with a separate bound on waiting for a pooled connection."""
+    return httpx.Timeout(timeout, pool=settings.llm_http_pool_timeout)
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body stream that frees the pool slot once it is closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """
+    Async transport that records connection-pool utilization and wait time.
+
+    A semaphore sized to the pool's ``max_connections`` admits requests, so
+    the time spent acquiring it is the time a call waited for a free
+    connection. A slot is held until the response body is closed.
+    """
+
+    def __init__(self, name: str, limits: httpx.Limits, http2: bool):
+        self.name = name
+        self.max_connections = limits.max_connections
+        self._transport = httpx.AsyncHTTPTransport(limits=limits, http2=http2)
+        self._slots = asyncio.Semaphore(self.max_connections)
+
+        self.requests = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.waited_requests = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=settings.llm_http_pool_timeout)
+        except asyncio.TimeoutError:
+            metrics.increment(f"llm_http_pool_timeouts_{self.name}")
+            raise httpx.PoolTimeout(f"No free {self.name} connection within {settings.llm_http_pool_timeout}s")
+        waited = time.perf_counter() - started
+
+        self.requests += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        self.total_wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        metrics.increment(f"llm_http_requests_{self.name}")
+        metrics.increment(f"llm_http_pool_wait_seconds_{self.name}", waited)
+        if waited > 0.001:
+            self.waited_requests += 1
+            metrics.increment(f"llm_http_pool_waits_{self.name}")
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self._release()
+            raise
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, self._release),
+            extensions=response.extensions
+        )
+
+    def _release(self):
+        self.in_flight -= 1
+        self._slots.release()
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool gauges and counters for /metrics."""
+        return {
+            "max_connections": self.max_connections,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "utilization": round(self.in_flight / self.max_connections, 3),
+            "requests": self.requests,
+            "waited_requests": self.waited_requests,
+            "avg_wait_ms": round(self.total_wait_seconds / self.requests * 1000, 2) if self.requests else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 2)
+        }
+
+
+def build_async_client(name: str, timeout: float) -> httpx.AsyncClient:
+    """
+    Create the shared async client for provider ``name``.
+
+    Args:
+        name: Provider name (used to label metrics)
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        An ``httpx.AsyncClient`` with tuned limits, keep-alive and, if the
+        ``h2`` package is installed and enabled, HTTP/2
+    """
+    http2 = settings.llm_http2 and http2_available()
+    transport = InstrumentedTransport(name, pool_limits(), http2)
+    _pools[name] = transport
+    logger.info(
+        f"HTTP pool for {name}: {transport.max_connections} connections, "
+        f"{'HTTP/2' if http2 else 'HTTP/1.1'}"
+    )
+    return httpx.AsyncClient(transport=transport, timeout=client_timeout(timeout))
+
+
+def build_sync_client(timeout: float) -> httpx.Client:
+    """Create a sync client with the same limits (used by the sync ``generate_json`` path)."""
+    return httpx.Client(
+        limits=pool_limits(),
+        timeout=client_timeout(timeout),
+        http2=settings.llm_http2 and http2_available()
+    )
+
+
+def client_args() -> Dict[str, Any]:
+    """Keyword arguments for SDKs that build their own httpx clients (they set timeouts themselves)."""
+    return {
+        "limits": pool_limits(),
+        "http2": settings.llm_http2 and http2_available()
+    }
+
+
+def http_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every instrumented provider pool, keyed by provider name."""
+    return {name: transport.stats() for name, transport in _pools.items()}
+
+
+async def warm_up(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    connections: int = 1
+) -> int:
+    """
+    Open ``connections`` pooled connections to ``url`` ahead of real traffic.
+
+    The TLS handshakes happen here instead of on the first user request.
+    Errors are logged, not raised.
+
+    Returns:
+        Number of warm-up requests that got a response
+    """
+    async def touch() -> bool:
+        try:
+            response = await client.get(url, headers=headers)
+            await response.aclose()
+            return True
+        except Exception as e:
+            logger.warning(f"HTTP warm-up request to {url} failed: {e}")
+            return False
+
+    results = await asyncio.gather(*[touch() for _ in range(max(connections, 1))])
+    return sum(results)
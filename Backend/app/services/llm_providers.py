@@ -4,15 +4,51 @@ LLM Provider Base Class and Implementations
 This module provides a unified interface for different LLM providers (OpenAI, Gemini, Groq).
 """
 
+import asyncio
 import logging
+import re
 from typing import Dict, Any, Optional
 from abc import ABC, abstractmethod
 
+import httpx
+from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable, RunnableLambda
+
+from app.services import http_client
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_SYSTEM_MESSAGE = (
+    "You are a resume analysis specialist that extracts structured information "
+    "from resumes and returns it as valid JSON. Only respond with valid JSON, "
+    "no explanations or extra text."
+)
+
+# Markdown code fences some models wrap around their JSON
+_CODE_FENCE_RE = re.compile(r"```(?:json)?")
+
+
+def _strip_code_fences(message: Any) -> str:
+    """Return the message content without markdown code fences."""
+    return _CODE_FENCE_RE.sub("", message.content).strip()
+
+
+_clean_json = RunnableLambda(_strip_code_fences)
+
 
 class BaseLLMProvider(ABC):
-    """Abstract base class for LLM providers."""
+    """
+    Abstract base class for LLM providers.
+    
+    Subclasses create the chat model in ``self._llm``. The
+    ``prompt | llm | clean | parser`` chain is composed once per system
+    message and reused for every call.
+    
+    Providers whose SDK accepts an ``httpx.AsyncClient`` share one tuned,
+    instrumented client (``self._http_client``) across all calls; it can be
+    warmed up at startup via ``warm_up``.
+    """
     
     def __init__(self, api_key: str, model: str, temperature: float, max_tokens: int, timeout: float):
         self.api_key = api_key
@@ -20,16 +56,79 @@ class BaseLLMProvider(ABC):
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.timeout = timeout
+        self._llm = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._parser = JsonOutputParser()
+        self._chains: Dict[str, Runnable] = {}
+    
+    @property
+    def warmup_url(self) -> Optional[str]:
+        """Cheap authenticated endpoint used to pre-open connections (None to skip)."""
+        return None
+    
+    async def warm_up(self, connections: int, timeout: float) -> int:
+        """
+        Pre-open pooled connections to the provider API.
+        
+        Args:
+            connections: Number of connections to open
+            timeout: Overall time limit for the warm-up
+        
+        Returns:
+            Number of connections opened (0 if unsupported or failed)
+        """
+        if self._http_client is None or self.warmup_url is None:
+            return 0
+        try:
+            return await asyncio.wait_for(
+                http_client.warm_up(
+                    self._http_client,
+                    self.warmup_url,
+                    headers={"Authorization": f"Bearer {self.api_key}"},
+                    connections=connections
+                ),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"{self.provider_name} connection warm-up timed out after {timeout}s")
+            return 0
+    
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+    
+    def _get_chain(self, system_message: Optional[str] = None) -> Runnable:
+        """Return the compiled chain for ``system_message``, building it on first use."""
+        system_message = system_message or DEFAULT_SYSTEM_MESSAGE
+        chain = self._chains.get(system_message)
+        if chain is None:
+            prompt_template = ChatPromptTemplate.from_messages([
+                ("system", system_message),
+                ("user", "{input}")
+            ])
+            chain = prompt_template | self._llm | _clean_json | self._parser
+            # Only a handful of fixed system messages exist, so this stays small
+            self._chains[system_message] = chain
+        return chain
     
-    @abstractmethod
     def generate_json(self, prompt: str, system_message: Optional[str] = None) -> Dict[str, Any]:
         """Generate structured JSON response synchronously."""
-        pass
+        result = self._get_chain(system_message).invoke({"input": prompt})
+        
+        if not isinstance(result, dict):
+            raise ValueError("Response is not a valid JSON object")
+        
+        return result
     
-    @abstractmethod
     async def generate_json_async(self, prompt: str, system_message: Optional[str] = None) -> Dict[str, Any]:
         """Generate structured JSON response asynchronously."""
-        pass
+        result = await self._get_chain(system_message).ainvoke({"input": prompt})
+        
+        if not isinstance(result, dict):
+            raise ValueError("Response is not a valid JSON object")
+        
+        return result
     
     @property
     @abstractmethod
@@ -44,18 +143,17 @@ class OpenAIProvider(BaseLLMProvider):
     def __init__(self, api_key: str, model: str, temperature: float, max_tokens: int, timeout: float):
         super().__init__(api_key, model, temperature, max_tokens, timeout)
         from langchain_openai import ChatOpenAI
-        from langchain_core.output_parsers import JsonOutputParser
-        from langchain_core.prompts import ChatPromptTemplate
         
+        self._http_client = http_client.build_async_client("openai", self.timeout)
         self._llm = ChatOpenAI(
             model=self.model,
             temperature=self.temperature,
             max_tokens=self.max_tokens,
             api_key=self.api_key,
-            timeout=self.timeout
+            timeout=self.timeout,
+            http_async_client=self._http_client,
+            http_client=http_client.build_sync_client(self.timeout)
         )
-        self._parser = JsonOutputParser()
-        self._prompt_template = ChatPromptTemplate
         
         logger.info(f"OpenAI provider initialized with model: {self.model}")
     
@@ -63,57 +161,10 @@ class OpenAIProvider(BaseLLMProvider):
     def provider_name(self) -> str:
         return "openai"
     
-    def generate_json(self, prompt: str, system_message: Optional[str] = None) -> Dict[str, Any]:
-        """Generate structured JSON response from OpenAI."""
-        default_system = (
-            "You are a resume analysis specialist that extracts structured information "
-            "from resumes and returns it as valid JSON. Only respond with valid JSON, "
-            "no explanations or extra text."
-        )
-        
-        prompt_template = self._prompt_template.from_messages([
-            ("system", system_message or default_system),
-            ("user", "{input}")
-        ])
-        
-        # Add RunnableLambda to strip markdown code blocks
-        from langchain_core.runnables import RunnableLambda
-        
-        clean_json = RunnableLambda(lambda x: x.content.replace("```json", "").replace("```", "").strip())
-        
-        chain = prompt_template | self._llm | clean_json | self._parser
-        result = chain.invoke({"input": prompt})
-        
-        if not isinstance(result, dict):
-            raise ValueError("Response is not a valid JSON object")
-        
-        return result
-    
-    async def generate_json_async(self, prompt: str, system_message: Optional[str] = None) -> Dict[str, Any]:
-        """Generate structured JSON response from OpenAI asynchronously."""
-        default_system = (
-            "You are a resume analysis specialist that extracts structured information "
-            "from resumes and returns it as valid JSON. Only respond with valid JSON, "
-            "no explanations or extra text."
-        )
-        
-        prompt_template = self._prompt_template.from_messages([
-            ("system", system_message or default_system),
-            ("user", "{input}")
-        ])
-        
-        # Add RunnableLambda to strip markdown code blocks
-        from langchain_core.runnables import RunnableLambda
-        
-        clean_json = RunnableLambda(lambda x: x.content.replace("```json", "").replace("```", "").strip())
-        
-        chain = prompt_template | self._llm | clean_json | self._parser
-        result = await chain.ainvoke({"input": prompt})
-        
-        if not isinstance(result, dict):
-            raise ValueError("Response is not a valid JSON object")
-        
-        return result
+    @property
+    def warmup_url(self) -> Optional[str]:
+        base_url = self._llm.openai_api_base or "https://api.openai.com/v1"
+        return f"{base_url.rstrip('/')}/models"
 
 
 class GeminiProvider(BaseLLMProvider):
@@ -122,21 +173,20 @@ class GeminiProvider(BaseLLMProvider):
     def __init__(self, api_key: str, model: str, temperature: float, max_tokens: int, timeout: float):
         super().__init__(api_key, model, temperature, max_tokens, timeout)
         from langchain_google_genai import ChatGoogleGenerativeAI
-        from langchain_core.output_parsers import JsonOutputParser
-        from langchain_core.prompts import ChatPromptTemplate
         
         # Map common model names to Gemini models
         gemini_model = self._map_to_gemini_model(model)
         
+        # The google-genai SDK builds its own httpx clients; pass the tuned pool
+        # limits through (its pool is not instrumented or warmed up)
         self._llm = ChatGoogleGenerativeAI(
             model=gemini_model,
             temperature=self.temperature,
             max_output_tokens=self.max_tokens,
             google_api_key=self.api_key,
-            timeout=self.timeout
+            timeout=self.timeout,
+            client_args=http_client.client_args()
         )
-        self._parser = JsonOutputParser()
-        self._prompt_template = ChatPromptTemplate
         
         logger.info(f"Gemini provider initialized with model: {gemini_model}")
     
@@ -154,58 +204,6 @@ class GeminiProvider(BaseLLMProvider):
     @property
     def provider_name(self) -> str:
         return "gemini"
-    
-    def generate_json(self, prompt: str, system_message: Optional[str] = None) -> Dict[str, Any]:
-        """Generate structured JSON response from Gemini."""
-        default_system = (
-            "You are a resume analysis specialist that extracts structured information "
-            "from resumes and returns it as valid JSON. Only respond with valid JSON, "
-            "no explanations or extra text."
-        )
-        
-        prompt_template = self._prompt_template.from_messages([
-            ("system", system_message or default_system),
-            ("user", "{input}")
-        ])
-        
-        # Add RunnableLambda to strip markdown code blocks
-        from langchain_core.runnables import RunnableLambda
-        
-        clean_json = RunnableLambda(lambda x: x.content.replace("```json", "").replace("```", "").strip())
-        
-        chain = prompt_template | self._llm | clean_json | self._parser
-        result = chain.invoke({"input": prompt})
-        
-        if not isinstance(result, dict):
-            raise ValueError("Response is not a valid JSON object")
-        
-        return result
-    
-    async def generate_json_async(self, prompt: str, system_message: Optional[str] = None) -> Dict[str, Any]:
-        """Generate structured JSON response from Gemini asynchronously."""
-        default_system = (
-            "You are a resume analysis specialist that extracts structured information "
-            "from resumes and returns it as valid JSON. Only respond with valid JSON, "
-            "no explanations or extra text."
-        )
-        
-        prompt_template = self._prompt_template.from_messages([
-            ("system", system_message or default_system),
-            ("user", "{input}")
-        ])
-        
-        # Add RunnableLambda to strip markdown code blocks
-        from langchain_core.runnables import RunnableLambda
-        
-        clean_json = RunnableLambda(lambda x: x.content.replace("```json", "").replace("```", "").strip())
-        
-        chain = prompt_template | self._llm | clean_json | self._parser
-        result = await chain.ainvoke({"input": prompt})
-        
-        if not isinstance(result, dict):
-            raise ValueError("Response is not a valid JSON object")
-        
-        return result
 
 
 class GroqProvider(BaseLLMProvider):
@@ -214,21 +212,20 @@ class GroqProvider(BaseLLMProvider):
     def __init__(self, api_key: str, model: str, temperature: float, max_tokens: int, timeout: float):
         super().__init__(api_key, model, temperature, max_tokens, timeout)
         from langchain_groq import ChatGroq
-        from langchain_core.output_parsers import JsonOutputParser
-        from langchain_core.prompts import ChatPromptTemplate
         
         # Map to Groq models
         groq_model = self._map_to_groq_model(model)
         
+        self._http_client = http_client.build_async_client("groq", self.timeout)
         self._llm = ChatGroq(
             model=groq_model,
             temperature=self.temperature,
             max_tokens=self.max_tokens,
             groq_api_key=self.api_key,
-            timeout=self.timeout
+            timeout=self.timeout,
+            http_async_client=self._http_client,
+            http_client=http_client.build_sync_client(self.timeout)
         )
-        self._parser = JsonOutputParser()
-        self._prompt_template = ChatPromptTemplate
         
         logger.info(f"Groq provider initialized with model: {groq_model}")
     
@@ -245,54 +242,7 @@ class GroqProvider(BaseLLMProvider):
     def provider_name(self) -> str:
         return "groq"
     
-    def generate_json(self, prompt: str, system_message: Optional[str] = None) -> Dict[str, Any]:
-        """Generate structured JSON response from Groq."""
-        default_system = (
-            "You are a resume analysis specialist that extracts structured information "
-            "from resumes and returns it as valid JSON. Only respond with valid JSON, "
-            "no explanations or extra text."
-        )
-        
-        prompt_template = self._prompt_template.from_messages([
-            ("system", system_message or default_system),
-            ("user", "{input}")
-        ])
-        
-        # Add RunnableLambda to strip markdown code blocks
-        from langchain_core.runnables import RunnableLambda
-        
-        clean_json = RunnableLambda(lambda x: x.content.replace("```json", "").replace("```", "").strip())
-        
-        chain = prompt_template | self._llm | clean_json | self._parser
-        result = chain.invoke({"input": prompt})
-        
-        if not isinstance(result, dict):
-            raise ValueError("Response is not a valid JSON object")
-        
-        return result
-    
-    async def generate_json_async(self, prompt: str, system_message: Optional[str] = None) -> Dict[str, Any]:
-        """Generate structured JSON response from Groq asynchronously."""
-        default_system = (
-            "You are a resume analysis specialist that extracts structured information "
-            "from resumes and returns it as valid JSON. Only respond with valid JSON, "
-            "no explanations or extra text."
-        )
-        
-        prompt_template = self._prompt_template.from_messages([
-            ("system", system_message or default_system),
-            ("user", "{input}")
-        ])
-        
-        # Add RunnableLambda to strip markdown code blocks
-        from langchain_core.runnables import RunnableLambda
-        
-        clean_json = RunnableLambda(lambda x: x.content.replace("```json", "").replace("```", "").strip())
-        
-        chain = prompt_template | self._llm | clean_json | self._parser
-        result = await chain.ainvoke({"input": prompt})
-        
-        if not isinstance(result, dict):
-            raise ValueError("Response is not a valid JSON object")
-        
-        return result
+    @property
+    def warmup_url(self) -> Optional[str]:
+        base_url = self._llm.groq_api_base or "https://api.groq.com"
+        return f"{base_url.rstrip('/')}/openai/v1/models"
@@ -152,3 +152,25 @@ def get_llm_service() -> LLMService:
     if _llm_service is None:
         _llm_service = LLMService()
     return _llm_service
+
+
+async def warm_up_llm_service() -> int:
+    """
+    Initialize the LLM service and pre-open provider connections.
+    
+    Returns:
+        Number of connections opened
+    """
+    provider = get_llm_service().provider
+    opened = await provider.warm_up(
+        settings.llm_http_warmup_connections,
+        settings.llm_http_warmup_timeout_seconds
+    )
+    logger.info(f"Warmed up {opened} {provider.provider_name} connection(s)")
+    return opened
+
+
+async def close_llm_service():
+    """Close the provider's shared HTTP client if the service was initialized."""
+    if _llm_service is not None and _llm_service._provider is not None:
+        await _llm_service._provider.aclose()
@@ -1,11 +1,15 @@
 """OpenAI model interface using centralized LLM service with resilience patterns."""
 import logging
 import asyncio
-from typing import Dict, Any, List, Callable
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from typing import Dict, Any, List, Callable, Optional
+from tenacity import retry, stop_after_attempt, stop_any, wait_exponential, retry_if_exception_type
 from app.services.llm_service import get_llm_service
-from app.core.exceptions import OpenAIError
+from app.core.config import settings
+from app.core.exceptions import OpenAIError, DeadlineExceededError
+from app.core.metrics import metrics
+from app.resilience.call_scheduler import current_call_scheduler
 from app.resilience.circuit_breaker import openai_breaker
+from app.resilience.deadline import current_deadline, stop_if_deadline_cannot_fit
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +26,7 @@ def gen_model(prompt: str) -> Dict[str, Any]:
     Generate a response using the centralized LLM service with resilience patterns.
     
     Features:
-    - Circuit breaker: Fails fast if OpenAI API is down (5 failures = 60s cooldown)
+    - Circuit breaker: Fails fast if the LLM API is down (rolling failure rate, see settings)
     - Retry logic: Retries up to 3 times with exponential backoff
     
     Args:
@@ -47,24 +51,36 @@ def gen_model(prompt: str) -> Dict[str, Any]:
         raise OpenAIError(f"Failed to generate model response: {str(e)}")
 
 
+_async_retry_wait = wait_exponential(multiplier=1, min=2, max=10)
+
+
 @retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=10),
-    retry=retry_if_exception_type(OpenAIError),
+    stop=stop_any(
+        stop_after_attempt(3),
+        # Don't start a retry the request's deadline can't accommodate
+        stop_if_deadline_cannot_fit(_async_retry_wait, settings.llm_min_attempt_seconds)
+    ),
+    wait=_async_retry_wait,
+    retry=retry_if_exception_type(OpenAIError),  # CircuitOpenError and DeadlineExceededError are not retried
     reraise=True
 )
-@openai_breaker
-async def gen_model_async(prompt: str) -> Dict[str, Any]:
+@openai_breaker  # Async-aware: every awaited attempt counts towards the failure rate
+async def gen_model_async(prompt: str, system_message: Optional[str] = None) -> Dict[str, Any]:
     """
     Generate a response using the centralized LLM service asynchronously.
     
     Features:
-    - Circuit breaker: Fails fast if OpenAI API is down
+    - Circuit breaker: Fails fast (no retries) while the LLM API is down
     - Retry logic: Retries up to 3 times with exponential backoff
+    - Deadline: Each attempt is cut off at the request's deadline, and retries
+      are skipped when the remaining budget can't fit another attempt
+    - Scheduling: Bulk work attaches a ``CallScheduler`` to its context; each
+      attempt then waits for a slot (the wait counts against the deadline)
     - Async: Non-blocking for concurrent operations
     
     Args:
         prompt: The prompt to send to the LLM
+        system_message: Optional system message (provider default if omitted)
         
     Returns:
         Dict containing the parsed JSON response
@@ -72,13 +88,30 @@ async def gen_model_async(prompt: str) -> Dict[str, Any]:
     Raises:
         OpenAIError: If the generation fails after retries
         CircuitBreakerError: If circuit is open
+        DeadlineExceededError: If the request's deadline passes
     """
     try:
         llm_service = get_llm_service()
-        result = await llm_service.generate_json_async(prompt)
+        call = llm_service.generate_json_async(prompt, system_message)
+        scheduler = current_call_scheduler()
+        if scheduler is not None:
+            call = scheduler.run(call)
+        deadline = current_deadline()
+        if deadline is not None:
+            result = await deadline.wait_for(call, "LLM call")
+        else:
+            result = await call
         logger.info("Async LLM generation completed successfully")
         return result
         
+    except asyncio.CancelledError:
+        # Request timed out or the client went away; the provider call is aborted
+        metrics.increment("llm_calls_cancelled")
+        raise
+    except DeadlineExceededError:
+        logger.warning("LLM call abandoned: request deadline reached")
+        metrics.increment("llm_calls_deadline_exceeded")
+        raise
     except Exception as e:
         logger.error(f"Error in gen_model_async: {str(e)}")
         logger.debug(f"Prompt preview: {prompt[:200]}...")
@@ -6,7 +6,7 @@ This module provides deterministic career stage detection and industry context a
 
 import logging
 import re
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -395,13 +395,14 @@ def apply_industry_weights(base_weights: Dict[str, float], industry: str) -> Dic
     return adjusted_weights
 
 
-def analyze_context(resume_data: Dict[str, Any], job_description: str) -> Dict[str, Any]:
+def analyze_context(resume_data: Dict[str, Any], job_description: str, industry: Optional[str] = None) -> Dict[str, Any]:
     """
     Analyze career stage and industry context.
     
     Args:
         resume_data: Resume data dictionary
         job_description: Job description text
+        industry: Industry already detected from the job description, if any
         
     Returns:
         Dict: Context analysis with career stage, industry, and years of experience
@@ -416,8 +417,9 @@ def analyze_context(resume_data: Dict[str, Any], job_description: str) -> Dict[s
         # Extract years of experience
         years_of_experience = extract_years_of_experience(work_experience)
         
-        # Detect industry
-        industry = detect_industry(job_description)
+        # Detect industry (unless the job description was preprocessed)
+        if industry is None:
+            industry = detect_industry(job_description)
         
         return {
             'careerStage': career_stage,
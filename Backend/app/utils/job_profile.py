@@ -0,0 +1,278 @@
+"""
+Job-description preprocessing.
+
+Everything here depends only on the job description, so it is computed once
+per posting and reused by every analyzer. The Chrome extension sends the
+same posting over and over, so the profile is cached by posting URL plus a
+hash of the raw description: a repeat request skips sanitization, skill and
+requirement extraction entirely.
+
+The profile's ``compact`` form (requirements summary plus the description
+with benefits, company blurbs and EEO boilerplate removed) is what the
+analyzer prompts receive instead of the raw description.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.cache.redis_cache import redis_cache
+from app.core.config import settings
+from app.utils.context_analyzer import detect_industry
+from app.utils.keyword_engine import JobTerm, extract_job_terms, find_skills, tokenize
+from app.utils.sanitization import sanitize_text
+
+logger = logging.getLogger(__name__)
+
+# Bump when preprocessing changes so cached profiles are rebuilt
+PROFILE_VERSION = "1"
+
+# Headings that switch the context of the lines below them
+_PREFERRED_HEADING_RE = re.compile(
+    r"^(?:preferred|desired|bonus|nice[- ]to[- ]haves?|pluses|additional)\b.*|.*\b(?:nice to have|bonus points|preferred qualifications)\b.*",
+    re.IGNORECASE
+)
+_REQUIRED_HEADING_RE = re.compile(
+    r"^(?:requirements?|required|minimum|basic|must[- ]haves?|qualifications|what you(?:'ll)? (?:need|bring)|"
+    r"what we(?:'re| are) looking for|who you are|you have|skills)\b.*",
+    re.IGNORECASE
+)
+_BOILERPLATE_HEADING_RE = re.compile(
+    r"^(?:benefits|perks|what we offer|why (?:join|work)|about (?:us|the company|the team|[A-Z][\w&.-]*)|who we are|"
+    r"our (?:culture|values|mission|benefits)|equal (?:employment )?opportunity|eeo|diversity|how to apply|"
+    r"compensation and benefits|life at)\b.*",
+    re.IGNORECASE
+)
+MAX_HEADING_WORDS = 6
+
+# Sentences that carry no signal for scoring a resume
+_BOILERPLATE_SENTENCE_RE = re.compile(
+    r"equal opportunity|without regard to|reasonable accommodation|race, color|sexual orientation|"
+    r"\b401\(?k\)?|dental|vision insurance|paid time off|\bpto\b|parental leave|stock options|"
+    r"apply (?:now|today)|click apply|privacy (?:notice|policy)|e-verify|background check",
+    re.IGNORECASE
+)
+_PREFERRED_CUE_RE = re.compile(
+    r"\b(?:prefer(?:red|ably)?|nice[- ]to[- ]have|bonus|a plus|is a plus|are a plus|desired|desirable|ideally)\b",
+    re.IGNORECASE
+)
+_DEGREE_RE = re.compile(
+    r"\b(?:bachelor'?s?|master'?s?|ph\.?d\.?|doctorate|doctoral|associate'?s? degree|b\.?s\.?|m\.?s\.?|"
+    r"b\.?a\.?|m\.?b\.?a\.?|degree|diploma)\b",
+    re.IGNORECASE
+)
+_BULLET_RE = re.compile(r"^\s*(?:[•●▪◦■➢➤►✓✔\-–—*·]|\d{1,2}[.)])\s*")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z])")
+MAX_EDUCATION_CHARS = 240
+
+
+@dataclass
+class JobProfile:
+    """Preprocessed job description shared by the analyzers of every request for it."""
+    # Sanitized description (HTML stripped)
+    description: str
+    # Stripped, lowercased description (the analysis cache key uses it)
+    normalized: str
+    industry: str
+    required_skills: List[str] = field(default_factory=list)
+    preferred_skills: List[str] = field(default_factory=list)
+    # The sentence stating the degree requirement, or "" if none is stated
+    education_requirement: str = ""
+    # Requirements summary plus the description without boilerplate; what prompts receive
+    compact: str = ""
+    # Key terms for the local keyword engine
+    job_terms: List[JobTerm] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JobProfile":
+        values = dict(data)
+        values["job_terms"] = [JobTerm(**term) for term in values.get("job_terms", [])]
+        return cls(**values)
+
+
+def normalize_job_description(job_description: str) -> str:
+    """Normalize a job description so trivially different copies share cache entries."""
+    return job_description.strip().lower()
+
+
+def _is_heading(line: str) -> bool:
+    text = line.strip()
+    return (
+        bool(text)
+        and len(text.split()) <= MAX_HEADING_WORDS
+        and not _BULLET_RE.match(text)
+        and (text.endswith(":") or not text.endswith("."))
+    )
+
+
+def _classify_lines(description: str) -> List[Tuple[str, str]]:
+    """
+    Split the description into sentences tagged ``required``, ``preferred``,
+    ``neutral``, ``heading`` or ``boilerplate``.
+
+    A heading sets the context of the lines below it until the next heading;
+    a preferred cue ("nice to have", "a plus") marks a single sentence as
+    preferred wherever it appears.
+    """
+    tagged: List[Tuple[str, str]] = []
+    context = "neutral"
+    for raw_line in description.splitlines():
+        line = re.sub(r"\s+", " ", raw_line).strip()
+        if not line:
+            continue
+        if _is_heading(line):
+            heading = line.rstrip(":").strip()
+            if _BOILERPLATE_HEADING_RE.match(heading):
+                context = "boilerplate"
+            elif _PREFERRED_HEADING_RE.match(heading):
+                context = "preferred"
+            elif _REQUIRED_HEADING_RE.match(heading):
+                context = "required"
+            else:
+                context = "neutral"
+            tagged.append((line, "boilerplate" if context == "boilerplate" else "heading"))
+            continue
+        for sentence in _SENTENCE_SPLIT_RE.split(line):
+            if context == "boilerplate" or _BOILERPLATE_SENTENCE_RE.search(sentence):
+                tagged.append((sentence, "boilerplate"))
+            elif _PREFERRED_CUE_RE.search(sentence):
+                tagged.append((sentence, "preferred"))
+            else:
+                tagged.append((sentence, context))
+    return tagged
+
+
+def _split_skills(tagged: List[Tuple[str, str]]) -> Tuple[List[str], List[str]]:
+    """Skills named in required/neutral sentences, and those named only in preferred ones."""
+    required: Dict[str, int] = {}
+    preferred: Dict[str, int] = {}
+    for sentence, kind in tagged:
+        if kind in ("boilerplate", "heading"):
+            continue
+        target = preferred if kind == "preferred" else required
+        for skill, count in find_skills(tokenize(sentence)).items():
+            target[skill] = target.get(skill, 0) + count
+    preferred_only = {skill: count for skill, count in preferred.items() if skill not in required}
+
+    def ranked(counts: Dict[str, int]) -> List[str]:
+        return [skill for skill, _ in sorted(counts.items(), key=lambda item: -item[1])]
+
+    return ranked(required), ranked(preferred_only)
+
+
+def _education_requirement(tagged: List[Tuple[str, str]]) -> str:
+    """First non-boilerplate sentence that states a degree requirement."""
+    for sentence, kind in tagged:
+        if kind not in ("boilerplate", "heading") and _DEGREE_RE.search(sentence):
+            text = _BULLET_RE.sub("", sentence).strip()
+            label, sep, rest = text.partition(":")
+            if sep and len(label.split()) <= 3 and not _DEGREE_RE.search(label):
+                text = rest.strip()
+            return text[:MAX_EDUCATION_CHARS]
+    return ""
+
+
+def _compact_text(
+    tagged: List[Tuple[str, str]],
+    required_skills: List[str],
+    preferred_skills: List[str],
+    education: str
+) -> str:
+    """
+    Requirements summary followed by the description's substantive lines.
+
+    Boilerplate and repeated sentences are dropped, bullets are normalized
+    to "- " and whitespace is collapsed.
+    """
+    summary = []
+    if required_skills:
+        summary.append(f"Required skills: {', '.join(required_skills)}")
+    if preferred_skills:
+        summary.append(f"Preferred skills: {', '.join(preferred_skills)}")
+    if education:
+        summary.append(f"Education: {education}")
+
+    body = []
+    # The education sentence is already in the summary
+    seen = {re.sub(r"\W+", " ", education.lower()).strip()} if education else set()
+    for sentence, kind in tagged:
+        if kind == "boilerplate":
+            continue
+        key = re.sub(r"\W+", " ", _BULLET_RE.sub("", sentence).lower()).strip()
+        if not key or key in seen or (education and education.lower() in sentence.lower()):
+            continue
+        seen.add(key)
+        if _BULLET_RE.match(sentence):
+            sentence = f"- {_BULLET_RE.sub('', sentence)}"
+        body.append(sentence)
+
+    # Drop headings left with nothing under them
+    lines = [
+        line for i, line in enumerate(body)
+        if not (_is_heading(line) and (i + 1 == len(body) or _is_heading(body[i + 1])))
+    ]
+    return "\n".join(summary + ([""] if summary else []) + lines)
+
+
+def build_job_profile(job_description: str) -> JobProfile:
+    """
+    Preprocess an already sanitized job description.
+
+    Args:
+        job_description: Job description text
+
+    Returns:
+        JobProfile with normalized text, industry, required and preferred
+        skills, education requirement, compact form and key terms
+    """
+    tagged = _classify_lines(job_description)
+    required_skills, preferred_skills = _split_skills(tagged)
+    education = _education_requirement(tagged)
+    return JobProfile(
+        description=job_description,
+        normalized=normalize_job_description(job_description),
+        industry=detect_industry(job_description),
+        required_skills=required_skills,
+        preferred_skills=preferred_skills,
+        education_requirement=education,
+        compact=_compact_text(tagged, required_skills, preferred_skills, education),
+        job_terms=extract_job_terms(job_description)
+    )
+
+
+async def get_job_profile(raw_description: str, url: Optional[str] = None) -> JobProfile:
+    """
+    Sanitize and preprocess a job description, cached by posting URL and content hash.
+
+    The key covers the raw (unsanitized) text, so a cache hit skips
+    sanitization too; an edited posting at the same URL gets a new entry.
+
+    Args:
+        raw_description: Job description exactly as submitted
+        url: Posting URL, if known
+
+    Returns:
+        The posting's JobProfile
+
+    Raises:
+        ValueError: If the description is too long to sanitize
+    """
+    content_hash = hashlib.sha256(raw_description.encode("utf-8")).hexdigest()
+    cache_key = redis_cache.generate_key("job_profile", url or "", content_hash, PROFILE_VERSION)
+
+    def build() -> Dict[str, Any]:
+        return build_job_profile(sanitize_text(raw_description)).to_dict()
+
+    async def compute() -> Dict[str, Any]:
+        # Regex-heavy CPU work; off the event loop so stages meant to overlap
+        # it (the upload, the PDF parse) really do
+        return await asyncio.to_thread(build)
+
+    data = await redis_cache.get_or_compute(cache_key, compute, ttl=settings.job_profile_cache_ttl_seconds)
+    return JobProfile.from_dict(data)
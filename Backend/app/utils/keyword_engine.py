@@ -0,0 +1,513 @@
+"""
+Local keyword & contextual match engine for V4.
+
+Computes what ``keyword_match_prompt`` asks the LLM to approximate: the job
+description's key terms, how closely the resume matches each of them
+(cosine similarity of character-trigram TF-IDF vectors, computed with
+NumPy) and the exact keyword-stuffing frequency per 100 words. The result
+uses the same JSON structure and scoring rules as the LLM component, with no
+network calls.
+"""
+
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.utils.score_validator import round_to_precision
+
+logger = logging.getLogger(__name__)
+
+MAX_POINTS = 35
+STRONG_MATCH_THRESHOLD = 0.80
+PARTIAL_MATCH_THRESHOLD = 0.65
+STRONG_MATCH_POINTS = 2
+PARTIAL_MATCH_POINTS = 1
+MISSING_KEYWORD_PENALTY = 1
+STUFFING_PENALTY = 2
+STUFFING_FREQUENCY_PER_100 = 3.0
+# Stuffing needs repetition: a term must appear this often, in a resume at
+# least this long, before its frequency counts (otherwise a short input
+# flags every single mention and each match cancels itself)
+STUFFING_MIN_OCCURRENCES = 3
+STUFFING_MIN_RESUME_WORDS = 100
+MAX_PENALTY = MAX_POINTS * 0.4
+
+# Most JD terms considered; more dilutes the score with incidental words
+MAX_JOB_TERMS = 25
+# A non-skill term must appear this often in the JD to count as a keyword
+MIN_TERM_FREQUENCY = 2
+# ...and this often to be critical (missing it costs a point)
+CRITICAL_TERM_FREQUENCY = 3
+
+# Canonical skill -> aliases. Matching on any alias counts as the skill, so
+# "k8s" in a resume satisfies "Kubernetes" in the JD.
+SKILL_SYNONYMS: Dict[str, List[str]] = {
+    "python": [],
+    "java": [],
+    "javascript": ["js", "ecmascript"],
+    "typescript": [],
+    "c++": ["cpp"],
+    "c#": ["csharp", "c sharp"],
+    "golang": ["go lang"],
+    "rust": [],
+    "ruby": [],
+    "ruby on rails": ["rails", "ror"],
+    "php": [],
+    "scala": [],
+    "kotlin": [],
+    "swift": [],
+    "sql": [],
+    "nosql": [],
+    "postgresql": ["postgres", "psql"],
+    "mysql": [],
+    "mongodb": ["mongo"],
+    "redis": [],
+    "elasticsearch": ["elastic search"],
+    "kafka": ["apache kafka"],
+    "spark": ["apache spark", "pyspark"],
+    "airflow": ["apache airflow"],
+    "hadoop": [],
+    "snowflake": [],
+    "dbt": [],
+    "react": ["react.js", "reactjs"],
+    "angular": ["angularjs", "angular.js"],
+    "vue": ["vue.js", "vuejs"],
+    "node.js": ["nodejs", "node"],
+    "django": [],
+    "flask": [],
+    "fastapi": ["fast api"],
+    "spring boot": ["springboot", "spring framework"],
+    ".net": ["dotnet", "asp.net"],
+    "graphql": [],
+    "rest api": ["restful", "restful api", "rest apis", "restful apis"],
+    "microservices": ["microservice", "micro services"],
+    "aws": ["amazon web services"],
+    "azure": ["microsoft azure"],
+    "gcp": ["google cloud", "google cloud platform"],
+    "docker": ["containerization"],
+    "kubernetes": ["k8s"],
+    "terraform": [],
+    "ansible": [],
+    "jenkins": [],
+    "ci/cd": ["cicd", "continuous integration", "continuous delivery", "continuous deployment"],
+    "git": ["github", "gitlab"],
+    "linux": ["unix"],
+    "machine learning": ["ml"],
+    "deep learning": [],
+    "artificial intelligence": ["ai"],
+    "natural language processing": ["nlp"],
+    "computer vision": [],
+    "large language models": ["llm", "llms"],
+    "tensorflow": [],
+    "pytorch": ["torch"],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "pandas": [],
+    "numpy": [],
+    "data analysis": ["data analytics"],
+    "data visualization": [],
+    "tableau": [],
+    "power bi": ["powerbi"],
+    "excel": ["microsoft excel", "ms excel"],
+    "statistics": ["statistical analysis"],
+    "etl": ["data pipelines", "data pipeline"],
+    "agile": ["scrum", "kanban"],
+    "jira": [],
+    "project management": [],
+    "product management": [],
+    "stakeholder management": [],
+    "leadership": ["team leadership"],
+    "communication": ["communication skills"],
+    "problem solving": ["problem-solving"],
+    "unit testing": ["unit tests", "test automation", "automated testing"],
+    "devops": [],
+    "security": ["cybersecurity", "information security"],
+    "figma": [],
+    "ux": ["user experience"],
+    "ui": ["user interface"],
+    "seo": ["search engine optimization"],
+    "salesforce": [],
+    "crm": [],
+}
+
+STOPWORDS = frozenset("""
+a about above across after again against all also an and any are as at be because been before being
+below between both but by can could did do does doing down during each either etc every few for from
+further had has have having he her here hers how i if in into is it its itself just least less like
+may me might more most much must my no nor not of off on once only or other our ours out over own
+per plus same shall she should so some such than that the their them then there these they this
+those through to too under until up upon us very via was we well were what when where which while
+who whom why will with within without would you your yours
+ability able role roles job position candidate candidates applicant team teams work working works
+experience experienced years year strong excellent good great solid proven demonstrated including
+include includes required requirements requirement preferred plus bonus responsibilities
+responsible qualifications qualification skills skill knowledge understanding familiarity
+familiar using use used new across company opportunity opportunities environment looking join
+help ensure build building develop developing support supporting etc e.g i.e based related
+relevant equivalent degree day days time full part level senior junior mid lead minimum
+""".split())
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[./-][a-z0-9+#]+)*")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens that keep technical punctuation (c++, c#, node.js, ci/cd)."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _alias_index() -> Tuple[Dict[Tuple[str, ...], str], int]:
+    """Map each tokenized alias to its canonical skill; also return the longest alias length."""
+    index: Dict[Tuple[str, ...], str] = {}
+    for canonical, aliases in SKILL_SYNONYMS.items():
+        for alias in [canonical, *aliases]:
+            index[tuple(tokenize(alias))] = canonical
+    return index, max(len(key) for key in index)
+
+
+_SKILL_INDEX, _MAX_ALIAS_TOKENS = _alias_index()
+
+
+def flatten_text(value: Any) -> str:
+    """Join every string in a (nested) resume structure into plain text."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, dict):
+        return "\n".join(flatten_text(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return "\n".join(flatten_text(item) for item in value)
+    if value is None:
+        return ""
+    return str(value)
+
+
+def find_skills(tokens: Sequence[str]) -> Counter:
+    """
+    Count known skills in a token stream, preferring the longest alias at each position.
+
+    Returns:
+        Counter of canonical skill -> occurrences
+    """
+    found: Counter = Counter()
+    i = 0
+    while i < len(tokens):
+        for length in range(min(_MAX_ALIAS_TOKENS, len(tokens) - i), 0, -1):
+            canonical = _SKILL_INDEX.get(tuple(tokens[i:i + length]))
+            if canonical:
+                found[canonical] += 1
+                i += length
+                break
+        else:
+            i += 1
+    return found
+
+
+def _is_content_word(token: str) -> bool:
+    return (
+        token not in STOPWORDS
+        and not token.isdigit()
+        and (len(token) >= 3 or any(ch in token for ch in "+#"))
+    )
+
+
+def candidate_terms(tokens: Sequence[str]) -> Counter:
+    """Frequencies of content unigrams and of bigrams made of two content words."""
+    terms: Counter = Counter()
+    previous: Optional[str] = None
+    for token in tokens:
+        if _is_content_word(token):
+            terms[token] += 1
+            if previous is not None:
+                terms[f"{previous} {token}"] += 1
+            previous = token
+        else:
+            previous = None
+    return terms
+
+
+@dataclass
+class JobTerm:
+    """A keyword extracted from the job description."""
+    term: str
+    frequency: int
+    critical: bool
+    is_skill: bool
+
+
+def extract_job_terms(job_description: str, max_terms: int = MAX_JOB_TERMS) -> List[JobTerm]:
+    """
+    Extract the job description's key terms.
+
+    Known skills (via the synonym index) always qualify and are critical.
+    Other content words and bigrams qualify when repeated, ranked by
+    frequency with bigrams favoured; a bigram absorbs its component words.
+
+    Args:
+        job_description: Job description text
+        max_terms: Maximum number of terms to return
+
+    Returns:
+        Terms, skills first, then by descending weight
+    """
+    tokens = tokenize(job_description)
+    skills = find_skills(tokens)
+    terms = [JobTerm(skill, count, True, True) for skill, count in skills.most_common()]
+
+    skill_tokens = {token for skill in skills for alias in [skill, *SKILL_SYNONYMS[skill]] for token in tokenize(alias)}
+    candidates = candidate_terms(tokens)
+    ranked = sorted(
+        (
+            (count * (1.5 if " " in term else 1.0), term, count)
+            for term, count in candidates.items()
+            if count >= MIN_TERM_FREQUENCY and not set(term.split()) <= skill_tokens
+        ),
+        reverse=True
+    )
+
+    taken = set()
+    for _, term, count in ranked:
+        if len(terms) >= max_terms:
+            break
+        words = term.split()
+        if term in taken or (len(words) == 1 and any(term in other.split() for other in taken if " " in other)):
+            continue
+        taken.add(term)
+        terms.append(JobTerm(term, count, count >= CRITICAL_TERM_FREQUENCY, False))
+    return terms[:max_terms]
+
+
+def _trigrams(term: str) -> List[str]:
+    padded = f" {term} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def trigram_similarity(queries: Sequence[str], candidates: Sequence[str]) -> np.ndarray:
+    """
+    Cosine similarity of character-trigram TF-IDF vectors.
+
+    IDF is computed over ``queries + candidates`` so trigrams shared by most
+    terms (common suffixes) weigh less than distinctive ones.
+
+    Returns:
+        Array of shape (len(queries), len(candidates))
+    """
+    if not queries or not candidates:
+        return np.zeros((len(queries), len(candidates)), dtype=np.float32)
+
+    terms = list(queries) + list(candidates)
+    vocabulary: Dict[str, int] = {}
+    rows: List[int] = []
+    cols: List[int] = []
+    for row, term in enumerate(terms):
+        for gram in _trigrams(term):
+            rows.append(row)
+            cols.append(vocabulary.setdefault(gram, len(vocabulary)))
+
+    matrix = np.zeros((len(terms), len(vocabulary)), dtype=np.float32)
+    np.add.at(matrix, (np.asarray(rows), np.asarray(cols)), 1.0)
+
+    document_frequency = np.count_nonzero(matrix, axis=0)
+    idf = np.log((1 + len(terms)) / (1 + document_frequency)) + 1.0
+    matrix *= idf.astype(np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix /= np.where(norms == 0, 1.0, norms)
+
+    return matrix[:len(queries)] @ matrix[len(queries):].T
+
+
+def count_term(tokens: Sequence[str], term: str) -> int:
+    """Exact occurrences of ``term`` (and, for skills, its aliases) in a token stream."""
+    if term in SKILL_SYNONYMS:
+        return find_skills(tokens)[term]
+    words = tuple(term.split())
+    n = len(words)
+    return sum(1 for i in range(len(tokens) - n + 1) if tuple(tokens[i:i + n]) == words)
+
+
+@dataclass
+class KeywordMatchResult:
+    """Outcome of matching one resume against one job description."""
+    strong: List[Dict[str, Any]] = field(default_factory=list)
+    partial: List[Dict[str, Any]] = field(default_factory=list)
+    missing: List[Dict[str, Any]] = field(default_factory=list)
+    stuffing: List[Dict[str, Any]] = field(default_factory=list)
+    term_count: int = 0
+    resume_words: int = 0
+
+
+def match_keywords(
+    resume_text: str,
+    job_description: str,
+    job_terms: Optional[List[JobTerm]] = None
+) -> KeywordMatchResult:
+    """
+    Match the job description's key terms against the resume.
+
+    A term matches with similarity 1.0 if it (or a synonym) occurs in the
+    resume; otherwise its best trigram-cosine similarity against the
+    resume's terms decides between partial, strong and missing.
+
+    Args:
+        resume_text: Plain resume text
+        job_description: Job description text
+        job_terms: The description's key terms if already extracted
+
+    Returns:
+        The classified matches plus stuffing findings
+    """
+    result = KeywordMatchResult()
+    if job_terms is None:
+        job_terms = extract_job_terms(job_description)
+    resume_tokens = tokenize(resume_text)
+    result.term_count = len(job_terms)
+    result.resume_words = len(resume_tokens)
+
+    resume_skills = find_skills(resume_tokens)
+    resume_terms = candidate_terms(resume_tokens)
+
+    similarities: Dict[str, Tuple[float, Optional[str]]] = {}
+    unresolved = []
+    for job_term in job_terms:
+        if job_term.term in resume_skills or job_term.term in resume_terms:
+            similarities[job_term.term] = (1.0, job_term.term)
+        else:
+            unresolved.append(job_term.term)
+
+    if unresolved:
+        candidates = list(resume_terms) + list(resume_skills)
+        scores = trigram_similarity(unresolved, candidates)
+        if candidates:
+            best = scores.argmax(axis=1)
+            for i, term in enumerate(unresolved):
+                similarities[term] = (float(scores[i, best[i]]), candidates[best[i]])
+        else:
+            for term in unresolved:
+                similarities[term] = (0.0, None)
+
+    for job_term in job_terms:
+        similarity, matched = similarities[job_term.term]
+        similarity = round(similarity, 2)
+        if similarity >= STRONG_MATCH_THRESHOLD:
+            result.strong.append({
+                "keyword": job_term.term,
+                "points": STRONG_MATCH_POINTS,
+                "similarity": similarity,
+                "matchedTerm": matched,
+                "status": "Strong Match",
+                "symbol": "✅"
+            })
+        elif similarity >= PARTIAL_MATCH_THRESHOLD:
+            result.partial.append({
+                "keyword": job_term.term,
+                "points": PARTIAL_MATCH_POINTS,
+                "similarity": similarity,
+                "matchedTerm": matched,
+                "status": "Partial Match",
+                "symbol": "⚠️"
+            })
+        elif job_term.critical:
+            result.missing.append({
+                "keyword": job_term.term,
+                "points": -MISSING_KEYWORD_PENALTY,
+                "status": "Missing Critical",
+                "symbol": "❌"
+            })
+
+    if result.resume_words >= STUFFING_MIN_RESUME_WORDS:
+        for match in result.strong:
+            occurrences = count_term(resume_tokens, match["keyword"])
+            if occurrences < STUFFING_MIN_OCCURRENCES:
+                continue
+            frequency = occurrences / result.resume_words * 100
+            if frequency > STUFFING_FREQUENCY_PER_100:
+                result.stuffing.append({
+                    "keyword": match["keyword"],
+                    "points": -STUFFING_PENALTY,
+                    "occurrences": occurrences,
+                    "frequency": f"{frequency:.1f} per 100 words",
+                    "status": "Keyword Stuffing",
+                    "symbol": "🚫"
+                })
+    return result
+
+
+def _rating(points: float) -> Tuple[str, str]:
+    """Rating scale from ``keyword_match_prompt``."""
+    if points >= 30:
+        return "Excellent", "✅"
+    if points >= 24:
+        return "Good", "👍"
+    if points >= 18:
+        return "Fair", "⚠️"
+    if points >= 12:
+        return "Needs Improvement", "🛑"
+    return "Poor", "❌"
+
+
+def _suggestions(result: KeywordMatchResult) -> str:
+    parts = []
+    if result.missing:
+        parts.append("Add evidence of these job requirements where you have them: "
+                     + ", ".join(item["keyword"] for item in result.missing[:8]) + ".")
+    if result.partial:
+        parts.append("Use the job's exact wording for: "
+                     + ", ".join(f"{item['keyword']} (you wrote '{item['matchedTerm']}')" for item in result.partial[:5]) + ".")
+    if result.stuffing:
+        parts.append("Reduce repetition of: "
+                     + ", ".join(item["keyword"] for item in result.stuffing) + "; mention each where it adds context.")
+    return " ".join(parts) or "Strong keyword alignment. Keep key terms tied to concrete results."
+
+
+def score_keyword_match(result: KeywordMatchResult) -> Dict[str, Any]:
+    """
+    Apply the V4 keyword rubric and build the component response.
+
+    Positive points are capped at 35, penalties at 40% of the maximum and
+    applied after the cap, and the score is floored at 0.
+    """
+    positive = min(MAX_POINTS, sum(item["points"] for item in result.strong + result.partial))
+    penalties = min(MAX_PENALTY, -sum(item["points"] for item in result.missing + result.stuffing))
+    points = round_to_precision(max(0.0, positive - penalties), 1)
+
+    matched = len(result.strong) + 0.5 * len(result.partial)
+    match_percentage = round_to_precision(matched / result.term_count * 100, 1) if result.term_count else 0.0
+    rating, symbol = _rating(points)
+
+    return {
+        "score": {
+            "matchPercentage": match_percentage,
+            "pointsAwarded": points,
+            "maxPoints": MAX_POINTS,
+            "rating": rating,
+            "ratingSymbol": symbol
+        },
+        "analysis": {
+            "strongMatches": result.strong,
+            "partialMatches": result.partial,
+            "missingKeywords": result.missing,
+            "keywordStuffing": result.stuffing,
+            "suggestedImprovements": _suggestions(result)
+        }
+    }
+
+
+def analyze_keyword_match_local(
+    resume_input: Any,
+    job_description: str,
+    job_terms: Optional[List[JobTerm]] = None
+) -> Dict[str, Any]:
+    """
+    Score keyword & contextual match locally (no LLM call).
+
+    Args:
+        resume_input: Resume dict (or text) restricted to the sections the
+            keyword component reads
+        job_description: Job description text
+        job_terms: The description's key terms if already extracted
+
+    Returns:
+        Component dict in the same structure as the LLM keyword analysis
+    """
+    return score_keyword_match(match_keywords(flatten_text(resume_input), job_description, job_terms))
@@ -1,17 +1,16 @@
 import logging
 import hashlib
 import time
-from typing import Dict, Any
-
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.runnables import RunnablePassthrough, RunnableLambda
-from langchain_core.output_parsers import JsonOutputParser
+from typing import Dict, Any, Optional
 
 from app.prompts.templates import EXTRACT_SYSTEM_TEMPLATE, EXTRACT_USER_TEMPLATE
-from app.services.llm_service import get_llm_service
+from app.services.openai_model import gen_model_async
 from app.core.config import settings
 from app.core.exceptions import ResumeExtractionError, InvalidResumeContentError
 from app.cache.redis_cache import redis_cache
+from app.core.metrics import metrics
+from app.utils.resume_parser import parse_resume
+from app.utils.token_budget import record_prompt_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -32,39 +31,87 @@ def sanitize_input(text: str, max_length: int = 10000) -> str:
     
     return text[:max_length].strip()
 
-def create_resume_extraction_chain():
+def build_extraction_prompt(resume_text: str) -> str:
     """
-    Create a LangChain chain for resume information extraction.
+    Build the user prompt for resume information extraction.
+    
+    Args:
+        resume_text: Sanitized resume text
     
     Returns:
-        A LangChain chain for processing resume text
+        The extraction prompt
     """
-    llm_service = get_llm_service()
-    
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", EXTRACT_SYSTEM_TEMPLATE),
-        ("user", EXTRACT_USER_TEMPLATE)
-    ])
-    
-    json_parser = JsonOutputParser()
-    
-    chain = (
-        {"resume_text": RunnablePassthrough()}
-        | prompt
-        | llm_service.provider._llm  # Access the internal LLM from provider
-        | RunnableLambda(lambda x: x.content)
-        | RunnableLambda(lambda x: x.replace("```json", "").replace("```", "").strip())
-        | json_parser
-    )
+    return EXTRACT_USER_TEMPLATE.replace("{resume_text}", resume_text)
+
+
+async def _extract_components(resume_text: str) -> Dict[str, Any]:
+    """
+    Run the extraction LLM call on sanitized resume text without caching.
+    
+    Goes through ``gen_model_async`` so the call never blocks the event loop
+    and shares its retry and circuit-breaker protection with the analyzers.
+    
+    Raises:
+        ResumeExtractionError: If the response is not a JSON object
+        OpenAIError: If the LLM call fails after retries
+        CircuitBreakerError: If the circuit is open
+    """
+    logger.info("Starting resume component extraction")
+    start_time = time.time()
+    
+    prompt = build_extraction_prompt(resume_text)
+    record_prompt_tokens("extraction", prompt, EXTRACT_SYSTEM_TEMPLATE)
+    result = await gen_model_async(prompt, system_message=EXTRACT_SYSTEM_TEMPLATE)
+    
+    # Validate result
+    if not isinstance(result, dict):
+        logger.error("Resume extraction returned a non-object response")
+        raise ResumeExtractionError("Failed to extract resume components: response is not a JSON object")
+    
+    # Log successful extraction
+    elapsed = time.time() - start_time
+    logger.info(f"Resume extraction completed in {elapsed:.2f} seconds")
+    
+    return result
+
+
+def _extract_components_local(resume_text: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse the resume with the local section parser when it is enabled and confident.
+    
+    Returns:
+        The parsed resume in ``local`` mode, or in ``auto`` mode when the
+        parser's confidence reaches ``resume_parser_min_confidence``;
+        None when the LLM should extract it instead
+    """
+    mode = settings.resume_parser_mode
+    if mode == "llm":
+        return None
     
-    return chain
+    start_time = time.perf_counter()
+    parsed = parse_resume(resume_text)
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
+    
+    if mode == "local" or parsed.confidence >= settings.resume_parser_min_confidence:
+        metrics.increment("resume_parser_local")
+        logger.info(f"Resume parsed locally in {elapsed_ms:.1f} ms (confidence {parsed.confidence:.2f})")
+        return parsed.data
+    
+    metrics.increment("resume_parser_fallback")
+    missing = [name for name, points in parsed.signals.items() if not points]
+    logger.info(
+        f"Local parse confidence {parsed.confidence:.2f} below "
+        f"{settings.resume_parser_min_confidence:.2f} (missing: {', '.join(missing) or 'none'}); using LLM extraction"
+    )
+    return None
 
-# Create the extraction chain once
-extraction_chain = create_resume_extraction_chain()
 
 async def extract_components_openai(resume_text: str, use_cache: bool = True) -> Dict[str, Any]:
     """
-    Extract structured information from resume text using LangChain with Redis caching.
+    Extract structured information from resume text using the LLM with Redis caching.
+    
+    With ``RESUME_PARSER_MODE`` set to ``local`` or ``auto`` the local section
+    parser runs first and the LLM is only called when it is not confident.
     
     Args:
         resume_text: The text content of the resume
@@ -76,6 +123,7 @@ async def extract_components_openai(resume_text: str, use_cache: bool = True) ->
     Raises:
         InvalidResumeContentError: If resume text is too short or empty
         ResumeExtractionError: If extraction fails
+        OpenAIError: If the LLM call fails after retries
     """
     # Input validation and sanitization
     resume_text = sanitize_input(resume_text)
@@ -84,37 +132,18 @@ async def extract_components_openai(resume_text: str, use_cache: bool = True) ->
         logger.warning("Resume text is too short")
         raise InvalidResumeContentError("Resume text is too short or empty (minimum 50 characters)")
     
-    # Check Redis cache if enabled
-    if use_cache:
-        cache_key = redis_cache.generate_key("resume_extract", resume_text)
-        cached_result = await redis_cache.get(cache_key)
-        
-        if cached_result:
-            logger.info("Cache HIT - Using cached resume components from Redis")
-            return cached_result
+    # Heuristic fast path; skips the LLM call entirely when the layout was understood
+    local_result = _extract_components_local(resume_text)
+    if local_result is not None:
+        return local_result
     
-    # Cache miss - perform extraction
-    logger.info("Cache MISS - Starting resume component extraction")
-    start_time = time.time()
+    if not use_cache:
+        return await _extract_components(resume_text)
     
-    try:
-        result = extraction_chain.invoke(resume_text)
-        
-        # Validate result
-        if not isinstance(result, dict):
-            raise ValueError("Parsed result is not a dictionary")
-        
-        # Cache the result in Redis
-        if use_cache:
-            await redis_cache.set(cache_key, result, ttl=settings.cache_ttl_seconds)
-            logger.info("Cached extraction result in Redis")
-        
-        # Log successful extraction
-        elapsed = time.time() - start_time
-        logger.info(f"Resume extraction completed in {elapsed:.2f} seconds")
-        
-        return result
-        
-    except Exception as e:
-        logger.error(f"Resume extraction failed: {e}", exc_info=True)
-        raise ResumeExtractionError(f"Failed to extract resume components: {str(e)}")
+    # L1/L2 cache lookup; stale entries are refreshed in the background
+    cache_key = redis_cache.generate_key("resume_extract", resume_text)
+    return await redis_cache.get_or_compute(
+        cache_key,
+        lambda: _extract_components(resume_text),
+        ttl=settings.cache_ttl_seconds
+    )
@@ -0,0 +1,272 @@
+"""
+Bounded process pool for PDF text extraction.
+
+PyPDF2 is pure Python and CPU-bound; parsing a large or pathological PDF in the
+request handler blocks the worker's event loop (including /ping and every
+in-flight LLM await). This module runs extraction in separate processes with a
+per-job wall-clock timeout, a per-process memory limit and a cap on queued jobs.
+"""
+
+import asyncio
+import logging
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.cache.redis_cache import redis_cache
+from app.core.config import settings
+from app.core.exceptions import PDFValidationError, PDFProcessingBusyError
+from app.utils.text_extraction import extract_page_range, join_page_texts
+
+logger = logging.getLogger(__name__)
+
+
+def _init_worker(max_memory_bytes: int):
+    """Cap the worker's address space so a hostile PDF fails with MemoryError."""
+    try:
+        import resource
+        import psutil
+
+        # The limit is relative to what the fresh interpreter already maps
+        limit = psutil.Process().memory_info().vms + max_memory_bytes
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError) as e:
+        logger.warning(f"Could not apply PDF worker memory limit: {e}")
+
+
+def _noop() -> None:
+    """Trivial task used to spawn worker processes ahead of the first upload."""
+    return None
+
+
+def _extract_range_in_worker(
+    file_bytes: bytes,
+    start: int,
+    stop: int,
+    char_budget: int
+) -> Tuple[List[str], int]:
+    """Entry point executed inside a pool process for one chunk of pages."""
+    try:
+        return extract_page_range(file_bytes, start, stop, char_budget)
+    except MemoryError:
+        raise PDFValidationError("PDF requires too much memory to process")
+
+
+class PDFExtractionPool:
+    """
+    Process pool wrapper that enforces timeout, memory and queue-depth limits.
+
+    Documents are extracted in chunks of ``pages_per_chunk`` pages. The first
+    chunk also reports the page count; remaining chunks run in parallel waves
+    of ``max_workers`` and extraction stops as soon as ``max_text_length``
+    characters are collected, so later pages are never parsed.
+
+    A job that exceeds its timeout cannot be cancelled inside a running
+    process, so the pool is recycled: its processes are killed and a fresh
+    executor takes over. Jobs from other requests that were running on the
+    killed processes are retried once on the new pool.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        timeout: float,
+        max_memory_mb: int,
+        max_queue_depth: int,
+        pages_per_chunk: int
+    ):
+        self.max_workers = max(1, max_workers)
+        self.pages_per_chunk = max(1, pages_per_chunk)
+        self.timeout = timeout
+        self.max_memory_bytes = max_memory_mb * 1024 * 1024
+        self.max_queue_depth = max(1, max_queue_depth)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+
+        self.completed = 0
+        self.timeouts = 0
+        self.rejected = 0
+        self.recycles = 0
+
+    def start(self):
+        """Create the executor (idempotent)."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.max_memory_bytes,)
+            )
+            # Spawn the processes now so the first upload's timeout doesn't
+            # include interpreter start-up
+            for _ in range(self.max_workers):
+                self._executor.submit(_noop)
+            logger.info(f"PDF extraction pool started with {self.max_workers} workers")
+
+    def shutdown(self):
+        """Stop the executor without waiting for queued jobs."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logger.info("PDF extraction pool stopped")
+
+    def _recycle(self, executor: ProcessPoolExecutor):
+        """Kill ``executor``'s processes and replace it, unless already replaced."""
+        if self._executor is not executor:
+            return
+        # ProcessPoolExecutor has no public API to stop a running task
+        for process in list(getattr(executor, "_processes", {}).values()):
+            process.kill()
+        executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        self.recycles += 1
+        self.start()
+
+    async def extract_text(self, file_bytes: bytes) -> str:
+        """Extract text from a PDF in worker processes (see ``extract``)."""
+        text, _ = await self.extract(file_bytes)
+        return text
+
+    async def extract(self, file_bytes: bytes) -> Tuple[str, int]:
+        """
+        Extract text from a PDF in worker processes.
+
+        Args:
+            file_bytes: PDF file as bytes
+
+        Returns:
+            Tuple of (extracted text, page count of the document)
+
+        Raises:
+            PDFProcessingBusyError: If too many extractions are already queued
+            PDFValidationError: If the PDF is invalid, too slow or too large to parse
+        """
+        if self._pending >= self.max_queue_depth:
+            self.rejected += 1
+            logger.warning(f"PDF extraction queue full ({self._pending} pending)")
+            raise PDFProcessingBusyError("Too many resumes are being processed. Please retry shortly.")
+
+        self._pending += 1
+        try:
+            for attempt in range(2):
+                self.start()
+                executor = self._executor
+                try:
+                    return await asyncio.wait_for(
+                        self._extract_chunked(executor, file_bytes),
+                        timeout=self.timeout
+                    )
+                except asyncio.TimeoutError:
+                    self.timeouts += 1
+                    logger.error(f"PDF extraction timed out after {self.timeout}s; recycling pool")
+                    self._recycle(executor)
+                    raise PDFValidationError(
+                        f"PDF took longer than {self.timeout:g} seconds to process"
+                    )
+                except BrokenProcessPool:
+                    # Killed by another job's timeout or by our own memory limit
+                    self._recycle(executor)
+                    if attempt == 0:
+                        logger.warning("PDF worker died; retrying extraction once")
+                        continue
+                    raise PDFValidationError("PDF could not be processed")
+        finally:
+            self._pending -= 1
+
+    async def _extract_chunked(self, executor: ProcessPoolExecutor, file_bytes: bytes) -> Tuple[str, int]:
+        """Extract page chunks in parallel waves and join the text once."""
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        budget = settings.max_text_length
+
+        def submit(start: int, stop: int, char_budget: int):
+            return loop.run_in_executor(
+                executor, _extract_range_in_worker, file_bytes, start, stop, char_budget
+            )
+
+        page_texts, num_pages = await submit(0, self.pages_per_chunk, budget)
+        collected = sum(len(text) + 1 for text in page_texts)
+
+        last_page = min(num_pages, settings.max_pdf_pages)
+        if num_pages > settings.max_pdf_pages:
+            logger.warning(f"PDF exceeds max page limit: {num_pages} pages")
+
+        next_page = self.pages_per_chunk
+        while next_page < last_page and collected < budget:
+            # Only schedule the pages the remaining budget is likely to need
+            chars_per_page = max(collected / max(len(page_texts), 1), 1)
+            wave_end = min(last_page, next_page + math.ceil((budget - collected) / chars_per_page))
+
+            wave = []
+            for _ in range(self.max_workers):
+                if next_page >= wave_end:
+                    break
+                stop = min(next_page + self.pages_per_chunk, wave_end)
+                wave.append(submit(next_page, stop, budget - collected))
+                next_page = stop
+
+            for chunk_texts, _ in await asyncio.gather(*wave):
+                page_texts.extend(chunk_texts)
+                collected += sum(len(text) + 1 for text in chunk_texts)
+
+        text = join_page_texts(page_texts)
+        self.completed += 1
+        logger.info(
+            f"Successfully extracted text from PDF (Length: {len(text)} chars, "
+            f"Pages: {len(page_texts)}/{num_pages}) in {time.perf_counter() - started:.2f}s"
+        )
+        return text, num_pages
+
+    def stats(self) -> dict:
+        """Return pool counters for health reporting."""
+        return {
+            "workers": self.max_workers,
+            "pending": self._pending,
+            "max_queue_depth": self.max_queue_depth,
+            "completed": self.completed,
+            "timeouts": self.timeouts,
+            "rejected": self.rejected,
+            "recycles": self.recycles
+        }
+
+
+# Global pool shared by all requests in this worker
+pdf_extraction_pool = PDFExtractionPool(
+    max_workers=settings.pdf_pool_workers,
+    timeout=settings.pdf_extraction_timeout_seconds,
+    max_memory_mb=settings.pdf_worker_max_memory_mb,
+    max_queue_depth=settings.pdf_max_queue_depth,
+    pages_per_chunk=settings.pdf_pages_per_chunk
+)
+
+
+async def extract_pdf_text(file_bytes: bytes, content_hash: str) -> Dict[str, Any]:
+    """
+    Extract PDF text through a content-addressed cache.
+
+    Users re-upload the same resume for every job they check; keying on the
+    SHA-256 of the uploaded bytes lets a repeat upload skip parsing entirely.
+
+    Args:
+        file_bytes: PDF file as bytes
+        content_hash: Hex SHA-256 of ``file_bytes`` (computed while reading the upload)
+
+    Returns:
+        Dict with ``text`` and ``pages``
+
+    Raises:
+        PDFProcessingBusyError: If too many extractions are already queued
+        PDFValidationError: If the PDF is invalid, too slow or too large to parse
+    """
+    async def parse() -> Dict[str, Any]:
+        text, pages = await pdf_extraction_pool.extract(file_bytes)
+        return {"text": text, "pages": pages}
+
+    return await redis_cache.get_or_compute(
+        f"pdf_text:{content_hash}",
+        parse,
+        ttl=settings.pdf_text_cache_ttl_seconds
+    )
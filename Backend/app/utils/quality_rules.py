@@ -0,0 +1,465 @@
+"""
+Rule-based resume quality scoring for V4.
+
+Deterministic counterparts of the action words, measurable results and
+bullet effectiveness prompts. Bullets are taken from the extracted Work
+Experience, Projects and Volunteering entries and scored with a compiled
+verb lexicon and metric regexes, following the same criteria, point values
+and response structure as the LLM components (25/25/20 points).
+"""
+
+import logging
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.utils.score_validator import round_to_precision
+
+logger = logging.getLogger(__name__)
+
+ACTION_WORDS_MAX_POINTS = 25
+MEASURABLE_RESULTS_MAX_POINTS = 25
+BULLET_EFFECTIVENESS_MAX_POINTS = 20
+
+BULLET_SECTIONS = ("Work Experience", "Projects", "Volunteering")
+
+# Entry fields that hold metadata rather than bullet text
+METADATA_KEYS = frozenset({
+    "company", "company name", "organization", "organisation", "employer", "institution",
+    "title", "job title", "position", "role", "name", "project name",
+    "dates", "date", "start date", "end date", "duration", "startdate", "enddate",
+    "location", "city", "technologies", "technologies used", "tools", "url", "link",
+})
+
+MIN_BULLET_WORDS = 3
+
+STRONG_VERBS = frozenset("""
+accelerated achieved acquired administered advanced advised analyzed architected automated
+boosted built captured centralized championed coached collaborated completed conceived
+consolidated constructed converted coordinated created cultivated customized cut debugged
+decreased defined delivered deployed designed developed devised diagnosed directed discovered
+doubled drove eliminated enabled engineered enhanced established evaluated executed expanded
+expedited facilitated forecasted formulated founded generated grew guided halved headed
+identified implemented improved increased influenced initiated innovated instituted integrated
+introduced invented launched led leveraged maximized mentored migrated minimized modernized
+monitored negotiated orchestrated organized overhauled owned partnered pioneered planned
+prioritized produced programmed published raised rebuilt recruited redesigned reduced
+refactored reengineered resolved restructured revamped saved scaled secured shipped
+simplified slashed solved spearheaded standardized streamlined strengthened structured
+supervised surpassed taught tested trained transformed tripled troubleshot unified upgraded
+validated won wrote managed authored optimized analyzed
+""".split())
+
+# Present-tense forms of the common verbs (current roles are often written that way)
+STRONG_VERBS_PRESENT = frozenset({
+    "lead", "build", "design", "develop", "drive", "own", "manage", "launch", "deliver",
+    "architect", "automate", "implement", "optimize", "scale", "create", "improve",
+    "increase", "reduce", "mentor", "ship", "spearhead", "establish", "execute", "write",
+})
+
+# British spellings of lexicon verbs
+BRITISH_SPELLINGS = {
+    "optimised": "optimized", "organised": "organized", "prioritised": "prioritized",
+    "standardised": "standardized", "modernised": "modernized", "maximised": "maximized",
+    "minimised": "minimized", "customised": "customized", "centralised": "centralized",
+    "analysed": "analyzed",
+}
+
+WEAK_VERB_REPLACEMENTS = {
+    "assisted": "Partnered on",
+    "assisted with": "Partnered on",
+    "helped": "Enabled",
+    "helped with": "Delivered",
+    "worked on": "Built",
+    "responsible for": "Owned",
+    "was responsible for": "Owned",
+    "supported": "Enabled",
+    "participated in": "Contributed to (with your specific role)",
+    "contributed to": "Delivered (name your part)",
+    "involved in": "Drove (name your part)",
+    "handled": "Managed",
+    "tasked with": "Led",
+    "duties included": "Owned",
+}
+
+CLICHE_REPLACEMENTS = {
+    "team player": "Describe a specific collaboration and its result",
+    "results-driven": "Show a result with a number instead",
+    "results driven": "Show a result with a number instead",
+    "self-starter": "Describe something you initiated",
+    "self starter": "Describe something you initiated",
+    "go-getter": "Describe an outcome you pursued",
+    "dynamic professional": "State your role and specialty",
+    "detail-oriented": "Cite an example of precision (e.g. an error rate)",
+    "detail oriented": "Cite an example of precision (e.g. an error rate)",
+    "fast-paced environment": "Name the pace (e.g. weekly releases)",
+    "think outside the box": "Describe the novel approach you took",
+    "synergy": "Describe the concrete combined outcome",
+    "leverage": "Use",
+    "hard worker": "Show output or impact",
+    "passionate about": "Show evidence of the interest",
+}
+
+OUTCOME_WORDS = frozenset("""
+increased decreased reduced improved grew saved cut boosted accelerated raised lowered
+expanded doubled tripled halved maximized minimized optimized enhanced generated
+eliminated shortened lifted exceeded surpassed increasing reducing improving cutting
+saving growing boosting lowering accelerating optimised optimizing
+""".split())
+
+# Metric patterns, most telling first: percentages, money, "from X to Y"
+# changes, multipliers, scaled quantities, time spans, counts with "+", then
+# other numbers of two or more digits. Years are not metrics.
+_SCALE = r"(?:k|m|mm|b|bn|million|billion|thousand)"
+_METRIC_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"\d+(?:\.\d+)?\s?(?:%|percent\b|pct\b|percentage points\b)",
+        r"[$€£¥₹]\s?\d[\d,.]*(?:\s?" + _SCALE + r"\b)?|\b\d[\d,.]*\s?(?:usd|eur|gbp|dollars)\b",
+        r"\bfrom\s+\S*\d\S*\s+to\s+\S*\d[^\s,;.]*",
+        r"\b\d+(?:\.\d+)?\s?x\b",
+        r"\b\d[\d,.]*\s?" + _SCALE + r"\b",
+        r"\b\d[\d,.]*\s?(?:ms|milliseconds?|seconds?|secs?|minutes?|mins?|hours?|hrs?|days?|weeks?|months?)\b",
+        r"\b\d[\d,]*\+",
+        r"\b(?!(?:19|20)\d{2}\b)\d{2,}(?:,\d{3})*(?:\.\d+)?\b",
+    )
+]
+
+_BULLET_SPLIT_RE = re.compile(r"\s*(?:\n|•|▪|◦|●|;\s+(?=[A-Z]))\s*")
+_LEADING_MARKER_RE = re.compile(r"^[\s\-–—*•▪◦●>]+")
+_WORD_RE = re.compile(r"[A-Za-z][A-Za-z'\-]*")
+
+_WEAK_RE = re.compile(
+    r"\b(" + "|".join(re.escape(p) for p in sorted(WEAK_VERB_REPLACEMENTS, key=len, reverse=True)) + r")\b",
+    re.IGNORECASE
+)
+_CLICHE_RE = re.compile(
+    r"\b(" + "|".join(re.escape(p) for p in sorted(CLICHE_REPLACEMENTS, key=len, reverse=True)) + r")\b",
+    re.IGNORECASE
+)
+
+
+def _split_bullets(text: str) -> List[str]:
+    bullets = []
+    for part in _BULLET_SPLIT_RE.split(text):
+        part = _LEADING_MARKER_RE.sub("", part).strip()
+        if len(part.split()) >= MIN_BULLET_WORDS:
+            bullets.append(part)
+    return bullets
+
+
+def _collect_bullets(value: Any, bullets: List[str], key: Optional[str] = None):
+    if key is not None and key.strip().lower() in METADATA_KEYS:
+        return
+    if isinstance(value, str):
+        bullets.extend(_split_bullets(value))
+    elif isinstance(value, dict):
+        for child_key, child in value.items():
+            _collect_bullets(child, bullets, str(child_key))
+    elif isinstance(value, (list, tuple)):
+        for child in value:
+            _collect_bullets(child, bullets)
+
+
+def extract_bullets(resume_data: Any, sections: Tuple[str, ...] = BULLET_SECTIONS) -> List[str]:
+    """
+    Bullet points from the experience-like sections of extracted resume data.
+
+    Strings under metadata fields (company, title, dates, ...) are skipped;
+    multi-line strings are split on line breaks and bullet glyphs.
+
+    Args:
+        resume_data: Extracted resume dict, or a section value / plain text
+        sections: Sections to read when ``resume_data`` is a full resume dict
+
+    Returns:
+        Bullet texts in document order, duplicates removed
+    """
+    bullets: List[str] = []
+    if isinstance(resume_data, dict) and any(name in resume_data for name in sections):
+        for name in sections:
+            _collect_bullets(resume_data.get(name), bullets)
+    else:
+        _collect_bullets(resume_data, bullets)
+    return list(dict.fromkeys(bullets))
+
+
+def _first_word(bullet: str) -> str:
+    match = _WORD_RE.search(bullet)
+    word = match.group(0).lower() if match else ""
+    return BRITISH_SPELLINGS.get(word, word)
+
+
+def leading_verb(bullet: str) -> Tuple[Optional[str], str]:
+    """
+    Classify how a bullet opens.
+
+    Returns:
+        Tuple of (verb or phrase, kind) where kind is ``strong``, ``weak`` or ``none``
+    """
+    weak = _WEAK_RE.match(_LEADING_MARKER_RE.sub("", bullet))
+    if weak:
+        return weak.group(1).lower(), "weak"
+    word = _first_word(bullet)
+    if word in STRONG_VERBS or word in STRONG_VERBS_PRESENT:
+        return word, "strong"
+    return (word or None), "none"
+
+
+def find_metric(bullet: str) -> Optional[str]:
+    """The first quantified metric in ``bullet``, if any."""
+    for pattern in _METRIC_PATTERNS:
+        match = pattern.search(bullet)
+        if match:
+            return match.group(0).strip()
+    return None
+
+
+def has_outcome_language(bullet: str) -> bool:
+    return any(word.lower() in OUTCOME_WORDS for word in _WORD_RE.findall(bullet))
+
+
+def _rating(points: float, thresholds: Tuple[float, float, float, float]) -> Tuple[str, str]:
+    """Rating scale shared by the quality prompts (Excellent/Good/Fair/Needs Improvement/Poor)."""
+    excellent, good, fair, needs_improvement = thresholds
+    if points >= excellent:
+        return "Excellent", "✅"
+    if points >= good:
+        return "Good", "👍"
+    if points >= fair:
+        return "Fair", "⚠️"
+    if points >= needs_improvement:
+        return "Needs Improvement", "🛑"
+    return "Poor", "❌"
+
+
+def score_action_words(bullets: List[str], full_text: str = "") -> Dict[str, Any]:
+    """
+    Action words component (0-25).
+
+    Each bullet opening with a strong verb earns +1, but a verb only earns
+    points for its first two uses (the rubric rewards variety). Weak openers
+    cost 0.5 and every cliché in ``full_text`` (or the bullets) costs 1.
+    """
+    strong, weak = [], []
+    uses: Counter = Counter()
+    for bullet in bullets:
+        verb, kind = leading_verb(bullet)
+        if kind == "strong":
+            uses[verb] += 1
+            points = 1 if uses[verb] <= 2 else 0
+            strong.append({
+                "bulletPoint": bullet,
+                "actionVerb": verb,
+                "points": points,
+                "status": "Strong Action Word" if points else "Repeated Action Word",
+                "symbol": "✅" if points else "🔁"
+            })
+        elif kind == "weak":
+            weak.append({
+                "bulletPoint": bullet,
+                "actionVerb": verb,
+                "points": -0.5,
+                "suggestedReplacement": WEAK_VERB_REPLACEMENTS.get(verb, "A specific action verb"),
+                "status": "Weak Action Word",
+                "symbol": "⚠️"
+            })
+
+    cliches = [
+        {
+            "phrase": match.group(1),
+            "points": -1,
+            "status": "Cliché/Buzzword",
+            "suggestedReplacement": CLICHE_REPLACEMENTS[match.group(1).lower()],
+            "symbol": "🚫"
+        }
+        for match in _CLICHE_RE.finditer(full_text or "\n".join(bullets))
+    ]
+
+    positive = min(ACTION_WORDS_MAX_POINTS, sum(item["points"] for item in strong))
+    penalty = 0.5 * len(weak) + len(cliches)
+    points = round_to_precision(min(ACTION_WORDS_MAX_POINTS, max(0.0, positive - penalty)), 1)
+    percentage = round_to_precision(len(strong) / len(bullets) * 100, 1) if bullets else 0.0
+    rating, symbol = _rating(points, (20, 15, 10, 5))
+
+    advice = []
+    if weak:
+        advice.append(f"Replace {len(weak)} weak opener(s) such as '{weak[0]['actionVerb']}' with a specific action verb.")
+    repeated = [verb for verb, count in uses.items() if count > 2]
+    if repeated:
+        advice.append(f"Vary repeated verbs: {', '.join(repeated)}.")
+    if cliches:
+        advice.append(f"Remove clichés like '{cliches[0]['phrase']}' and show the quality with evidence.")
+    if bullets and percentage < 70:
+        advice.append("Start every bullet with a strong action verb.")
+
+    return {
+        "score": {
+            "actionVerbPercentage": percentage,
+            "pointsAwarded": points,
+            "maxPoints": ACTION_WORDS_MAX_POINTS,
+            "rating": rating,
+            "ratingSymbol": symbol
+        },
+        "analysis": {
+            "strongActionVerbs": strong,
+            "weakActionVerbs": weak,
+            "clichesAndBuzzwords": cliches,
+            "suggestedImprovements": " ".join(advice) or "Strong, varied action verbs throughout. Keep it up."
+        }
+    }
+
+
+def score_measurable_results(bullets: List[str]) -> Dict[str, Any]:
+    """
+    Measurable results component (0-25).
+
+    Each bullet with a quantified metric earns +2.5 (ten reach the maximum).
+    Outcome language without a number earns partial credit, 0.25 per bullet
+    up to 1 point, and is listed as an opportunity for a metric.
+    """
+    results, opportunities = [], []
+    for bullet in bullets:
+        metric = find_metric(bullet)
+        if metric:
+            results.append({"bulletPoint": bullet, "metric": metric, "points": 2.5, "symbol": "✅"})
+        elif has_outcome_language(bullet):
+            opportunities.append({
+                "bulletPoint": bullet,
+                "suggestion": "Quantify the outcome: by how much, for how many, or how fast?",
+                "symbol": "❌"
+            })
+
+    partial = min(1.0, 0.25 * len(opportunities))
+    points = round_to_precision(min(MEASURABLE_RESULTS_MAX_POINTS, 2.5 * len(results) + partial), 1)
+    rating, symbol = _rating(points, (20, 15, 10, 5))
+
+    if len(results) >= 10:
+        advice = "Well quantified. Keep metrics tied to business outcomes."
+    else:
+        advice = (f"{len(results)} of {len(bullets)} bullets are quantified; aim for about 10. "
+                  "Add percentages, amounts, volumes or time saved to your strongest achievements.")
+
+    return {
+        "score": {
+            "measurableResultsCount": len(results),
+            "pointsAwarded": points,
+            "maxPoints": MEASURABLE_RESULTS_MAX_POINTS,
+            "rating": rating,
+            "ratingSymbol": symbol
+        },
+        "analysis": {
+            "measurableResults": results,
+            "opportunitiesForMetrics": opportunities,
+            "suggestedImprovements": advice
+        }
+    }
+
+
+def score_bullet_effectiveness(bullets: List[str], max_bullets: int = 10) -> Dict[str, Any]:
+    """
+    Bullet effectiveness component (0-20), over the first ``max_bullets`` bullets.
+
+    A bullet is effective (+2) when it has the optimal length (12-20 words or
+    85-120 characters) and opens with an action verb. It is poorly structured
+    (-0.5) when it is too long (over 30 words), too short to show impact
+    (under 8 words without a metric) or opens with a weak phrase. Anything
+    else earns no points.
+    """
+    effective, ineffective = [], []
+    evaluated = bullets[:max_bullets]
+    for bullet in evaluated:
+        words = len(bullet.split())
+        characters = len(bullet)
+        _, kind = leading_verb(bullet)
+        optimal_length = 12 <= words <= 20 or 85 <= characters <= 120
+
+        issues = []
+        if not optimal_length:
+            issues.append(f"{words} words (aim for 12-20)")
+        if kind == "weak":
+            issues.append("opens with a weak phrase")
+        elif kind == "none":
+            issues.append("does not open with an action verb")
+        if not find_metric(bullet) and not has_outcome_language(bullet):
+            issues.append("no clear impact")
+
+        if optimal_length and kind == "strong":
+            effective.append({
+                "bulletPoint": bullet,
+                "wordCount": words,
+                "characterCount": characters,
+                "points": 2,
+                "status": "Effective",
+                "strengths": "Concise and opens with an action verb" + (
+                    "" if "no clear impact" in issues else ", with a clear impact"),
+                "symbol": "✅"
+            })
+            continue
+
+        poorly_structured = words > 30 or kind == "weak" or (words < 8 and not find_metric(bullet))
+        ineffective.append({
+            "bulletPoint": bullet,
+            "wordCount": words,
+            "characterCount": characters,
+            "points": -0.5 if poorly_structured else 0,
+            "status": "Ineffective",
+            "issues": "; ".join(issues),
+            "suggestedRevision": "Rewrite as action verb + task + measurable impact in 12-20 words.",
+            "symbol": "❌"
+        })
+
+    positive = 2 * len(effective)
+    penalty = -sum(item["points"] for item in ineffective)
+    points = round_to_precision(min(BULLET_EFFECTIVENESS_MAX_POINTS, max(0.0, positive - penalty)), 1)
+    percentage = round_to_precision(len(effective) / len(evaluated) * 100, 1) if evaluated else 0.0
+    rating, symbol = _rating(points, (18, 14, 10, 6))
+
+    return {
+        "score": {
+            "effectiveBulletPercentage": percentage,
+            "pointsAwarded": points,
+            "maxPoints": BULLET_EFFECTIVENESS_MAX_POINTS,
+            "rating": rating,
+            "ratingSymbol": symbol
+        },
+        "analysis": {
+            "effectiveBullets": effective,
+            "ineffectiveBullets": ineffective,
+            "suggestedImprovements": (
+                f"{len(effective)} of {len(evaluated)} evaluated bullets are effective. "
+                "Keep bullets to 12-20 words, open with an action verb and end with the result."
+            ) if evaluated else "No bullet points found. Describe each role with 3-6 achievement bullets."
+        }
+    }
+
+
+def _summary_text(resume_data: Any) -> str:
+    """Text the cliché check reads besides the bullets (the summary)."""
+    if isinstance(resume_data, dict):
+        summary = resume_data.get("Professional Summary")
+        return summary if isinstance(summary, str) else ""
+    return ""
+
+
+def analyze_action_words_rules(resume_data: Any) -> Dict[str, Any]:
+    """Action words component scored by rules (no LLM call)."""
+    bullets = extract_bullets(resume_data)
+    return score_action_words(bullets, "\n".join([_summary_text(resume_data), *bullets]))
+
+
+def analyze_measurable_results_rules(resume_data: Any) -> Dict[str, Any]:
+    """Measurable results component scored by rules (no LLM call)."""
+    return score_measurable_results(extract_bullets(resume_data))
+
+
+def analyze_bullet_effectiveness_rules(resume_data: Any) -> Dict[str, Any]:
+    """Bullet effectiveness component scored by rules (no LLM call)."""
+    return score_bullet_effectiveness(extract_bullets(resume_data))
+
+
+RULE_SCORERS = {
+    "action_words": analyze_action_words_rules,
+    "measurable_results": analyze_measurable_results_rules,
+    "bullet_effectiveness": analyze_bullet_effectiveness_rules,
+}
@@ -0,0 +1,445 @@
+"""
+Local resume section parser.
+
+Turns extracted PDF text into the 11-section structure that
+``EXTRACT_USER_TEMPLATE`` asks the LLM for, using heading detection,
+contact regexes, date-range recognition and bullet grouping. It also scores
+its own confidence so callers can fall back to the LLM when the layout was
+not understood.
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SECTION_NAMES = (
+    "Personal Information",
+    "Website/Social Links",
+    "Professional Summary",
+    "Work Experience",
+    "Education",
+    "Certifications",
+    "Awards/Achievements",
+    "Projects",
+    "Skills and Interests",
+    "Volunteering",
+    "Publications",
+)
+
+# Normalized heading text -> section
+HEADING_ALIASES: Dict[str, str] = {}
+for _section, _aliases in {
+    "Professional Summary": [
+        "summary", "professional summary", "profile", "professional profile", "about", "about me",
+        "objective", "career objective", "career summary", "executive summary", "overview",
+    ],
+    "Work Experience": [
+        "experience", "work experience", "professional experience", "employment", "employment history",
+        "work history", "career history", "relevant experience", "industry experience", "experience history",
+        "research experience", "teaching experience",
+    ],
+    "Education": [
+        "education", "academic background", "education and training", "academics", "qualifications",
+        "academic qualifications", "educational background",
+    ],
+    "Certifications": [
+        "certifications", "certification", "certificates", "licenses and certifications",
+        "certifications and licenses", "licenses", "professional certifications",
+    ],
+    "Awards/Achievements": [
+        "awards", "honors", "honours", "achievements", "awards and honors", "honors and awards",
+        "awards and achievements", "accomplishments", "key achievements",
+    ],
+    "Projects": [
+        "projects", "personal projects", "selected projects", "key projects", "academic projects",
+        "side projects", "project experience",
+    ],
+    "Skills and Interests": [
+        "skills", "technical skills", "core competencies", "competencies", "skills and interests",
+        "skills and abilities", "technologies", "tools", "tech stack", "interests", "hobbies",
+        "hobbies and interests", "languages", "key skills", "areas of expertise", "expertise",
+    ],
+    "Volunteering": [
+        "volunteering", "volunteer", "volunteer experience", "volunteer work", "community involvement",
+        "community service", "leadership and volunteering",
+    ],
+    "Publications": ["publications", "papers", "research", "research and publications", "selected publications"],
+    "Website/Social Links": ["links", "online profiles", "profiles", "social"],
+    "Personal Information": ["contact", "contact information", "personal information", "personal details"],
+}.items():
+    for _alias in _aliases:
+        HEADING_ALIASES[_alias] = _section
+
+MAX_HEADING_WORDS = 5
+
+_MONTH = r"(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\.?"
+_DATE = rf"(?:{_MONTH}\s+\d{{4}}|\d{{1,2}}/\d{{4}}|\d{{4}}-\d{{2}}|\d{{4}})"
+DATE_RANGE_RE = re.compile(
+    rf"({_DATE})\s*(?:-|–|—|to|until)\s*({_DATE}|present|current|now|today)",
+    re.IGNORECASE
+)
+SINGLE_DATE_RE = re.compile(rf"\b{_DATE}\b|\b(?:expected|graduat\w*)\s+{_DATE}", re.IGNORECASE)
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+PHONE_RE = re.compile(r"(?:\+?\d{1,3}[\s.-]?)?(?:\(\d{2,4}\)|\d{2,4})[\s.-]?\d{3,4}[\s.-]?\d{3,4}")
+URL_RE = re.compile(
+    r"(?:https?://)?(?:www\.)?(?:linkedin\.com|github\.com|gitlab\.com|behance\.net|dribbble\.com|medium\.com|"
+    r"stackoverflow\.com|twitter\.com|x\.com|kaggle\.com)/[^\s|,;]+|https?://[^\s|,;]+",
+    re.IGNORECASE
+)
+_REGION = r"(?:[A-Z]{2}|USA|UK|Canada|India|Germany|Australia|Remote)"
+LOCATION_RE = re.compile(rf"\b([A-Z][a-zA-Z.]+(?:\s[A-Z][a-zA-Z.]+)*,\s?{_REGION})\b")
+REGION_RE = re.compile(_REGION)
+BULLET_RE = re.compile(r"^\s*(?:[•●▪◦■□➢➤►✓✔\-–—*·]|o\s|\d{1,2}[.)]\s)\s*")
+DEGREE_RE = re.compile(
+    r"\b(?:bachelor|master|associate|doctor|ph\.?d|mba|m\.?b\.?a|b\.?\s?s\.?c?|m\.?\s?s\.?c?|b\.?\s?a\.?|m\.?\s?a\.?|"
+    r"b\.?\s?tech|m\.?\s?tech|b\.?\s?e\.?|m\.?\s?e\.?|b\.?\s?eng|m\.?\s?eng|bba|diploma|high school|ged|a\.?a\.?s?)\b",
+    re.IGNORECASE
+)
+INSTITUTION_RE = re.compile(r"\b(?:university|college|institute|school|academy|polytechnic|conservatory)\b", re.IGNORECASE)
+_SEPARATOR_RE = re.compile(r"\s+(?:\||·|•|—|–|-|@|at)\s+|\s*\|\s*|\t+")
+_SKILL_SPLIT_RE = re.compile(r"\s*(?:,|;|\||•|·|/(?=\s)|\s{3,})\s*")
+
+
+@dataclass
+class ParsedResume:
+    """Parser output: the extraction schema plus how sure the parser is about it."""
+    data: Dict[str, Any]
+    confidence: float
+    signals: Dict[str, float] = field(default_factory=dict)
+
+
+def _normalize_heading(line: str) -> str:
+    text = line.strip().strip(":|-–—•*#").strip().lower()
+    text = text.replace("&", "and")
+    return re.sub(r"[^a-z ]+", "", re.sub(r"\s+", " ", text)).strip()
+
+
+def detect_heading(line: str) -> Optional[str]:
+    """Section a heading line introduces, or None if the line is not a known heading."""
+    if not line.strip() or len(line.split()) > MAX_HEADING_WORDS or BULLET_RE.match(line):
+        return None
+    return HEADING_ALIASES.get(_normalize_heading(line))
+
+
+def split_sections(lines: List[str]) -> Tuple[List[str], Dict[str, List[str]]]:
+    """
+    Group lines under the headings they follow.
+
+    Returns:
+        Tuple of (header lines before the first heading, section -> lines)
+    """
+    header: List[str] = []
+    sections: Dict[str, List[str]] = {}
+    current: Optional[str] = None
+    for line in lines:
+        section = detect_heading(line)
+        if section:
+            current = section
+            sections.setdefault(section, [])
+        elif current is None:
+            header.append(line)
+        else:
+            sections[current].append(line)
+    return header, sections
+
+
+def _is_bullet(line: str) -> bool:
+    return bool(BULLET_RE.match(line))
+
+
+def _strip_bullet(line: str) -> str:
+    return BULLET_RE.sub("", line, count=1).strip()
+
+
+def _find_dates(text: str) -> Tuple[str, str, str]:
+    """Return (dates text, start, end) from a date range, or a single date, in ``text``."""
+    match = DATE_RANGE_RE.search(text)
+    if match:
+        return match.group(0), match.group(1), match.group(2)
+    single = SINGLE_DATE_RE.search(text)
+    if single:
+        return single.group(0), "", single.group(0)
+    return "", "", ""
+
+
+def _header_parts(header_lines: List[str]) -> List[str]:
+    """
+    Split entry header lines into fields, with dates removed.
+
+    Fields are separated by pipes, dashes, bullets or commas; a trailing
+    "City, ST" pair stays together as one field.
+    """
+    parts: List[str] = []
+    for line in header_lines:
+        text = DATE_RANGE_RE.sub(" ", line) if DATE_RANGE_RE.search(line) else SINGLE_DATE_RE.sub(" ", line)
+        for part in _SEPARATOR_RE.split(text):
+            pieces = [piece.strip(" |-–—") for piece in part.split(",")]
+            if len(pieces) >= 2 and REGION_RE.fullmatch(pieces[-1]):
+                pieces = pieces[:-2] + [f"{pieces[-2]}, {pieces[-1]}"]
+            parts.extend(piece for piece in pieces if piece)
+    return parts
+
+
+def _group_entries(lines: List[str]) -> List[Tuple[List[str], List[str]]]:
+    """
+    Group section lines into entries of (header lines, bullet texts).
+
+    A non-bullet line after bullets starts a new entry. Wrapped bullet lines
+    (no marker, lowercase start or previous bullet unfinished) are joined to
+    the previous bullet.
+    """
+    entries: List[Tuple[List[str], List[str]]] = []
+    header: List[str] = []
+    bullets: List[str] = []
+
+    def flush():
+        if header or bullets:
+            entries.append((list(header), list(bullets)))
+
+    for line in lines:
+        if _is_bullet(line):
+            bullets.append(_strip_bullet(line))
+            continue
+        continuation = bullets and (line[:1].islower() or not bullets[-1].rstrip().endswith((".", "%", ")")))
+        if continuation and not DATE_RANGE_RE.search(line) and len(line.split()) > 3 and line[:1].islower():
+            bullets[-1] = f"{bullets[-1]} {line}"
+            continue
+        if bullets:
+            flush()
+            header, bullets = [], []
+        if header and len(header) >= 3 and not DATE_RANGE_RE.search(line):
+            # A long unmarked paragraph under the header reads as description
+            bullets.append(line)
+            continue
+        header.append(line)
+    flush()
+    return entries
+
+
+def _split_title_company(parts: List[str]) -> Tuple[str, str, str]:
+    """Pick (title, company, location) from header fields."""
+    location = ""
+    remaining = []
+    for part in parts:
+        if not location and LOCATION_RE.fullmatch(part.strip()):
+            location = part
+        else:
+            remaining.append(part)
+    title = remaining[0] if remaining else ""
+    company = remaining[1] if len(remaining) > 1 else ""
+    return title, company, location
+
+
+def parse_experience(lines: List[str]) -> List[Dict[str, Any]]:
+    """Work Experience / Volunteering entries with dates and responsibilities."""
+    entries = []
+    for header, bullets in _group_entries(lines):
+        dates, start, end = _find_dates(" ".join(header))
+        title, company, location = _split_title_company(_header_parts(header))
+        if not (title or bullets):
+            continue
+        entries.append({
+            "company": company,
+            "title": title,
+            "dates": dates,
+            "startDate": start,
+            "endDate": end,
+            "location": location,
+            "responsibilities": bullets,
+        })
+    return entries
+
+
+def _education_groups(lines: List[str]) -> List[List[str]]:
+    """Split education lines into entries; a second institution line starts a new entry."""
+    groups: List[List[str]] = []
+    has_institution = False
+    for line in lines:
+        names_institution = bool(INSTITUTION_RE.search(line)) and not _is_bullet(line)
+        if not groups or (names_institution and has_institution):
+            groups.append([])
+            has_institution = False
+        groups[-1].append(line)
+        has_institution = has_institution or names_institution
+    return groups
+
+
+def parse_education(lines: List[str]) -> List[Dict[str, Any]]:
+    """Education entries: institution, degree, field of study, graduation date."""
+    entries = []
+    for text_lines in _education_groups(lines):
+        dates, _, end = _find_dates(" ".join(text_lines))
+        parts = [part for part in _header_parts(text_lines) if not LOCATION_RE.fullmatch(part)]
+        institution = next((part for part in parts if INSTITUTION_RE.search(part)), "")
+        degree_index = next((i for i, part in enumerate(parts) if part != institution and DEGREE_RE.search(part)), None)
+        degree, field_of_study = "", ""
+        if degree_index is not None:
+            degree = parts[degree_index]
+            following = parts[degree_index + 1] if degree_index + 1 < len(parts) else ""
+            if " in " in degree:
+                degree, field_of_study = degree.split(" in ", 1)
+            elif following and following != institution and ":" not in following:
+                field_of_study = following
+        if not (institution or degree):
+            continue
+        entries.append({
+            "institution": institution,
+            "degree": degree.strip(),
+            "fieldOfStudy": field_of_study.strip(),
+            "graduationDate": end or dates,
+        })
+    return entries
+
+
+def parse_projects(lines: List[str]) -> List[Dict[str, Any]]:
+    """Project entries: name, description and technologies."""
+    entries = []
+    for header, bullets in _group_entries(lines):
+        parts = _header_parts(header)
+        technologies = ""
+        description = []
+        for text in bullets + parts[1:]:
+            label, _, rest = text.partition(":")
+            if label.strip().lower() in ("tech", "technologies", "tech stack", "stack", "tools", "built with") and rest:
+                technologies = rest.strip()
+            else:
+                description.append(text)
+        if not parts and not description:
+            continue
+        entries.append({
+            "name": parts[0] if parts else "",
+            "description": " ".join(description),
+            "technologies": technologies,
+            "dates": _find_dates(" ".join(header))[0],
+        })
+    return entries
+
+
+def parse_skills(lines: List[str]) -> List[str]:
+    """Skill items, with category labels ("Languages: ...") removed."""
+    skills: List[str] = []
+    for line in lines:
+        text = _strip_bullet(line)
+        label, sep, rest = text.partition(":")
+        if sep and len(label.split()) <= 4:
+            text = rest
+        for item in _SKILL_SPLIT_RE.split(text):
+            item = item.strip(" .")
+            if item and len(item.split()) <= 6:
+                skills.append(item)
+    return list(dict.fromkeys(skills))
+
+
+def parse_simple_items(lines: List[str], key: str) -> List[Dict[str, Any]]:
+    """One item per line (certifications, awards, publications), with a date if present."""
+    items = []
+    for line in lines:
+        text = _strip_bullet(line)
+        if not text:
+            continue
+        if items and not _is_bullet(line) and text[:1].islower():
+            items[-1][key] = f"{items[-1][key]} {text}"
+            continue
+        dates = _find_dates(text)[0]
+        items.append({key: text.replace(dates, "").strip(" ,|-–—()") if dates else text, "date": dates})
+    return items
+
+
+def parse_contact(header: List[str], text: str) -> Tuple[Dict[str, str], List[str]]:
+    """Name, email, phone and location from the header, plus profile links from anywhere."""
+    email = EMAIL_RE.search(text)
+    phone = next(
+        (m.group(0).strip() for m in PHONE_RE.finditer("\n".join(header) or text)
+         if len(re.sub(r"\D", "", m.group(0))) >= 9 and not DATE_RANGE_RE.search(m.group(0))),
+        ""
+    )
+    links = list(dict.fromkeys(m.group(0).rstrip(".)") for m in URL_RE.finditer(text)))
+
+    name = ""
+    for line in header[:4]:
+        candidate = EMAIL_RE.sub("", URL_RE.sub("", line)).strip(" |,")
+        words = candidate.split()
+        if 2 <= len(words) <= 4 and all(w[:1].isupper() for w in words) and not re.search(r"[\d@]", candidate):
+            name = candidate
+            break
+
+    location = ""
+    for line in header[:6]:
+        for match in LOCATION_RE.finditer(EMAIL_RE.sub("", line)):
+            if match.group(1) != name:
+                location = match.group(1)
+                break
+        if location:
+            break
+
+    return {
+        "name": name,
+        "email": email.group(0) if email else "",
+        "phone": phone,
+        "location": location,
+    }, links
+
+
+def _confidence(data: Dict[str, Any], sections: Dict[str, List[str]], header: List[str], lines: List[str]) -> Tuple[float, Dict[str, float]]:
+    """
+    Weighted evidence that the layout was understood (0-1).
+
+    Experience with dated entries and bullets, a recognizable education
+    entry, contact details and the share of lines that fell under a known
+    heading carry the most weight.
+    """
+    experience = data["Work Experience"]
+    personal = data["Personal Information"]
+    signals = {
+        "name": 0.10 if personal["name"] else 0.0,
+        "email": 0.10 if personal["email"] else 0.0,
+        "phone": 0.05 if personal["phone"] else 0.0,
+        "experience_dated": 0.20 if experience and sum(1 for e in experience if e["dates"]) >= max(1, len(experience) // 2) else 0.0,
+        "experience_bullets": 0.10 if sum(len(e["responsibilities"]) for e in experience) >= 2 else 0.0,
+        "education": 0.15 if any(e["degree"] or e["institution"] for e in data["Education"]) else 0.0,
+        "skills": 0.10 if len(data["Skills and Interests"]) >= 3 else 0.0,
+    }
+    sectioned = sum(len(section_lines) for section_lines in sections.values()) + min(len(header), 8)
+    signals["coverage"] = round(0.20 * min(1.0, sectioned / max(len(lines), 1)), 3)
+    return round(sum(signals.values()), 3), signals
+
+
+def parse_resume(text: str) -> ParsedResume:
+    """
+    Parse resume text into the extraction schema.
+
+    Args:
+        text: Plain text extracted from the resume PDF
+
+    Returns:
+        ParsedResume with the 11-section data (missing sections are empty),
+        a confidence in [0, 1] and the signals behind it
+    """
+    lines = [re.sub(r"\s+", " ", line).strip() for line in text.replace("\r", "\n").split("\n")]
+    lines = [line for line in lines if line]
+    header, sections = split_sections(lines)
+
+    personal, links = parse_contact(header + sections.get("Personal Information", []), text)
+    summary_lines = sections.get("Professional Summary", [])
+
+    data: Dict[str, Any] = {
+        "Personal Information": personal,
+        "Website/Social Links": links,
+        "Professional Summary": " ".join(_strip_bullet(line) for line in summary_lines),
+        "Work Experience": parse_experience(sections.get("Work Experience", [])),
+        "Education": parse_education(sections.get("Education", [])),
+        "Certifications": parse_simple_items(sections.get("Certifications", []), "name"),
+        "Awards/Achievements": parse_simple_items(sections.get("Awards/Achievements", []), "title"),
+        "Projects": parse_projects(sections.get("Projects", [])),
+        "Skills and Interests": parse_skills(sections.get("Skills and Interests", [])),
+        "Volunteering": parse_experience(sections.get("Volunteering", [])),
+        "Publications": parse_simple_items(sections.get("Publications", []), "title"),
+    }
+    # Scored before blanking an empty contact block (the signals read its fields)
+    confidence, signals = _confidence(data, sections, header, lines)
+    if not any(personal.values()):
+        data["Personal Information"] = {}
+    return ParsedResume(data=data, confidence=confidence, signals=signals)
@@ -3,8 +3,21 @@ import bleach
 import re
 from typing import Any, Dict
 
+MAX_TEXT_LENGTH = 50000
 
-def sanitize_text(text: str, max_length: int = 50000) -> str:
+
+def check_text_length(text: str, max_length: int = MAX_TEXT_LENGTH):
+    """
+    Reject text longer than ``max_length`` (the first check of ``sanitize_text``).
+
+    Raises:
+        ValueError: If text exceeds max_length
+    """
+    if len(text) > max_length:
+        raise ValueError(f"Input text exceeds maximum length of {max_length} characters")
+
+
+def sanitize_text(text: str, max_length: int = MAX_TEXT_LENGTH) -> str:
     """
     Sanitize text input by removing potentially dangerous content.
     
@@ -22,8 +35,7 @@ def sanitize_text(text: str, max_length: int = 50000) -> str:
         return ""
     
     # Check length
-    if len(text) > max_length:
-        raise ValueError(f"Input text exceeds maximum length of {max_length} characters")
+    check_text_length(text, max_length)
     
     # Remove HTML tags and potentially dangerous content
     sanitized = bleach.clean(text, tags=[], strip=True)
@@ -34,12 +46,15 @@ def sanitize_text(text: str, max_length: int = 50000) -> str:
     return sanitized.strip()
 
 
-def sanitize_job_data(job_data: Dict[str, Any]) -> Dict[str, Any]:
+def sanitize_job_data(job_data: Dict[str, Any], sanitize_description: bool = True) -> Dict[str, Any]:
     """
     Sanitize job description data.
     
     Args:
         job_data: Job data dictionary
+        sanitize_description: False to only length-check the description
+            and leave it as submitted, for callers that sanitize it later
+            (the cached job profile does, once per posting)
         
     Returns:
         Sanitized job data
@@ -51,7 +66,12 @@ def sanitize_job_data(job_data: Dict[str, Any]) -> Dict[str, Any]:
     
     # Sanitize description (most important field)
     if 'description' in job_data:
-        sanitized['description'] = sanitize_text(job_data['description'])
+        if sanitize_description:
+            sanitized['description'] = sanitize_text(job_data['description'])
+        else:
+            if isinstance(job_data['description'], str):
+                check_text_length(job_data['description'])
+            sanitized['description'] = job_data['description']
     
     # Sanitize other text fields
     for field in ['title', 'company', 'location', 'type']:
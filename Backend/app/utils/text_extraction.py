@@ -1,82 +1,123 @@
 import PyPDF2
 import io
 import logging
-from typing import Union
+from typing import List, Optional, Tuple
 
 from app.core.config import settings
 from app.core.exceptions import PDFValidationError
 
 logger = logging.getLogger(__name__)
 
-def extract_text_from_pdf(file_bytes: bytes) -> str:
+
+def _open_pdf(file_bytes: bytes) -> PyPDF2.PdfReader:
     """
-    Securely extract text from a PDF file.
-    
-    Args:
-        file_bytes: PDF file as bytes
-    
-    Returns:
-        Extracted text from the PDF
-        
+    Validate PDF bytes and open a reader over them.
+
     Raises:
-        PDFValidationError: If PDF is invalid or too large
+        PDFValidationError: If PDF is missing, invalid or too large
     """
     if not file_bytes:
         logger.warning("No file provided for text extraction")
         raise PDFValidationError("No file provided")
 
-    # Convert bytes to BytesIO
-    file_content = io.BytesIO(file_bytes)
-
     # Security: Limit PDF size
     max_file_size = settings.max_pdf_size_mb * 1024 * 1024
-    file_content.seek(0, 2)  # Seek to end
-    file_size = file_content.tell()
-    file_content.seek(0)  # Seek back to start
-
-    if file_size > max_file_size:
-        logger.warning(f"PDF file too large: {file_size} bytes")
+    if len(file_bytes) > max_file_size:
+        logger.warning(f"PDF file too large: {len(file_bytes)} bytes")
         raise PDFValidationError(f"PDF file exceeds maximum size of {settings.max_pdf_size_mb}MB")
 
-    # Create PDF reader
     try:
-        pdf_reader = PyPDF2.PdfReader(file_content)
+        return PyPDF2.PdfReader(io.BytesIO(file_bytes))
     except PyPDF2.errors.PdfReadError as e:
         logger.error(f"PDF reading error: {e}")
         raise PDFValidationError(f"Invalid PDF file: {str(e)}")
 
-    # Validate number of pages
-    max_pages = settings.max_pdf_pages
+
+def extract_page_range(
+    file_bytes: bytes,
+    start: int,
+    stop: Optional[int] = None,
+    char_budget: Optional[int] = None
+) -> Tuple[List[str], int]:
+    """
+    Extract the text of pages ``[start, stop)``, one string per page.
+
+    Pages after the point where ``char_budget`` characters have been collected
+    are skipped without being parsed. ``stop`` is clamped to the document and
+    to ``settings.max_pdf_pages``.
+
+    Args:
+        file_bytes: PDF file as bytes
+        start: First page index (0-based)
+        stop: Page index to stop before (default: end of document)
+        char_budget: Stop once this many characters have been extracted
+
+    Returns:
+        Tuple of (page texts, total page count of the document)
+
+    Raises:
+        PDFValidationError: If PDF is invalid or too large
+    """
+    pdf_reader = _open_pdf(file_bytes)
     num_pages = len(pdf_reader.pages)
-    if num_pages > max_pages:
-        logger.warning(f"PDF exceeds max page limit: {num_pages} pages")
-        # Only process first max_pages
-        pages_to_process = pdf_reader.pages[:max_pages]
-    else:
-        pages_to_process = pdf_reader.pages
-
-    # Extract text with error handling
-    text = ""
-    for page_num, page in enumerate(pages_to_process, 1):
+
+    last_page = min(num_pages, settings.max_pdf_pages)
+    stop = last_page if stop is None else min(stop, last_page)
+    budget = settings.max_text_length if char_budget is None else char_budget
+
+    page_texts: List[str] = []
+    collected = 0
+    for page_index in range(start, stop):
+        if collected >= budget:
+            break
         try:
-            page_text = page.extract_text()
-            text += page_text + "\n"
-            
-            # Limit total text length
-            if len(text) > settings.max_text_length:
-                logger.warning("Truncating extracted text due to length")
-                text = text[:settings.max_text_length]
-                break
+            page_text = pdf_reader.pages[page_index].extract_text() or ""
         except Exception as page_error:
-            logger.error(f"Error extracting text from page {page_num}: {page_error}")
+            logger.error(f"Error extracting text from page {page_index + 1}: {page_error}")
             continue
+        page_texts.append(page_text)
+        collected += len(page_text) + 1
 
-    # Final text processing
-    processed_text = text.strip()
+    return page_texts, num_pages
 
-    # Log successful extraction
-    logger.info(f"Successfully extracted text from PDF (Length: {len(processed_text)} chars, Pages: {len(pages_to_process)})")
 
-    return processed_text
+def join_page_texts(page_texts: List[str]) -> str:
+    """
+    Join per-page text in one pass, capped at ``settings.max_text_length``.
+
+    Args:
+        page_texts: Page texts in document order
+
+    Returns:
+        The combined, stripped text
+    """
+    text = "\n".join(page_texts) + "\n" if page_texts else ""
+    if len(text) > settings.max_text_length:
+        logger.warning("Truncating extracted text due to length")
+        text = text[:settings.max_text_length]
+    return text.strip()
+
+
+def extract_text_from_pdf(file_bytes: bytes) -> str:
+    """
+    Securely extract text from a PDF file.
+
+    Args:
+        file_bytes: PDF file as bytes
 
+    Returns:
+        Extracted text from the PDF
 
+    Raises:
+        PDFValidationError: If PDF is invalid or too large
+    """
+    page_texts, num_pages = extract_page_range(file_bytes, 0)
+    if num_pages > settings.max_pdf_pages:
+        logger.warning(f"PDF exceeds max page limit: {num_pages} pages")
+
+    processed_text = join_page_texts(page_texts)
+
+    # Log successful extraction
+    logger.info(f"Successfully extracted text from PDF (Length: {len(processed_text)} chars, Pages: {len(page_texts)})")
+
+    return processed_text
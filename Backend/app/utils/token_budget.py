@@ -0,0 +1,283 @@
+"""
+Token budgeting for LLM prompts.
+
+Prompts used to interpolate the whole ``resume_data`` dict repr and the raw
+job description with no limit. This module sizes those inputs in tokens
+instead: each V4 component gets the resume sections it actually reads,
+serialized as compact JSON, and when the inputs do not fit the budget the
+job description is trimmed to its share and resume sections are admitted in
+priority order, so low-value sections give way before the ones a rubric needs.
+"""
+
+import asyncio
+import functools
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+TRUNCATION_MARKER = " ... [truncated]"
+
+# Rough ratio used when no tokenizer is available (errs on the long side for English)
+CHARS_PER_TOKEN = 4
+
+# Resume sections each component reads, most valuable first. Sections later
+# in the list are dropped first when the budget is tight. Contact details and
+# links never reach the LLM-scored components.
+COMPONENT_SECTIONS: Dict[str, List[str]] = {
+    "keyword_match": [
+        "Work Experience", "Skills and Interests", "Professional Summary", "Projects",
+        "Certifications", "Education", "Awards/Achievements", "Publications", "Volunteering",
+    ],
+    "action_words": [
+        "Work Experience", "Projects", "Volunteering", "Professional Summary",
+        "Awards/Achievements", "Publications",
+    ],
+    "measurable_results": [
+        "Work Experience", "Projects", "Awards/Achievements", "Volunteering",
+        "Professional Summary", "Publications",
+    ],
+    "bullet_effectiveness": [
+        "Work Experience", "Projects", "Volunteering", "Awards/Achievements",
+    ],
+}
+COMPONENT_SECTIONS["fused"] = COMPONENT_SECTIONS["keyword_match"]
+
+
+@functools.lru_cache(maxsize=1)
+def _encoding():
+    """
+    Tokenizer for the configured model, or None if tiktoken cannot provide one.
+
+    Non-OpenAI models fall back to ``cl100k_base``, which is close enough for
+    budgeting. tiktoken downloads an encoding the first time it is loaded
+    (a blocking HTTP request), unless ``TIKTOKEN_CACHE_DIR`` holds a copy;
+    the app loads it at startup (``load_tokenizer``) so no request pays for
+    that. Offline deployments without a cached copy use the character
+    heuristic.
+    """
+    if settings.tiktoken_cache_dir:
+        # tiktoken reads the variable itself; a value from .env only reaches it this way
+        os.environ.setdefault("TIKTOKEN_CACHE_DIR", settings.tiktoken_cache_dir)
+    try:
+        import tiktoken
+    except ImportError:
+        logger.warning("tiktoken not installed; estimating prompt tokens from length")
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(settings.llm_model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"Could not load tiktoken encoding ({e}); estimating prompt tokens from length")
+        return None
+
+
+async def load_tokenizer() -> str:
+    """
+    Load the tokenizer off the event loop and log which counting mode is active.
+
+    Returns:
+        The encoding name, or ``"estimate"`` when counting by length
+    """
+    encoding = await asyncio.to_thread(_encoding)
+    if encoding is None:
+        logger.warning(
+            f"Prompt token counting: estimating from length ({CHARS_PER_TOKEN} chars per token); "
+            f"set TIKTOKEN_CACHE_DIR to a directory with the encoding for exact counts"
+        )
+        return "estimate"
+    logger.info(f"Prompt token counting: tiktoken '{encoding.name}' for {settings.llm_model}")
+    return encoding.name
+
+
+def count_tokens(text: str) -> int:
+    """Number of tokens in ``text`` (estimated if no tokenizer is available)."""
+    if not text:
+        return 0
+    encoding = _encoding()
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Cut ``text`` to at most ``max_tokens`` tokens, marking the cut.
+
+    Args:
+        text: Text to shorten
+        max_tokens: Token limit including the truncation marker
+
+    Returns:
+        ``text`` unchanged if it fits, otherwise its head plus a marker
+    """
+    if count_tokens(text) <= max_tokens:
+        return text
+    keep = max(0, max_tokens - count_tokens(TRUNCATION_MARKER))
+    encoding = _encoding()
+    if encoding is None:
+        head = text[:keep * CHARS_PER_TOKEN]
+    else:
+        head = encoding.decode(encoding.encode(text, disallowed_special=())[:keep])
+    return head + TRUNCATION_MARKER
+
+
+def compact_json(value: Any) -> str:
+    """Serialize resume data without the whitespace and quoting overhead of ``repr``."""
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def _has_content(value: Any) -> bool:
+    return value not in (None, "", [], {})
+
+
+def fit_resume_sections(
+    resume_data: Dict[str, Any],
+    sections: List[str],
+    max_tokens: int
+) -> Tuple[str, List[str]]:
+    """
+    Serialize the given resume sections within ``max_tokens``.
+
+    Sections are admitted in priority order while they fit. A list section
+    that does not fit keeps as many of its leading entries as do (most recent
+    roles and projects come first); anything else that does not fit is
+    dropped. Empty sections are skipped.
+
+    Args:
+        resume_data: Extracted resume data
+        sections: Section names, most important first
+        max_tokens: Token budget for the serialized sections
+
+    Returns:
+        Tuple of (compact JSON text, names of sections dropped or shortened)
+    """
+    kept: Dict[str, Any] = {}
+    dropped: List[str] = []
+    remaining = max_tokens
+
+    for name in sections:
+        value = resume_data.get(name)
+        if not _has_content(value):
+            continue
+        cost = count_tokens(compact_json({name: value}))
+        if cost <= remaining:
+            kept[name] = value
+            remaining -= cost
+            continue
+
+        dropped.append(name)
+        if not isinstance(value, list):
+            continue
+        entries = []
+        used = count_tokens(compact_json({name: []}))
+        for entry in value:
+            entry_cost = count_tokens(compact_json(entry)) + 1
+            if used + entry_cost > remaining:
+                break
+            entries.append(entry)
+            used += entry_cost
+        if entries:
+            kept[name] = entries
+            remaining -= used
+
+    if not kept:
+        # Not even one entry of the top section fits; cut it instead of sending nothing
+        top = next((name for name in sections if _has_content(resume_data.get(name))), None)
+        if top is not None:
+            kept[top] = resume_data[top]
+
+    # Keep document order so the model reads the resume as written
+    text = compact_json({key: kept[key] for key in resume_data if key in kept})
+    return truncate_to_tokens(text, max_tokens), dropped
+
+
+def split_budget(resume_tokens: int, job_tokens: int, budget: int) -> Tuple[int, int]:
+    """
+    Divide ``budget`` between resume and job description.
+
+    The job description may use up to ``settings.prompt_job_description_share``
+    of the budget, or more if the resume leaves room; the resume gets the rest.
+
+    Returns:
+        Tuple of (resume token budget, job description token budget)
+    """
+    if resume_tokens + job_tokens <= budget:
+        return resume_tokens, job_tokens
+    job_cap = max(int(budget * settings.prompt_job_description_share), budget - resume_tokens)
+    job_budget = min(job_tokens, job_cap)
+    return budget - job_budget, job_budget
+
+
+def budget_component_inputs(
+    component: str,
+    resume_input: Any,
+    job_description: Optional[str] = None
+) -> Tuple[str, Optional[str]]:
+    """
+    Render one component's resume input and job description within the prompt budget.
+
+    Args:
+        component: V4 component name (``COMPONENT_SECTIONS`` decides which
+            sections of a full resume it reads)
+        resume_input: The full resume dict for whole-resume components, or the
+            single section (Education, Work Experience, Skills) the component reads
+        job_description: Job description, or None for resume-only components
+
+    Returns:
+        Tuple of (resume text, job description text or None)
+    """
+    budget = settings.prompt_input_token_budget
+    sections = COMPONENT_SECTIONS.get(component)
+    whole_resume = sections is not None and isinstance(resume_input, dict)
+
+    if whole_resume:
+        resume_text = compact_json({k: v for k, v in resume_input.items() if k in sections and _has_content(v)})
+    else:
+        resume_text = compact_json(resume_input)
+    job_text = job_description or ""
+
+    resume_tokens = count_tokens(resume_text)
+    job_tokens = count_tokens(job_text)
+    resume_budget, job_budget = split_budget(resume_tokens, job_tokens, budget)
+
+    dropped: List[str] = []
+    if resume_tokens > resume_budget:
+        if whole_resume:
+            resume_text, dropped = fit_resume_sections(resume_input, sections, resume_budget)
+        else:
+            resume_text = truncate_to_tokens(resume_text, resume_budget)
+    if job_tokens > job_budget:
+        job_text = truncate_to_tokens(job_text, job_budget)
+
+    if resume_tokens + job_tokens > budget:
+        metrics.increment("prompt_inputs_trimmed")
+        logger.info(
+            f"Trimmed {component} inputs to {budget} tokens "
+            f"(resume {resume_tokens}->{resume_budget}, JD {job_tokens}->{job_budget}, "
+            f"sections dropped or shortened: {dropped or 'none'})"
+        )
+    return resume_text, (job_text if job_description is not None else None)
+
+
+def record_prompt_tokens(component: str, prompt: str, system_message: Optional[str] = None) -> int:
+    """
+    Count a prompt about to be sent and record it in the metrics.
+
+    Returns:
+        The prompt's token count (system message included)
+    """
+    tokens = count_tokens(prompt) + count_tokens(system_message or "")
+    metrics.increment("llm_prompt_tokens_total", tokens)
+    metrics.increment(f"llm_prompt_tokens_{component}", tokens)
+    metrics.increment(f"llm_prompts_{component}")
+    return tokens
@@ -0,0 +1,146 @@
+"""Streaming, size-capped reading of multipart uploads."""
+import hashlib
+import io
+import logging
+import posixpath
+from typing import List, Tuple
+import zipfile
+import zlib
+
+from fastapi import UploadFile
+
+from app.core.exceptions import PDFValidationError, UploadTooLargeError
+
+logger = logging.getLogger(__name__)
+
+# Read uploads in 64 KB chunks
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+PDF_MAGIC = b"%PDF-"
+ZIP_MAGIC = b"PK\x03\x04"
+
+
+async def read_upload(
+    upload: UploadFile,
+    max_bytes: int,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+    magic: bytes = b""
+) -> Tuple[bytes, str]:
+    """
+    Read an uploaded file in chunks, hashing it as it is read.
+
+    Validation happens while streaming so bad uploads are rejected without
+    reading them in full: the magic bytes are checked on the first chunk and
+    reading stops as soon as ``max_bytes`` is exceeded.
+
+    Args:
+        upload: The uploaded file
+        max_bytes: Maximum accepted size in bytes
+        chunk_size: Bytes per read
+        magic: Required file signature (empty to skip the check)
+
+    Returns:
+        Tuple of (file bytes, hex SHA-256 of the bytes)
+
+    Raises:
+        UploadTooLargeError: If the file exceeds ``max_bytes``
+        PDFValidationError: If the file does not start with ``magic``
+    """
+    if upload.size is not None and upload.size > max_bytes:
+        raise UploadTooLargeError(f"File too large ({upload.size} bytes)")
+
+    digest = hashlib.sha256()
+    buffer = bytearray()
+    while True:
+        chunk = await upload.read(chunk_size)
+        if not chunk:
+            break
+
+        if magic and not buffer and len(chunk) < len(magic):
+            # Tiny first read; top it up so the signature check has enough bytes
+            chunk += await upload.read(len(magic) - len(chunk))
+        if magic and not buffer and not chunk.startswith(magic):
+            raise PDFValidationError("Invalid PDF file content")
+
+        if len(buffer) + len(chunk) > max_bytes:
+            logger.warning(f"Upload exceeded {max_bytes} bytes; aborting read")
+            raise UploadTooLargeError(f"File too large (over {max_bytes} bytes)")
+
+        digest.update(chunk)
+        buffer += chunk
+
+    return bytes(buffer), digest.hexdigest()
+
+
+async def read_pdf_upload(upload: UploadFile, max_bytes: int) -> Tuple[bytes, str]:
+    """Read a PDF upload, rejecting non-PDF content on the first chunk."""
+    content, content_hash = await read_upload(upload, max_bytes, magic=PDF_MAGIC)
+    if not content:
+        raise PDFValidationError("Invalid PDF file content")
+    return content, content_hash
+
+
+def unpack_pdf_zip(
+    content: bytes,
+    max_files: int,
+    max_file_bytes: int,
+    max_total_bytes: int
+) -> List[Tuple[str, bytes]]:
+    """
+    Read the PDF entries of a ZIP archive.
+
+    Sizes are checked against the archive's declared entry sizes before
+    anything is decompressed and again while reading, so a zip bomb is
+    rejected without inflating it. Directories, non-PDF entries and macOS
+    resource forks are skipped. CPU-bound; call it in a worker thread.
+
+    When several uploads share one limit, pass what is left of it as
+    ``max_files`` and ``max_total_bytes``.
+
+    Args:
+        content: ZIP file bytes
+        max_files: Maximum number of PDF entries
+        max_file_bytes: Maximum uncompressed size of one entry
+        max_total_bytes: Maximum uncompressed size of all entries together
+
+    Returns:
+        List of (entry file name, PDF bytes) in archive order
+
+    Raises:
+        UploadTooLargeError: If a limit is exceeded
+        PDFValidationError: If the archive cannot be read
+    """
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(content))
+    except zipfile.BadZipFile:
+        raise PDFValidationError("Invalid ZIP file")
+
+    with archive:
+        entries = [
+            info for info in archive.infolist()
+            if not info.is_dir()
+            and info.filename.lower().endswith(".pdf")
+            and not info.filename.startswith("__MACOSX/")
+        ]
+        if len(entries) > max_files:
+            raise UploadTooLargeError(f"Too many resumes (ZIP contains {len(entries)} PDFs, {max(max_files, 0)} allowed)")
+        if any(info.file_size > max_file_bytes for info in entries):
+            raise UploadTooLargeError(f"ZIP entry too large (over {max_file_bytes} bytes)")
+        if sum(info.file_size for info in entries) > max_total_bytes:
+            raise UploadTooLargeError(f"ZIP contents too large (over {max_total_bytes} bytes)")
+
+        files = []
+        total = 0
+        for info in entries:
+            try:
+                with archive.open(info) as entry:
+                    # Declared sizes can lie; never inflate more than the limit
+                    data = entry.read(max_file_bytes + 1)
+            except (zipfile.BadZipFile, zlib.error, EOFError, RuntimeError, NotImplementedError) as e:
+                # Corrupt or encrypted entry
+                raise PDFValidationError(f"Could not read '{info.filename}' from ZIP: {e}")
+            total += len(data)
+            if len(data) > max_file_bytes or total > max_total_bytes:
+                raise UploadTooLargeError("ZIP contents too large")
+            files.append((posixpath.basename(info.filename), data))
+    return files
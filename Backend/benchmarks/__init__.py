@@ -0,0 +1 @@
+# Offline benchmarks; run from the Backend directory, e.g. `python -m benchmarks.bench_pdf_extraction`
@@ -0,0 +1,139 @@
+"""
+Recruiter screening throughput (resumes per minute) against a stub provider.
+
+The corpus is ``--resumes`` PDFs built from the fixture resumes in
+``benchmarks/fixtures/resumes``, each with its own candidate name and project
+numbers in its longer lines (so neither the files nor the analyzer prompts
+repeat), plus ``--duplicates`` exact copies of earlier files (the same
+CV arriving twice from a job board). The job is the senior backend posting.
+
+"sequential" is the old workflow of one ``/api/analyze``-equivalent at a
+time (parse, preprocess the JD, extract, analyze) over ``--baseline``
+resumes, extrapolated to resumes per minute. "screening" runs
+``screen_resumes_v4`` over the whole corpus with the given scheduler limits.
+
+The stub provider sleeps for real (``--time-scale`` 1.0 by default) because
+PDF parsing in the process pool is real work too; the defaults model a
+fast provider so a run takes about a minute.
+
+Usage (from the Backend directory):
+    python -m benchmarks.bench_bulk_screening [--resumes 100] [--duplicates 10]
+        [--llm-concurrency 16] [--calls-per-minute 0]
+"""
+import argparse
+import asyncio
+import hashlib
+import time
+from pathlib import Path
+from typing import List
+
+from app.cache.redis_cache import redis_cache
+from app.core.config import settings
+from app.resume_structure_analysis import bulk_screening
+from app.resume_structure_analysis.bulk_screening import ScreeningFile, screen_resumes_v4
+from app.resume_structure_analysis.resume_analysis_v4 import analyze_resume_v4
+from app.utils.job_profile import build_job_profile
+from app.utils.openai_extraction import extract_components_openai
+from app.utils.pdf_pool import extract_pdf_text, pdf_extraction_pool
+from app.utils.sanitization import sanitize_text
+from benchmarks.bench_extraction_concurrency import install_provider
+from benchmarks.bench_resume_parser import ExtractionAwareProvider
+from benchmarks.synthetic_pdfs import make_text_pdf
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def make_corpus(count: int, duplicates: int) -> List[ScreeningFile]:
+    texts = [path.read_text(encoding="utf-8") for path in sorted((FIXTURES / "resumes").glob("*.txt"))]
+    files = []
+    for index in range(count):
+        lines = texts[index % len(texts)].splitlines()
+        # Distinct content per candidate, so no analyzer call is served from the cache
+        lines = [f"{line} (project {index})" if len(line) > 60 else line for line in lines]
+        pdf = make_text_pdf("\n".join([f"Candidate {index}"] + lines))
+        files.append(ScreeningFile(f"candidate_{index}.pdf", pdf, hashlib.sha256(pdf).hexdigest()))
+    for index in range(duplicates):
+        original = files[index % count]
+        files.append(ScreeningFile(f"duplicate_{index}.pdf", original.content, original.sha256))
+    return files
+
+
+async def run_sequential(files: List[ScreeningFile], description: str) -> float:
+    """Seconds for one-at-a-time analyses of ``files``."""
+    started = time.perf_counter()
+    for upload in files:
+        text = (await extract_pdf_text(upload.content, upload.sha256))["text"]
+        profile = build_job_profile(sanitize_text(description))
+        resume_data = await extract_components_openai(text)
+        await analyze_resume_v4(resume_data, profile.description, job_profile=profile)
+    return time.perf_counter() - started
+
+
+async def run_screening(files: List[ScreeningFile], description: str) -> dict:
+    profile = build_job_profile(sanitize_text(description))
+    async for event in screen_resumes_v4(files, profile):
+        if event["event"] == "done":
+            return event
+    raise RuntimeError("Screening ended without a 'done' event")
+
+
+async def main(args):
+    pdf_extraction_pool.start()
+    description = (FIXTURES / "jobs" / "senior_backend.txt").read_text(encoding="utf-8")
+    files = make_corpus(args.resumes, args.duplicates)
+    provider = ExtractionAwareProvider(
+        {}, args.base, args.input_cost, args.output_cost, args.jitter, args.time_scale, args.seed
+    )
+    install_provider(provider)
+
+    print(
+        f"{len(files)} files ({args.resumes} distinct), parser mode {settings.resume_parser_mode}, "
+        f"{settings.pdf_pool_workers} PDF workers"
+    )
+    print(f"  {'run':<10} {'resumes':>7} {'calls':>6} {'seconds':>8} {'resumes/min':>12}")
+
+    redis_cache._store.clear()
+    provider.reset()
+    baseline = files[:args.baseline]
+    elapsed = await run_sequential(baseline, description)
+    print(f"  {'sequential':<10} {len(baseline):>7} {provider.calls:>6} {elapsed:>8.1f} {len(baseline) / elapsed * 60:>12.1f}")
+
+    redis_cache._store.clear()
+    provider.reset()
+    done = await run_screening(files, description)
+    scheduler = bulk_screening.screening_scheduler()
+    print(
+        f"  {'screening':<10} {len(files):>7} {provider.calls:>6} {done['elapsed_seconds']:>8.1f} "
+        f"{len(files) / done['elapsed_seconds'] * 60:>12.1f}"
+    )
+    print(
+        f"\nScreening: {len(done['ranking'])} ranked, {len(done['failed'])} failed; "
+        f"LLM calls waited {scheduler.waited_seconds / max(scheduler.calls, 1) * 1000:.0f} ms on average "
+        f"(limits: {args.llm_concurrency} in flight, "
+        f"{args.calls_per_minute or 'unlimited'} per minute)"
+    )
+    pdf_extraction_pool.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=100, help="Distinct resumes in the corpus")
+    parser.add_argument("--duplicates", type=int, default=10, help="Exact copies added to the corpus")
+    parser.add_argument("--baseline", type=int, default=10, help="Resumes for the sequential run")
+    parser.add_argument("--llm-concurrency", type=int, default=16, help="SCREENING_LLM_CONCURRENCY")
+    parser.add_argument("--calls-per-minute", type=int, default=0, help="SCREENING_LLM_CALLS_PER_MINUTE (0 = no limit)")
+    parser.add_argument("--resume-concurrency", type=int, default=16, help="SCREENING_RESUME_CONCURRENCY")
+    parser.add_argument("--parser-mode", default="auto", choices=("llm", "local", "auto"), help="RESUME_PARSER_MODE")
+    parser.add_argument("--base", type=float, default=0.15, help="Fixed seconds per call")
+    parser.add_argument("--input-cost", type=float, default=0.00002, help="Seconds per input token")
+    parser.add_argument("--output-cost", type=float, default=0.0005, help="Seconds per output token")
+    parser.add_argument("--jitter", type=float, default=0.25, help="Sigma of the lognormal latency noise")
+    parser.add_argument("--time-scale", type=float, default=1.0, help="Multiply simulated sleeps by this factor")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    settings.screening_llm_concurrency = args.llm_concurrency
+    settings.screening_llm_calls_per_minute = args.calls_per_minute
+    settings.screening_resume_concurrency = args.resume_concurrency
+    settings.resume_parser_mode = args.parser_mode
+    asyncio.run(main(args))
@@ -0,0 +1,93 @@
+"""
+Job-description preprocessing: compaction, build time and cache hits.
+
+For each job description in ``benchmarks/fixtures/jobs`` (real-world shaped
+postings with benefits, company blurbs and EEO boilerplate) reports the
+token count of the raw and compact forms, the cold build time (sanitize +
+preprocess) and the time of a cached ``get_job_profile`` for the same URL
+and text. It then runs a full V4 analysis per posting against the stub
+provider, once with the raw description in the prompts and once with the
+compact form, and compares the prompt tokens recorded in the metrics.
+
+Usage (from the Backend directory):
+    python -m benchmarks.bench_job_profile [--repeat 50]
+"""
+import argparse
+import asyncio
+import dataclasses
+import time
+from pathlib import Path
+from typing import Dict
+
+from app.cache.redis_cache import redis_cache
+from app.core.metrics import metrics
+from app.resume_structure_analysis import resume_analysis_v4
+from app.utils.job_profile import build_job_profile, get_job_profile
+from app.utils.sanitization import sanitize_text
+from app.utils.token_budget import count_tokens
+from benchmarks.bench_extraction_concurrency import install_provider
+from benchmarks.bench_fused_v4 import RESUME_DATA, RecordedProvider
+
+FIXTURES = Path(__file__).parent / "fixtures" / "jobs"
+
+
+def load_fixtures() -> Dict[str, str]:
+    return {path.stem: path.read_text(encoding="utf-8") for path in sorted(FIXTURES.glob("*.txt"))}
+
+
+async def time_cached_lookup(text: str, url: str, repeat: int) -> float:
+    """Mean milliseconds per ``get_job_profile`` once the profile is cached."""
+    await get_job_profile(text, url)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await get_job_profile(text, url)
+    return (time.perf_counter() - started) * 1000 / repeat
+
+
+async def analysis_prompt_tokens(text: str, compact: bool) -> float:
+    """Prompt tokens sent by one uncached V4 analysis."""
+    profile = build_job_profile(sanitize_text(text))
+    if not compact:
+        profile = dataclasses.replace(profile, compact="")
+    redis_cache._store.clear()
+    before = metrics.get("llm_prompt_tokens_total")
+    await resume_analysis_v4._perform_analysis_v4(RESUME_DATA, profile.description, profile)
+    return metrics.get("llm_prompt_tokens_total") - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=50, help="Builds and lookups per fixture for timing")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures()
+    # Latency does not matter here; only the prompts are measured
+    install_provider(RecordedProvider({}, 0.0, 0.0, 0.0, 0.0, 0.0, 7))
+
+    print(f"Job profiles for {len(fixtures)} postings")
+    print(f"  {'posting':<20} {'raw tok':>7} {'compact':>7} {'saved':>6} {'build ms':>9} {'cached ms':>9}")
+    for name, text in fixtures.items():
+        profile = build_job_profile(sanitize_text(text))
+        raw_tokens, compact_tokens = count_tokens(text), count_tokens(profile.compact)
+
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            build_job_profile(sanitize_text(text))
+        build_ms = (time.perf_counter() - started) * 1000 / args.repeat
+        cached_ms = asyncio.run(time_cached_lookup(text, f"https://jobs.example.com/{name}", args.repeat))
+
+        print(
+            f"  {name:<20} {raw_tokens:>7} {compact_tokens:>7} {1 - compact_tokens / raw_tokens:>6.0%} "
+            f"{build_ms:>9.2f} {cached_ms:>9.3f}"
+        )
+
+    print("\nPrompt tokens per V4 analysis (7 LLM components)")
+    print(f"  {'posting':<20} {'raw JD':>7} {'compact':>7} {'saved':>6}")
+    for name, text in fixtures.items():
+        raw = asyncio.run(analysis_prompt_tokens(text, compact=False))
+        compact = asyncio.run(analysis_prompt_tokens(text, compact=True))
+        print(f"  {name:<20} {raw:>7.0f} {compact:>7.0f} {1 - compact / raw:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
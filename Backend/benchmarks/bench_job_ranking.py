@@ -0,0 +1,107 @@
+"""
+One resume against many jobs: batch ranking vs one analysis per job.
+
+"separate" is what a client did before the batch endpoint: per posting,
+extract the resume and run a full V4 analysis (extractions after the first
+hit the cache, as they would for an unchanged PDF). "batch" extracts once
+and runs ``rank_jobs_v4``, which shares the resume-quality analysis across
+jobs and caps concurrent per-job analyses at ``BATCH_JOB_CONCURRENCY``.
+
+The postings are the ``benchmarks/fixtures/jobs`` descriptions repeated to
+``--jobs`` entries (each copy opens with its own requisition number so no
+analysis is served from the cache). LLM calls go to the stub provider from
+``bench_resume_parser`` with extraction forced through the LLM. In fanout
+mode the component cache already dedupes the resume-only prompts across
+jobs; in fused mode those components are part of every job's fused prompt
+unless the batch shares them.
+
+Usage (from the Backend directory):
+    python -m benchmarks.bench_job_ranking [--jobs 20] [--concurrency 8]
+"""
+import argparse
+import asyncio
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from app.cache.redis_cache import redis_cache
+from app.core.config import settings
+from app.resume_structure_analysis.job_ranking import BatchJob, rank_jobs_v4
+from app.resume_structure_analysis.resume_analysis_v4 import analyze_resume_v4
+from app.utils import openai_extraction
+from app.utils.job_profile import build_job_profile
+from benchmarks.bench_extraction_concurrency import install_provider
+from benchmarks.bench_resume_parser import ExtractionAwareProvider
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def load_jobs(count: int) -> List[BatchJob]:
+    texts = [path.read_text(encoding="utf-8") for path in sorted((FIXTURES / "jobs").glob("*.txt"))]
+    jobs = []
+    for index in range(count):
+        profile = build_job_profile(f"This is requisition number {index}.\n{texts[index % len(texts)]}")
+        jobs.append(BatchJob({"title": f"job {index}"}, profile))
+    return jobs
+
+
+async def run_separate(resume_text: str, jobs: List[BatchJob]) -> Dict[str, Any]:
+    started = time.perf_counter()
+
+    async def one(job: BatchJob):
+        resume_data = await openai_extraction.extract_components_openai(resume_text)
+        return await analyze_resume_v4(resume_data, job.profile.description, job_profile=job.profile)
+
+    await asyncio.gather(*(one(job) for job in jobs))
+    return {"total": time.perf_counter() - started, "first": None}
+
+
+async def run_batch(resume_text: str, jobs: List[BatchJob]) -> Dict[str, Any]:
+    started = time.perf_counter()
+    first = None
+    resume_data = await openai_extraction.extract_components_openai(resume_text)
+    async for event in rank_jobs_v4(resume_data, jobs):
+        if first is None:
+            first = time.perf_counter() - started
+    return {"total": time.perf_counter() - started, "first": first}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=20, help="Postings per resume")
+    parser.add_argument("--concurrency", type=int, default=8, help="BATCH_JOB_CONCURRENCY for the batch run")
+    parser.add_argument("--base", type=float, default=0.6, help="Fixed seconds per call")
+    parser.add_argument("--input-cost", type=float, default=0.0002, help="Seconds per input token")
+    parser.add_argument("--output-cost", type=float, default=0.015, help="Seconds per output token")
+    parser.add_argument("--jitter", type=float, default=0.25, help="Sigma of the lognormal latency noise")
+    parser.add_argument("--time-scale", type=float, default=0.02,
+                        help="Multiply simulated sleeps by this factor (results are reported unscaled)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    settings.resume_parser_mode = "llm"
+    settings.batch_job_concurrency = args.concurrency
+    resume_text = (FIXTURES / "resumes" / "backend_engineer.txt").read_text(encoding="utf-8")
+    jobs = load_jobs(args.jobs)
+    provider = ExtractionAwareProvider(
+        {}, args.base, args.input_cost, args.output_cost, args.jitter, args.time_scale, args.seed
+    )
+    install_provider(provider)
+
+    print(f"One resume against {args.jobs} jobs (simulated latency, seconds unscaled)")
+    print(f"  {'V4 mode':<8} {'run':<9} {'calls':>5} {'in tok':>8} {'out tok':>8} {'total':>8} {'first':>8}")
+    for mode in ("fanout", "fused"):
+        settings.v4_analysis_mode = mode
+        for name, run in (("separate", run_separate), ("batch", run_batch)):
+            redis_cache._store.clear()
+            provider.reset()
+            result = asyncio.run(run(resume_text, jobs))
+            first = f"{result['first'] / args.time_scale:>7.2f}s" if result["first"] is not None else f"{'-':>8}"
+            print(
+                f"  {mode:<8} {name:<9} {provider.calls:>5} {provider.input_tokens:>8} {provider.output_tokens:>8} "
+                f"{result['total'] / args.time_scale:>7.2f}s {first}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Throughput of the local keyword engine over many resume/JD pairs.
+
+Synthetic pairs are built from the engine's skill index plus filler text, so
+every run is offline and reproducible (``--seed``). Reports per-pair latency
+(p50/p95), pairs per second on one CPU core, and checks the vectorized
+trigram cosine against a pure-Python reference on a sample of pairs.
+
+Usage (from the Backend directory):
+    python -m benchmarks.bench_keyword_engine [--pairs 500] [--seed 7]
+"""
+import argparse
+import math
+import random
+import statistics
+import time
+from collections import Counter
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.utils import keyword_engine
+from app.utils.keyword_engine import analyze_keyword_match_local, trigram_similarity
+
+FILLER = (
+    "collaborated with cross-functional partners to deliver features on schedule",
+    "owned the roadmap for internal tooling and improved developer productivity",
+    "participated in on-call rotation and wrote postmortems for incidents",
+    "mentored new hires and documented onboarding guides",
+    "worked closely with product managers to refine requirements",
+    "presented quarterly results to leadership and stakeholders",
+)
+JD_FILLER = (
+    "You will design, build and operate services used by millions of customers.",
+    "We value ownership, clear communication and pragmatic engineering.",
+    "The role partners with product, design and data science teams.",
+    "Experience with distributed systems and observability is a plus.",
+    "You will mentor engineers and raise the quality bar across the team.",
+)
+VERBS = ("Built", "Led", "Designed", "Migrated", "Optimized", "Automated", "Shipped", "Scaled")
+
+
+def make_pair(rng: random.Random) -> Tuple[Dict, str]:
+    """One synthetic resume dict and job description with overlapping skills."""
+    skills = list(keyword_engine.SKILL_SYNONYMS)
+    job_skills = rng.sample(skills, rng.randint(6, 14))
+    overlap = rng.sample(job_skills, rng.randint(2, len(job_skills)))
+    resume_skills = overlap + rng.sample(skills, rng.randint(2, 8))
+
+    def mention(skill: str) -> str:
+        aliases = keyword_engine.SKILL_SYNONYMS[skill]
+        return rng.choice(aliases) if aliases and rng.random() < 0.3 else skill
+
+    bullets = [
+        f"{rng.choice(VERBS)} {mention(rng.choice(resume_skills))} services handling "
+        f"{rng.randint(1, 50)}M requests, {rng.choice(FILLER)}"
+        for _ in range(rng.randint(6, 16))
+    ]
+    resume = {
+        "Professional Summary": f"Engineer with {rng.randint(2, 15)} years of experience.",
+        "Work Experience": [
+            {"title": "Software Engineer", "company": f"Company {i}", "responsibilities": bullets[i::3]}
+            for i in range(3)
+        ],
+        "Skills and Interests": [mention(skill) for skill in resume_skills],
+    }
+    sentences = [f"Experience with {', '.join(rng.sample(job_skills, 3))} is required." for _ in range(4)]
+    job_description = " ".join(sentences + rng.sample(JD_FILLER, 3) + [f"Must know {job_skills[0]}."])
+    return resume, job_description
+
+
+def reference_similarity(queries: List[str], candidates: List[str]) -> np.ndarray:
+    """Loop-based TF-IDF trigram cosine, used to check the vectorized version."""
+    terms = queries + candidates
+    grams = [Counter(keyword_engine._trigrams(term)) for term in terms]
+    document_frequency = Counter(gram for counts in grams for gram in counts)
+    idf = {gram: math.log((1 + len(terms)) / (1 + df)) + 1.0 for gram, df in document_frequency.items()}
+    vectors = [{gram: count * idf[gram] for gram, count in counts.items()} for counts in grams]
+    norms = [math.sqrt(sum(v * v for v in vector.values())) or 1.0 for vector in vectors]
+
+    result = np.zeros((len(queries), len(candidates)))
+    for i in range(len(queries)):
+        for j in range(len(candidates)):
+            a, b = vectors[i], vectors[len(queries) + j]
+            dot = sum(weight * b.get(gram, 0.0) for gram, weight in a.items())
+            result[i, j] = dot / (norms[i] * norms[len(queries) + j])
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pairs", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--check", type=int, default=20, help="Pairs compared with the reference cosine")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    pairs = [make_pair(rng) for _ in range(args.pairs)]
+
+    timings = []
+    points = []
+    started = time.perf_counter()
+    for resume, job_description in pairs:
+        t0 = time.perf_counter()
+        result = analyze_keyword_match_local(resume, job_description)
+        timings.append(time.perf_counter() - t0)
+        points.append(result["score"]["pointsAwarded"])
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(timings)
+    print(f"{args.pairs} resume/JD pairs in {elapsed:.2f}s ({args.pairs / elapsed:.0f} pairs/s, one core)")
+    print(f"  per pair: p50 {statistics.median(timings) * 1000:.2f} ms, "
+          f"p95 {ordered[int(0.95 * (len(ordered) - 1))] * 1000:.2f} ms")
+    print(f"  score: mean {statistics.mean(points):.1f}/35, min {min(points)}, max {max(points)}")
+
+    worst = 0.0
+    for resume, job_description in pairs[:args.check]:
+        queries = [term.term for term in keyword_engine.extract_job_terms(job_description)]
+        tokens = keyword_engine.tokenize(keyword_engine.flatten_text(resume))
+        candidates = list(keyword_engine.candidate_terms(tokens))
+        if queries and candidates:
+            diff = np.abs(trigram_similarity(queries, candidates) - reference_similarity(queries, candidates))
+            worst = max(worst, float(diff.max()))
+    print(f"  vectorized vs reference cosine: max abs difference {worst:.2e} over {args.check} pairs")
+
+
+if __name__ == "__main__":
+    main()
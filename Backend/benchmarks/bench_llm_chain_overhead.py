@@ -0,0 +1,101 @@
+"""
+Measure the per-call overhead of the provider JSON chain with a fake chat model.
+
+Compares:
+- rebuild: the previous behaviour; every call re-creates the prompt template
+  and the fence-stripping lambda, then re-composes the chain
+- cached: ``BaseLLMProvider.generate_json(_async)``, which reuses one compiled
+  chain per system message
+
+The fake model answers instantly, so the timings are pure LangChain/app overhead.
+
+Usage (from the Backend directory):
+    python -m benchmarks.bench_llm_chain_overhead [--calls 2000]
+"""
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableLambda
+
+from app.services.llm_providers import BaseLLMProvider, DEFAULT_SYSTEM_MESSAGE
+
+FAKE_RESPONSE = '```json\n{"score": {"pointsAwarded": 12}, "analysis": {"matches": ["python", "aws"]}}\n```'
+PROMPT = "Given the job description and the resume text, score the keyword match. " * 20
+
+
+class FakeProvider(BaseLLMProvider):
+    """Provider backed by LangChain's FakeListChatModel."""
+
+    def __init__(self):
+        super().__init__(api_key="", model="fake", temperature=0.0, max_tokens=0, timeout=0.0)
+        self._llm = FakeListChatModel(responses=[FAKE_RESPONSE])
+
+    @property
+    def provider_name(self) -> str:
+        return "fake"
+
+
+def rebuild_chain(provider: FakeProvider, system_message: Optional[str] = None):
+    """The pre-cache per-call chain construction, kept as a reference point."""
+    prompt_template = ChatPromptTemplate.from_messages([
+        ("system", system_message or DEFAULT_SYSTEM_MESSAGE),
+        ("user", "{input}")
+    ])
+    clean_json = RunnableLambda(lambda x: x.content.replace("```json", "").replace("```", "").strip())
+    return prompt_template | provider._llm | clean_json | JsonOutputParser()
+
+
+def rebuild_generate(provider: FakeProvider, prompt: str) -> Dict[str, Any]:
+    return rebuild_chain(provider).invoke({"input": prompt})
+
+
+async def rebuild_generate_async(provider: FakeProvider, prompt: str) -> Dict[str, Any]:
+    return await rebuild_chain(provider).ainvoke({"input": prompt})
+
+
+def time_sync(fn, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - started) / calls
+
+
+async def time_async(fn, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        await fn()
+    return (time.perf_counter() - started) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    provider = FakeProvider()
+    assert provider.generate_json(PROMPT) == rebuild_generate(provider, PROMPT)
+
+    # Compose-only cost, then full sync and async calls
+    rows = [
+        ("compose only", time_sync(lambda: rebuild_chain(provider), args.calls),
+         time_sync(lambda: provider._get_chain(), args.calls)),
+        ("invoke", time_sync(lambda: rebuild_generate(provider, PROMPT), args.calls),
+         time_sync(lambda: provider.generate_json(PROMPT), args.calls)),
+        ("ainvoke", asyncio.run(time_async(lambda: rebuild_generate_async(provider, PROMPT), args.calls)),
+         asyncio.run(time_async(lambda: provider.generate_json_async(PROMPT), args.calls))),
+    ]
+
+    print(f"Per-call overhead over {args.calls} calls (fake model)")
+    print(f"{'':<14}{'rebuild (us)':>14}{'cached (us)':>14}{'saved':>8}")
+    for label, rebuild, cached in rows:
+        saved = (1 - cached / rebuild) * 100 if rebuild else 0.0
+        print(f"{label:<14}{rebuild * 1e6:>14.1f}{cached * 1e6:>14.1f}{saved:>7.0f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark PDF text extraction over a corpus of synthetic multi-page PDFs.
+
+Compares:
+- baseline: the previous page-by-page loop with ``text += page`` and ``len(text)``
+  after every page
+- linear: ``extract_text_from_pdf`` (per-page list, single join, early stop)
+- pool: ``PDFExtractionPool`` extracting page chunks in parallel processes
+
+Usage (from the Backend directory):
+    python -m benchmarks.bench_pdf_extraction [--repeat 3]
+"""
+import argparse
+import asyncio
+import io
+import statistics
+import time
+
+import PyPDF2
+
+from app.core.config import settings
+from app.utils.pdf_pool import PDFExtractionPool
+from app.utils.text_extraction import extract_text_from_pdf
+from benchmarks.synthetic_pdfs import make_pdf
+
+PAGE_COUNTS = (1, 2, 5, 20, 50, 100)
+
+
+def baseline_extract(file_bytes: bytes) -> str:
+    """The pre-engine algorithm, kept here only as a reference point."""
+    reader = PyPDF2.PdfReader(io.BytesIO(file_bytes))
+    text = ""
+    for page in reader.pages[:settings.max_pdf_pages]:
+        text += page.extract_text() + "\n"
+        if len(text) > settings.max_text_length:
+            text = text[:settings.max_text_length]
+            break
+    return text.strip()
+
+
+def time_sync(fn, payload: bytes, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(payload)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+async def time_pool(pool: PDFExtractionPool, payload: bytes, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await pool.extract_text(payload)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+async def main(repeat: int, workers: int):
+    pool = PDFExtractionPool(
+        max_workers=workers,
+        timeout=120,
+        max_memory_mb=1024,
+        max_queue_depth=4,
+        pages_per_chunk=settings.pdf_pages_per_chunk
+    )
+    pool.start()
+    for _ in range(workers):  # let worker processes finish spawning
+        await pool.extract_text(make_pdf(1))
+
+    print(f"max_text_length={settings.max_text_length} workers={workers} repeat={repeat}")
+    print(f"{'pages':>6} {'size KB':>8} {'baseline s':>11} {'linear s':>9} {'pool s':>8} {'chars':>8}")
+    for pages in PAGE_COUNTS:
+        payload = make_pdf(pages)
+        text = extract_text_from_pdf(payload)
+        assert text == baseline_extract(payload) or len(text) >= settings.max_text_length - 1
+        baseline = time_sync(baseline_extract, payload, repeat)
+        linear = time_sync(extract_text_from_pdf, payload, repeat)
+        pooled = await time_pool(pool, payload, repeat)
+        print(f"{pages:>6} {len(payload) / 1024:>8.0f} {baseline:>11.3f} {linear:>9.3f} {pooled:>8.3f} {len(text):>8}")
+
+    pool.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=settings.pdf_pool_workers)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat, args.workers))
@@ -0,0 +1,47 @@
+"""
+Throughput of the rule-based resume quality scorers.
+
+Scores synthetic resumes (see ``bench_keyword_engine.make_pair``) with the
+action words, measurable results and bullet effectiveness rules and reports
+per-resume latency for each component and overall bullets per second, all
+offline on one CPU core.
+
+Usage (from the Backend directory):
+    python -m benchmarks.bench_quality_rules [--resumes 2000] [--seed 7]
+"""
+import argparse
+import random
+import statistics
+import time
+
+from app.utils.quality_rules import RULE_SCORERS, extract_bullets
+from benchmarks.bench_keyword_engine import make_pair
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    resumes = [make_pair(rng)[0] for _ in range(args.resumes)]
+    bullets = sum(len(extract_bullets(resume)) for resume in resumes)
+
+    print(f"{args.resumes} resumes, {bullets} bullets ({bullets / args.resumes:.1f} per resume)")
+    total = 0.0
+    for component, scorer in RULE_SCORERS.items():
+        timings = []
+        for resume in resumes:
+            started = time.perf_counter()
+            scorer(resume)
+            timings.append(time.perf_counter() - started)
+        total += sum(timings)
+        ordered = sorted(timings)
+        print(f"  {component:<21} p50 {statistics.median(timings) * 1e6:7.1f} us  "
+              f"p95 {ordered[int(0.95 * (len(ordered) - 1))] * 1e6:7.1f} us")
+    print(f"  all three: {args.resumes / total:,.0f} resumes/s, {bullets * len(RULE_SCORERS) / total:,.0f} bullet scorings/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Local resume section parser vs LLM extraction on a fixture corpus.
+
+Fixtures are plain-text resumes in ``benchmarks/fixtures/resumes`` covering
+common layouts (pipes, em dashes, comma headers, education first, an academic
+CV, one with no contact details at all) plus a heading-less two-column export
+that the parser should hand to the LLM. For each fixture the benchmark reports the local parse time and
+confidence, then runs extraction + V4 analysis end to end with
+``RESUME_PARSER_MODE`` set to ``llm``, ``auto`` and ``local``.
+
+LLM calls go to the stub provider from ``bench_fused_v4`` (token-based
+latency model); the stubbed extraction answers with the local parse so its
+output size is realistic. ``--live`` instead calls the configured provider
+once per fixture and compares its extraction with the local parse section by
+section (costs real API calls).
+
+Usage (from the Backend directory):
+    python -m benchmarks.bench_resume_parser [--runs 5] [--repeat 200] [--live]
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.cache.redis_cache import redis_cache
+from app.core.config import settings
+from app.resume_structure_analysis import resume_analysis_v4
+from app.utils import openai_extraction
+from app.utils.resume_parser import SECTION_NAMES, parse_resume
+from benchmarks.bench_extraction_concurrency import install_provider
+from benchmarks.bench_fused_v4 import JOB_DESCRIPTION, RecordedProvider, percentile
+
+FIXTURES = Path(__file__).parent / "fixtures" / "resumes"
+_RESUME_TEXT_MARKER = "Resume text: "
+
+
+class ExtractionAwareProvider(RecordedProvider):
+    """Recorded provider that also answers the extraction prompt (with the local parse)."""
+
+    def _respond(self, prompt: str) -> Dict[str, Any]:
+        if _RESUME_TEXT_MARKER in prompt and "Extract the following information" in prompt:
+            resume_text = prompt.split(_RESUME_TEXT_MARKER, 1)[1].rsplit("\n\nImportant:", 1)[0]
+            return parse_resume(resume_text).data
+        return super()._respond(prompt)
+
+
+def load_fixtures() -> Dict[str, str]:
+    return {path.stem: path.read_text(encoding="utf-8") for path in sorted(FIXTURES.glob("*.txt"))}
+
+
+def time_local_parse(text: str, repeat: int) -> float:
+    """Mean milliseconds per ``parse_resume`` call."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        parse_resume(text)
+    return (time.perf_counter() - started) * 1000 / repeat
+
+
+async def run_mode(provider: RecordedProvider, mode: str, texts: List[str], runs: int) -> Dict[str, Any]:
+    settings.resume_parser_mode = mode
+    provider.reset()
+    timings = []
+    for _ in range(runs):
+        for text in texts:
+            redis_cache._store.clear()
+            started = time.perf_counter()
+            resume_data = await openai_extraction.extract_components_openai(text)
+            await resume_analysis_v4._perform_analysis_v4(resume_data, JOB_DESCRIPTION)
+            timings.append((time.perf_counter() - started) / provider.time_scale)
+    analyses = runs * len(texts)
+    return {
+        "calls": provider.calls / analyses,
+        "p50": statistics.median(timings),
+        "p95": percentile(timings, 95),
+    }
+
+
+def _entry_count(value: Any) -> int:
+    if isinstance(value, (list, dict)):
+        return len(value)
+    return 1 if value else 0
+
+
+async def compare_live(fixtures: Dict[str, str]):
+    """Compare the local parse with the configured provider's extraction, section by section."""
+    for name, text in fixtures.items():
+        llm_data = await openai_extraction._extract_components(openai_extraction.sanitize_input(text))
+        local_data = parse_resume(text).data
+        print(f"  {name}")
+        for section in SECTION_NAMES:
+            llm_count, local_count = _entry_count(llm_data.get(section)), _entry_count(local_data.get(section))
+            flag = "" if (llm_count > 0) == (local_count > 0) else "  <- differs"
+            print(f"    {section:<22} llm {llm_count:>2}  local {local_count:>2}{flag}")
+        llm_person = llm_data.get("Personal Information") or {}
+        local_person = local_data.get("Personal Information") or {}
+        for field in ("name", "email", "phone"):
+            llm_value = str(llm_person.get(field, "")).strip().lower() if isinstance(llm_person, dict) else ""
+            local_value = str(local_person.get(field, "")).strip().lower()
+            print(f"    {field:<22} {'match' if llm_value == local_value else f'llm {llm_value!r} vs local {local_value!r}'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="End-to-end passes over the corpus per mode")
+    parser.add_argument("--repeat", type=int, default=200, help="Local parses per fixture for timing")
+    parser.add_argument("--base", type=float, default=0.6, help="Fixed seconds per call")
+    parser.add_argument("--input-cost", type=float, default=0.0002, help="Seconds per input token")
+    parser.add_argument("--output-cost", type=float, default=0.015, help="Seconds per output token")
+    parser.add_argument("--jitter", type=float, default=0.25, help="Sigma of the lognormal latency noise")
+    parser.add_argument("--time-scale", type=float, default=0.02,
+                        help="Multiply simulated sleeps by this factor (results are reported unscaled)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--live", action="store_true", help="Compare against the configured provider instead")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures()
+    threshold = settings.resume_parser_min_confidence
+
+    print(f"Local parser on {len(fixtures)} fixtures (auto mode accepts confidence >= {threshold:.2f})")
+    print(f"  {'fixture':<22} {'ms':>6} {'conf':>5}  path")
+    for name, text in fixtures.items():
+        parsed = parse_resume(text)
+        path = "local" if parsed.confidence >= threshold else "LLM fallback"
+        print(f"  {name:<22} {time_local_parse(text, args.repeat):>6.2f} {parsed.confidence:>5.2f}  {path}")
+
+    if args.live:
+        print("\nLocal parse vs live LLM extraction")
+        asyncio.run(compare_live(fixtures))
+        return
+
+    provider = ExtractionAwareProvider(
+        {}, args.base, args.input_cost, args.output_cost, args.jitter, args.time_scale, args.seed
+    )
+    install_provider(provider)
+
+    print(f"\nExtraction + V4 analysis, {args.runs} passes per mode (simulated latency, seconds unscaled)")
+    print(f"  {'mode':<6} {'calls':>5} {'p50':>7} {'p95':>7}")
+    for mode in ("llm", "auto", "local"):
+        result = asyncio.run(run_mode(provider, mode, list(fixtures.values()), args.runs))
+        print(f"  {mode:<6} {result['calls']:>5.1f} {result['p50']:>6.2f}s {result['p95']:>6.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Agreement between the local scorers and recorded LLM outputs.
+
+Reads the JSONL written when ``COMPONENT_RECORD_PATH`` is set (one line per
+LLM-scored component: ``component``, ``resume``, ``response`` and, for
+keyword_match, ``job_description``), re-scores each input locally and
+reports, per component:
+
+- mean absolute and signed point difference (local - LLM)
+- Pearson correlation of the points
+- share of records whose rating label matches
+- item agreement: Jaccard overlap of the flagged items (bullets with strong
+  verbs, quantified bullets, effective bullets, matched keywords)
+
+No data ships with the repo; record real analyses first, e.g.
+    COMPONENT_RECORD_PATH=recorded.jsonl uvicorn api.main:app
+
+Usage (from the Backend directory):
+    python -m benchmarks.rules_agreement recorded.jsonl [--show 3]
+"""
+import argparse
+import json
+import statistics
+import sys
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Set
+
+from app.resume_structure_analysis.resume_analysis_v4 import KEYWORD_SECTIONS
+from app.utils.keyword_engine import analyze_keyword_match_local
+from app.utils.quality_rules import RULE_SCORERS
+
+
+def _keyword_scorer(record: Dict[str, Any]) -> Dict[str, Any]:
+    resume = record["resume"]
+    if isinstance(resume, dict):
+        resume = {k: v for k, v in resume.items() if k in KEYWORD_SECTIONS}
+    return analyze_keyword_match_local(resume, record.get("job_description", ""))
+
+
+SCORERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "keyword_match": _keyword_scorer,
+    **{name: (lambda record, scorer=scorer: scorer(record["resume"])) for name, scorer in RULE_SCORERS.items()},
+}
+
+# Items each component flags, compared between local and LLM output
+ITEM_FIELDS = {
+    "keyword_match": ("strongMatches", "keyword"),
+    "action_words": ("strongActionVerbs", "bulletPoint"),
+    "measurable_results": ("measurableResults", "bulletPoint"),
+    "bullet_effectiveness": ("effectiveBullets", "bulletPoint"),
+}
+
+
+def _items(result: Dict[str, Any], component: str) -> Set[str]:
+    field, key = ITEM_FIELDS[component]
+    entries = (result.get("analysis") or {}).get(field) or []
+    return {str(entry.get(key, "")).strip().lower() for entry in entries if isinstance(entry, dict)}
+
+
+def _jaccard(a: Set[str], b: Set[str]) -> float:
+    return len(a & b) / len(a | b) if a | b else 1.0
+
+
+def _pearson(xs: List[float], ys: List[float]) -> float:
+    if len(xs) < 2 or statistics.pstdev(xs) == 0 or statistics.pstdev(ys) == 0:
+        return float("nan")
+    return statistics.correlation(xs, ys)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recorded", help="JSONL written via COMPONENT_RECORD_PATH")
+    parser.add_argument("--show", type=int, default=0, help="Print the N largest disagreements per component")
+    args = parser.parse_args()
+
+    rows = defaultdict(list)
+    with open(args.recorded, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            component = record.get("component")
+            if component not in SCORERS:
+                continue
+            try:
+                llm_points = float(record["response"]["score"]["pointsAwarded"])
+            except (KeyError, TypeError, ValueError):
+                print(f"line {line_number}: no usable LLM score, skipped", file=sys.stderr)
+                continue
+            local = SCORERS[component](record)
+            rows[component].append({
+                "line": line_number,
+                "llm": llm_points,
+                "local": float(local["score"]["pointsAwarded"]),
+                "rating_match": local["score"]["rating"] == record["response"]["score"].get("rating"),
+                "items": _jaccard(_items(local, component), _items(record["response"], component)),
+            })
+
+    if not rows:
+        sys.exit("No usable records for keyword_match, action_words, measurable_results or bullet_effectiveness")
+
+    print(f"{'component':<21} {'n':>4} {'MAE':>6} {'bias':>6} {'r':>6} {'rating':>7} {'items':>6}")
+    for component, data in rows.items():
+        diffs = [row["local"] - row["llm"] for row in data]
+        print(
+            f"{component:<21} {len(data):>4} "
+            f"{statistics.mean(abs(d) for d in diffs):>6.2f} {statistics.mean(diffs):>+6.2f} "
+            f"{_pearson([r['local'] for r in data], [r['llm'] for r in data]):>6.2f} "
+            f"{sum(r['rating_match'] for r in data) / len(data):>6.0%} "
+            f"{statistics.mean(r['items'] for r in data):>6.2f}"
+        )
+        for row in sorted(data, key=lambda r: abs(r["local"] - r["llm"]), reverse=True)[:args.show]:
+            print(f"    line {row['line']}: local {row['local']} vs LLM {row['llm']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Generate synthetic multi-page PDFs for benchmarks (no external dependencies)."""
+from typing import List
+
+_LINE = b"Page %d line %d: Built scalable Python services on AWS, reducing p95 latency by 30%%"
+
+
+def _build_pdf(page_lines: List[List[bytes]]) -> bytes:
+    """Build a minimal valid PDF with one page of Helvetica text per entry."""
+    objects: List[bytes] = []
+
+    def add(body: bytes) -> int:
+        objects.append(body)
+        return len(objects)
+
+    font_id = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    content_ids = []
+    for lines in page_lines:
+        text = b" ".join(b"(" + line + b") '" for line in lines)
+        stream = b"BT /F1 10 Tf 40 760 Td 14 TL " + text + b" ET"
+        content_ids.append(add(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream)))
+
+    pages = len(page_lines)
+    pages_id = len(objects) + pages + 1
+    page_ids = [
+        add(
+            b"<< /Type /Page /Parent %d 0 R /MediaBox [0 0 612 792] /Contents %d 0 R "
+            b"/Resources << /Font << /F1 %d 0 R >> >> >>" % (pages_id, content_id, font_id)
+        )
+        for content_id in content_ids
+    ]
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    add(b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, pages))
+    catalog_id = add(b"<< /Type /Catalog /Pages %d 0 R >>" % pages_id)
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1, catalog_id, xref_offset
+    )
+    return bytes(out)
+
+
+def make_pdf(pages: int, lines_per_page: int = 45) -> bytes:
+    """
+    Build a minimal valid PDF with ``pages`` pages of Helvetica text.
+
+    Args:
+        pages: Number of pages
+        lines_per_page: Text lines written on each page
+
+    Returns:
+        PDF file bytes
+    """
+    return _build_pdf([
+        [_LINE % (page + 1, line + 1) for line in range(lines_per_page)]
+        for page in range(pages)
+    ])
+
+
+def make_text_pdf(text: str, lines_per_page: int = 50) -> bytes:
+    """
+    Build a PDF whose text layer is ``text`` (Latin-1, one PDF line per line).
+
+    Args:
+        text: Document text
+        lines_per_page: Text lines written on each page
+
+    Returns:
+        PDF file bytes
+    """
+    lines = [
+        line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)").encode("latin-1", "replace")
+        for line in text.splitlines()
+    ]
+    return _build_pdf([lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]])
+
+
+def make_corpus(page_counts=(1, 2, 5, 20, 50, 100)) -> List[bytes]:
+    """Build one synthetic PDF per entry in ``page_counts``."""
+    return [make_pdf(pages) for pages in page_counts]
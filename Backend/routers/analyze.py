@@ -1,21 +1,39 @@
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Request
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+import contextlib
+import functools
+import hashlib
 import json
 import time
 import logging
+import asyncio
+import tempfile
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from pybreaker import CircuitBreakerError
 
 from pydantic import ValidationError
 
-from app.utils.text_extraction import extract_text_from_pdf
+from app.utils.pdf_pool import extract_pdf_text
+from app.utils.upload import ZIP_MAGIC, read_pdf_upload, read_upload, unpack_pdf_zip
 from app.utils.openai_extraction import extract_components_openai
 from app.resume_structure_analysis.resume_analysis_v4 import analyze_resume_v4
+from app.resume_structure_analysis.bulk_screening import ScreeningFile, screen_resumes_v4
+from app.resume_structure_analysis.job_ranking import BatchJob, rank_jobs_v4
+from app.utils.job_profile import JobProfile, get_job_profile
 from app.core.exceptions import (
     ResumeExtractionError,
     InvalidResumeContentError, 
     PDFValidationError,
+    PDFProcessingBusyError,
+    UploadTooLargeError,
+    DeadlineExceededError,
+    JobQueueFullError,
     OpenAIError
 )
 from app.core.config import settings
+from app.queue.job_manager import STATUS_DONE, STATUS_FAILED, JobManager
+from app.resilience.deadline import start_deadline
+from app.core.pipeline import StageGraph, current_stage_timings, server_timing_header, start_stage_timings
 from schemas.analyze import AnalyzeResponse, JobData, FilterJobDescriptionRequest, FilterJobDescriptionResponse
 from app.middleware.rate_limit import limiter
 from app.middleware.auth import verify_api_key
@@ -26,15 +44,241 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+async def _read_screening_files(uploads: List[UploadFile]) -> List[ScreeningFile]:
+    """
+    Read the uploaded resumes: PDFs and/or ZIP archives of PDFs.
+
+    Raises:
+        HTTPException: 400 for unsupported or unreadable files, 413 when a
+            size or count limit is exceeded
+    """
+    max_pdf_bytes = settings.max_pdf_size_mb * 1024 * 1024
+    max_total_bytes = settings.screening_max_upload_mb * 1024 * 1024
+    files: List[ScreeningFile] = []
+    # The count and size limits apply to the request as a whole: each file
+    # only gets what earlier files left, so several archives can't each
+    # inflate to the full limit
+    total_bytes = 0
+    try:
+        for upload in uploads:
+            name = sanitize_filename(upload.filename or "resume.pdf")
+            remaining_files = settings.screening_max_resumes - len(files)
+            remaining_bytes = max_total_bytes - total_bytes
+            if name.lower().endswith(".zip"):
+                content, _ = await read_upload(upload, remaining_bytes, magic=ZIP_MAGIC)
+                # Decompression is CPU-bound; keep it off the event loop
+                entries = await asyncio.to_thread(
+                    unpack_pdf_zip, content, remaining_files, max_pdf_bytes, remaining_bytes
+                )
+                for entry_name, entry in entries:
+                    total_bytes += len(entry)
+                    files.append(ScreeningFile(
+                        f"{name}/{sanitize_filename(entry_name)}", entry, hashlib.sha256(entry).hexdigest()
+                    ))
+            elif name.lower().endswith(".pdf"):
+                if remaining_files <= 0:
+                    raise UploadTooLargeError(f"Too many resumes (max {settings.screening_max_resumes})")
+                # Content is checked by the PDF parser; a bad file fails on its own
+                content, content_hash = await read_upload(upload, min(max_pdf_bytes, remaining_bytes))
+                total_bytes += len(content)
+                files.append(ScreeningFile(name, content, content_hash))
+            else:
+                raise HTTPException(status_code=400, detail=f"Unsupported file '{name}' (PDF or ZIP only)")
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except PDFValidationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not files:
+        raise HTTPException(status_code=400, detail="No PDF resumes found in the upload")
+    return files
+
+
 @router.get("/")
 async def root():
     return {"message": "Welcome to Resume Analysis API"}
 
+def _validate_job_data(
+    job_data_dict: Any,
+    field: str,
+    index: Optional[int] = None
+) -> Tuple[JobData, Callable[[], Awaitable[JobProfile]]]:
+    """
+    Validate one posting from the request.
+
+    Returns the posting, its description still as submitted, and a stage
+    function loading its ``JobProfile``, which holds the sanitized
+    description. Only cheap checks run here, so bad job data still fails
+    fast; callers run the loader as a graph stage alongside the resume
+    upload and parse. The profile is cached per posting URL + content hash,
+    so a repeat posting skips sanitization and preprocessing entirely.
+
+    Args:
+        job_data_dict: The posting as parsed from the request
+        field: Request field holding it, for error details
+        index: Its position if ``field`` is a list
+
+    Raises:
+        ValueError: If the job data is not an object or the description is too long
+        ValidationError: If the posting does not match ``JobData``
+    """
+    # The description is sanitized (with bleach) by the profile, only on a cache miss
+    job_data = JobData(**sanitize_job_data(job_data_dict, sanitize_description=False))
+
+    async def load_job_profile() -> JobProfile:
+        job_profile = await get_job_profile(job_data.description, job_data.url)
+        try:
+            # Stripping markup can leave a description too short to analyze
+            JobData(**{**job_data.model_dump(), "description": job_profile.description})
+        except ValidationError as e:
+            raise _job_data_error(e, field, index)
+        return job_profile
+
+    return job_data, load_job_profile
+
+
+def _job_data_error(e: Exception, field: str, index: Optional[int] = None) -> HTTPException:
+    """
+    The 400 response for a job data field that failed parsing or validation.
+
+    ``index`` is the position of the failing posting in a list field.
+    """
+    logger.error(f"Job data validation error: {str(e)}")
+    error_details = []
+    if isinstance(e, ValidationError):
+        error_details = e.errors()
+        if index is not None:
+            error_details = [dict(error, loc=(field, index, *error["loc"])) for error in error_details]
+    elif not isinstance(e, json.JSONDecodeError):
+        error_details = [{
+            "loc": [field] if index is None else [field, index],
+            "msg": str(e),
+            "type": "value_error"
+        }]
+    else:
+        error_details = [{
+            "loc": [field],
+            "msg": f"Invalid JSON in '{field}' field",
+            "type": "value_error.jsondecode"
+        }]
+    return HTTPException(
+        status_code=400,
+        detail={
+            "message": "Invalid job data format",
+            "errors": error_details
+        }
+    )
+
+
+def _job_context(job_data: JobData, job_profile: JobProfile) -> Dict[str, Any]:
+    return {
+        "title": job_data.jobTitle or "Job Position",
+        "company": job_data.company or "Company",
+        "description_length": len(job_profile.description)
+    }
+
+
+def _check_pdf_upload(resume: UploadFile):
+    if (resume.content_type != 'application/pdf') or (not resume.filename.lower().endswith('.pdf')):
+        raise HTTPException(status_code=400, detail="Only PDF files are allowed")
+
+
+async def _upload_stage(resume: UploadFile) -> Tuple[bytes, str]:
+    # Stream the upload: magic bytes are checked on the first chunk, reading
+    # stops as soon as the size cap is crossed, and the SHA-256 for the
+    # content-addressed text cache is computed on the way through
+    max_size = settings.max_pdf_size_mb * 1024 * 1024
+    try:
+        return await read_pdf_upload(resume, max_size)
+    except UploadTooLargeError:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large (max {settings.max_pdf_size_mb}MB)"
+        )
+    except PDFValidationError:
+        raise HTTPException(status_code=400, detail="Invalid PDF file content")
+
+
+async def _pdf_text_stage(upload: Tuple[bytes, str]) -> str:
+    # Extract text from PDF in the bounded process pool (cached by file hash)
+    resume_content, resume_sha256 = upload
+    try:
+        extracted_pdf = await extract_pdf_text(resume_content, resume_sha256)
+    except PDFValidationError as e:
+        logger.error(f"PDF validation error: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except PDFProcessingBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    resume_text = extracted_pdf["text"]
+    if not resume_text or len(resume_text.strip()) < 50:
+        raise HTTPException(
+            status_code=400,
+            detail="Resume content is too short or empty (minimum 50 characters)"
+        )
+    return resume_text
+
+
+async def _extraction_stage(pdf_text: str) -> Dict[str, Any]:
+    # Extract components using OpenAI
+    try:
+        return await extract_components_openai(pdf_text)
+    except InvalidResumeContentError as e:
+        logger.error(f"Invalid resume content: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except ResumeExtractionError as e:
+        logger.error(f"Resume extraction error: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail="Failed to process resume. Please try again."
+        )
+    except OpenAIError as e:
+        logger.error(f"OpenAI API error: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="AI service temporarily unavailable. Please try again later."
+        )
+    except DeadlineExceededError as e:
+        logger.error(f"Resume extraction ran out of time: {e}")
+        raise HTTPException(
+            status_code=504,
+            detail="Resume processing took too long. Please try again."
+        )
+
+
+def _add_resume_stages(graph: StageGraph, resume: UploadFile):
+    """Upload -> PDF text -> extraction, ending in the ``extraction`` stage."""
+    graph.add("upload", functools.partial(_upload_stage, resume))
+    graph.add("pdf_text", _pdf_text_stage, after=("upload",))
+    graph.add("extraction", _extraction_stage, after=("pdf_text",))
+
+
+async def _analysis_stage(extraction: Dict[str, Any], job_profile: JobProfile) -> Dict[str, Any]:
+    # Perform V4 analysis
+    try:
+        logger.info("Using V4 scoring system")
+        analysis = await analyze_resume_v4(
+            resume_data=extraction,
+            job_description=job_profile.description,
+            job_profile=job_profile
+        )
+
+        if not analysis or not isinstance(analysis, dict):
+            raise ValueError("Analysis returned invalid data")
+        return analysis
+
+    except Exception as e:
+        logger.error(f"Analysis error: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail="Unable to complete resume analysis. Please try again."
+        )
+
+
 @router.post("/api/analyze", response_model=AnalyzeResponse)
 @limiter.limit(f"{settings.rate_limit_per_minute}/minute")
 @limiter.limit(f"{settings.rate_limit_per_hour}/hour")
 async def job_analysis(
     request: Request,  # Required for rate limiting
+    response: Response,
     resume: UploadFile = File(...),
     jobData: str = Form(...),
     api_key: str = Depends(verify_api_key)  # API key authentication
@@ -42,110 +286,44 @@ async def job_analysis(
     logger.info("Received job analysis request (V4 scoring)")
     start_time = time.time()
 
+    # Budget shared by extraction, the V4 analyzers and LLM retries; the margin
+    # leaves time to return a partial analysis before the middleware's 504
+    start_deadline(settings.request_timeout - settings.deadline_safety_margin_seconds)
+    start_stage_timings()
+
     try:
         # Validate and parse job data
         try:
-            job_data_dict = json.loads(jobData)
-            # Sanitize job data before validation
-            job_data_dict = sanitize_job_data(job_data_dict)
-            validated_job_data = JobData(**job_data_dict)
-        except (json.JSONDecodeError, ValidationError) as e:
-            logger.error(f"Job data validation error: {str(e)}")
-            error_details = []
-            if isinstance(e, ValidationError):
-                error_details = e.errors()
-            else:
-                error_details = [{
-                    "loc": ["jobData"],
-                    "msg": "Invalid JSON in 'jobData' field",
-                    "type": "value_error.jsondecode"
-                }]
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "message": "Invalid job data format",
-                    "errors": error_details
-                }
-            )
+            validated_job_data, load_job_profile = _validate_job_data(json.loads(jobData), "jobData")
+        except (ValueError, ValidationError) as e:
+            raise _job_data_error(e, "jobData")
 
         # Validate PDF file
-        if (resume.content_type != 'application/pdf') or (not resume.filename.lower().endswith('.pdf')):
-            raise HTTPException(status_code=400, detail="Only PDF files are allowed")
+        _check_pdf_upload(resume)
 
-        resume_content = await resume.read()
-        
-        # Check file size
-        max_size = settings.max_pdf_size_mb * 1024 * 1024
-        if len(resume_content) > max_size:
-            raise HTTPException(
-                status_code=413,
-                detail=f"File too large (max {settings.max_pdf_size_mb}MB)"
-            )
-        
-        # Check PDF magic bytes
-        if not resume_content.startswith(b'%PDF-'):
-            raise HTTPException(status_code=400, detail="Invalid PDF file content")
-
-        # Extract text from PDF
-        try:
-            resume_text = extract_text_from_pdf(resume_content)
-            if not resume_text or len(resume_text.strip()) < 50:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Resume content is too short or empty (minimum 50 characters)"
-                )
-        except PDFValidationError as e:
-            logger.error(f"PDF validation error: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-
-        # Extract components using OpenAI
-        try:
-            components = await extract_components_openai(resume_text)
-        except InvalidResumeContentError as e:
-            logger.error(f"Invalid resume content: {e}")
-            raise HTTPException(status_code=400, detail=str(e))
-        except ResumeExtractionError as e:
-            logger.error(f"Resume extraction error: {e}")
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to process resume. Please try again."
-            )
-        except OpenAIError as e:
-            logger.error(f"OpenAI API error: {e}")
-            raise HTTPException(
-                status_code=503,
-                detail="AI service temporarily unavailable. Please try again later."
-            )
+        # The request runs as a stage graph: job-description preprocessing starts
+        # at t=0 alongside the upload and PDF parse, and the analysis starts as
+        # soon as both the extracted resume and the job profile are ready
+        graph = StageGraph("analyze")
+        graph.add("job_profile", load_job_profile)
+        _add_resume_stages(graph, resume)
 
-        # Perform V4 analysis
+        graph.add("analysis", _analysis_stage, after=("extraction", "job_profile"))
         try:
-            logger.info("Using V4 scoring system")
-            analysis = await analyze_resume_v4(
-                resume_data=components,
-                job_description=validated_job_data.description
-            )
-            
-            if not analysis or not isinstance(analysis, dict):
-                raise ValueError("Analysis returned invalid data")
-                
-        except Exception as e:
-            logger.error(f"Analysis error: {e}", exc_info=True)
-            raise HTTPException(
-                status_code=500,
-                detail="Unable to complete resume analysis. Please try again."
-            )
+            results = await graph.run()
+        finally:
+            # Per-stage timings (this graph and the V4 analyzers) for checking the critical path
+            response.headers["Server-Timing"] = server_timing_header(current_stage_timings())
 
+        analysis = results["analysis"]
+        job_context = _job_context(validated_job_data, results["job_profile"])
         process_time = time.time() - start_time
         logger.info(f"Successful resume analysis completed in {process_time:.2f} seconds")
 
         # Save response to output.json for inspection as requested by user
         try:
             response_to_save = {
-                "job_context": {
-                    "title": validated_job_data.jobTitle or "Job Position",
-                    "company": validated_job_data.company or "Company",
-                    "description_length": len(validated_job_data.description)
-                },
+                "job_context": job_context,
                 "analysis": analysis,
                 "process_time_seconds": round(process_time, 2)
             }
@@ -156,11 +334,7 @@ async def job_analysis(
             logger.warning(f"Failed to write output.json: {e}")
 
         return {
-            "job_context": {
-                "title": validated_job_data.jobTitle or "Job Position",
-                "company": validated_job_data.company or "Company",
-                "description_length": len(validated_job_data.description)
-            },
+            "job_context": job_context,
             "analysis": analysis,
             "process_time_seconds": round(process_time, 2)
         }
@@ -178,6 +352,312 @@ async def job_analysis(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.post("/api/analyze/batch")
+@limiter.limit(f"{settings.batch_rate_limit_per_hour}/hour")
+async def batch_job_analysis(
+    request: Request,  # Required for rate limiting
+    resume: UploadFile = File(...),
+    jobs: str = Form(...),
+    api_key: str = Depends(verify_api_key)  # API key authentication
+):
+    """
+    Analyze one resume against a list of jobs, streaming ranked results.
+
+    The resume is parsed and extracted once and its resume-quality analysis
+    is shared by every job (see ``job_ranking``). The response is NDJSON: a
+    ``job`` event per posting as it finishes, with its Job Fit score and rank
+    among the finished ones, then a final ``ranking`` event.
+
+    Args:
+        resume: Resume PDF
+        jobs: JSON list of job data objects (same shape as ``jobData``)
+
+    Raises:
+        HTTPException: For invalid job data, upload or extraction errors,
+            before any results are streamed
+    """
+    logger.info("Received batch job analysis request (V4 scoring)")
+
+    # One budget for the whole batch; jobs still waiting for the LLM when it
+    # runs out return partial analyses
+    start_deadline(settings.batch_request_timeout - settings.deadline_safety_margin_seconds)
+    start_stage_timings()
+
+    try:
+        try:
+            job_list = json.loads(jobs)
+        except ValueError as e:
+            raise _job_data_error(e, "jobs")
+        if not isinstance(job_list, list) or not job_list:
+            raise HTTPException(status_code=400, detail="'jobs' must be a non-empty JSON list of job data")
+        if len(job_list) > settings.batch_max_jobs:
+            raise HTTPException(status_code=400, detail=f"Too many jobs (max {settings.batch_max_jobs})")
+
+        postings = []
+        for index, job_data_dict in enumerate(job_list):
+            try:
+                postings.append(_validate_job_data(job_data_dict, "jobs", index))
+            except (ValueError, ValidationError) as e:
+                raise _job_data_error(e, "jobs", index)
+
+        _check_pdf_upload(resume)
+
+        async def job_profiles_stage():
+            return await asyncio.gather(*(load_job_profile() for _, load_job_profile in postings))
+
+        # Failures up to extraction are ordinary HTTP errors; only the per-job
+        # analyses are streamed. The job profiles load alongside the resume.
+        graph = StageGraph("analyze_batch")
+        graph.add("job_profiles", job_profiles_stage)
+        _add_resume_stages(graph, resume)
+        results = await graph.run()
+        resume_data = results["extraction"]
+        batch = [
+            BatchJob(_job_context(job_data, job_profile), job_profile)
+            for (job_data, _), job_profile in zip(postings, results["job_profiles"])
+        ]
+        logger.info(f"Ranking {len(batch)} jobs")
+
+        async def ndjson_events():
+            async with contextlib.aclosing(rank_jobs_v4(resume_data, batch)) as events:
+                async for event in events:
+                    yield json.dumps(event) + "\n"
+
+        return StreamingResponse(
+            ndjson_events(),
+            media_type="application/x-ndjson",
+            headers={"Server-Timing": server_timing_header(current_stage_timings())}
+        )
+
+    except HTTPException:
+        raise
+    except CircuitBreakerError:
+        logger.error("Circuit breaker is open - OpenAI API is unavailable")
+        raise HTTPException(
+            status_code=503,
+            detail="AI service temporarily unavailable. Please try again in a minute."
+        )
+    except Exception as e:
+        logger.error(f"Unexpected error in batch analysis: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post("/api/screen")
+@limiter.limit(f"{settings.screening_rate_limit_per_hour}/hour")
+async def bulk_screening(
+    request: Request,  # Required for rate limiting
+    resumes: List[UploadFile] = File(...),
+    jobData: str = Form(...),
+    api_key: str = Depends(verify_api_key)  # API key authentication
+):
+    """
+    Screen many resumes against one job, streaming progress as NDJSON.
+
+    Resumes are uploaded as several ``resumes`` files, each a PDF or a ZIP
+    of PDFs. Identical files are analyzed once. Events are described in
+    ``screen_resumes_v4``; a resume that fails to parse or extract is
+    reported with an ``error`` event and the others carry on.
+
+    Raises:
+        HTTPException: For invalid job data or uploads, before any results
+            are streamed
+    """
+    logger.info("Received bulk screening request (V4 scoring)")
+
+    start_deadline(settings.screening_request_timeout - settings.deadline_safety_margin_seconds)
+
+    try:
+        try:
+            validated_job_data, load_job_profile = _validate_job_data(json.loads(jobData), "jobData")
+        except (ValueError, ValidationError) as e:
+            raise _job_data_error(e, "jobData")
+
+        # The job profile loads while the uploads are read and unpacked
+        graph = StageGraph("screen")
+        graph.add("job_profile", load_job_profile)
+        graph.add("files", functools.partial(_read_screening_files, resumes))
+        inputs = await graph.run()
+        files, job_profile = inputs["files"], inputs["job_profile"]
+        logger.info(f"Screening {len(files)} resumes for '{validated_job_data.jobTitle or 'Job Position'}'")
+
+        async def ndjson_events():
+            yield json.dumps({"event": "job", "job_context": _job_context(validated_job_data, job_profile)}) + "\n"
+            async with contextlib.aclosing(screen_resumes_v4(files, job_profile)) as events:
+                async for event in events:
+                    yield json.dumps(event) + "\n"
+
+        return StreamingResponse(ndjson_events(), media_type="application/x-ndjson")
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error in bulk screening: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+# Queued uploads larger than this wait on disk rather than in memory
+JOB_UPLOAD_SPOOL_BYTES = 1024 * 1024
+
+
+def _spool_upload(content: bytes) -> tempfile.SpooledTemporaryFile:
+    spooled = tempfile.SpooledTemporaryFile(max_size=JOB_UPLOAD_SPOOL_BYTES)
+    spooled.write(content)
+    return spooled
+
+
+def _read_spooled_upload(spooled: tempfile.SpooledTemporaryFile) -> bytes:
+    with spooled:
+        spooled.seek(0)
+        return spooled.read()
+
+
+async def _spooled_upload_stage(spooled: tempfile.SpooledTemporaryFile, sha256: str) -> Tuple[bytes, str]:
+    return await asyncio.to_thread(_read_spooled_upload, spooled), sha256
+
+
+async def _run_analysis_job(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The ``/api/analyze`` pipeline for a queued job, from the uploaded PDF
+    (read and validated at submission, then spooled) to the response body.
+    """
+    start_time = time.time()
+    graph = StageGraph("analysis_job")
+    graph.add("job_profile", payload["load_job_profile"])
+    graph.add("upload", functools.partial(_spooled_upload_stage, *payload["upload"]))
+    graph.add("pdf_text", _pdf_text_stage, after=("upload",))
+    graph.add("extraction", _extraction_stage, after=("pdf_text",))
+    graph.add("analysis", _analysis_stage, after=("extraction", "job_profile"))
+    try:
+        results = await graph.run()
+    except CircuitBreakerError:
+        logger.error("Circuit breaker is open - OpenAI API is unavailable")
+        raise HTTPException(
+            status_code=503,
+            detail="AI service temporarily unavailable. Please try again in a minute."
+        )
+    return {
+        "job_context": _job_context(payload["job_data"], results["job_profile"]),
+        "analysis": results["analysis"],
+        "process_time_seconds": round(time.time() - start_time, 2)
+    }
+
+
+# Started and stopped with the app (see api.main)
+analysis_jobs = JobManager(
+    "analysis",
+    _run_analysis_job,
+    workers=settings.job_queue_workers,
+    max_depth=settings.job_queue_max_depth,
+    timeout=settings.job_timeout_seconds,
+    result_ttl=settings.job_result_ttl_seconds
+)
+
+
+def _job_urls(job_id: str) -> Dict[str, str]:
+    return {"status_url": f"/api/jobs/{job_id}", "result_url": f"/api/jobs/{job_id}/result"}
+
+
+async def _get_job(job_id: str) -> Dict[str, Any]:
+    job = await analysis_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return job
+
+
+@router.post("/api/jobs/analyze", status_code=202)
+@limiter.limit(f"{settings.rate_limit_per_minute}/minute")
+@limiter.limit(f"{settings.rate_limit_per_hour}/hour")
+async def submit_analysis_job(
+    request: Request,  # Required for rate limiting
+    response: Response,
+    resume: UploadFile = File(...),
+    jobData: str = Form(...),
+    api_key: str = Depends(verify_api_key)  # API key authentication
+):
+    """
+    Queue a resume analysis and return its job id at once.
+
+    Same inputs and result as ``/api/analyze``. The job data and the upload
+    are validated here, so those errors come back immediately; the rest runs
+    on the job queue's workers. Poll ``status_url`` and fetch ``result_url``
+    once the status is ``done`` or ``failed`` (results stay available for
+    ``JOB_RESULT_TTL_SECONDS``).
+
+    Raises:
+        HTTPException: 400/413 for invalid job data or uploads, 429 with
+            ``Retry-After`` when the queue is full
+    """
+    try:
+        validated_job_data, load_job_profile = _validate_job_data(json.loads(jobData), "jobData")
+    except (ValueError, ValidationError) as e:
+        raise _job_data_error(e, "jobData")
+
+    _check_pdf_upload(resume)
+    content, sha256 = await _upload_stage(resume)
+    # Up to JOB_QUEUE_MAX_DEPTH uploads may wait; keep the large ones on disk
+    # (a dropped job's file is deleted when its payload is collected)
+    spooled = await asyncio.to_thread(_spool_upload, content)
+
+    try:
+        job = await analysis_jobs.submit({
+            "upload": (spooled, sha256),
+            "job_data": validated_job_data,
+            "load_job_profile": load_job_profile,
+        })
+    except JobQueueFullError as e:
+        spooled.close()
+        logger.warning(str(e))
+        raise HTTPException(
+            status_code=429,
+            detail="Analysis queue is full. Please try again later.",
+            headers={"Retry-After": str(e.retry_after)}
+        )
+
+    logger.info(f"Queued analysis job {job['job_id']}")
+    urls = _job_urls(job["job_id"])
+    response.headers["Location"] = urls["status_url"]
+    return {**job, **urls}
+
+
+@router.get("/api/jobs/{job_id}")
+@limiter.limit("120/minute")
+async def get_analysis_job(
+    request: Request,  # Required for rate limiting
+    job_id: str,
+    api_key: str = Depends(verify_api_key)  # API key authentication
+):
+    """A job's status and timestamps (without the result)."""
+    job = await _get_job(job_id)
+    status = {field: value for field, value in job.items() if field != "result"}
+    return {**status, **_job_urls(job_id)}
+
+
+@router.get("/api/jobs/{job_id}/result")
+@limiter.limit("120/minute")
+async def get_analysis_job_result(
+    request: Request,  # Required for rate limiting
+    job_id: str,
+    api_key: str = Depends(verify_api_key)  # API key authentication
+):
+    """
+    A finished job's result: the ``/api/analyze`` response body if it
+    succeeded, otherwise the status code and detail ``/api/analyze`` would
+    have returned. A job still queued or running gets 202 with its status
+    and a ``Retry-After`` hint.
+    """
+    job = await _get_job(job_id)
+    if job["status"] == STATUS_DONE:
+        return job["result"]
+    if job["status"] == STATUS_FAILED:
+        error = job["error"]
+        raise HTTPException(status_code=error["status_code"], detail=error["detail"])
+    return JSONResponse(
+        status_code=202,
+        content={**job, **_job_urls(job_id)},
+        headers={"Retry-After": str(analysis_jobs.retry_after())}
+    )
+
+
 @router.post("/api/filter-job-description", response_model=FilterJobDescriptionResponse)
 @limiter.limit("20/minute")  # 20 requests per minute per IP
 async def filter_job_description(request: Request, request_data: FilterJobDescriptionRequest):